@@ -12,7 +12,7 @@ from app.db.base import Base
 
 # Import all models here to ensure they are registered with SQLAlchemy
 from app.models import (
-    Policy, Role, Permission
+    Policy, Role, Permission, WildcardPermission, RoleParent, RoleClosure, SeedState
 )
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
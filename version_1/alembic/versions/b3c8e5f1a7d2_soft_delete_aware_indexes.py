@@ -0,0 +1,64 @@
+"""soft delete aware indexes
+
+Revision ID: b3c8e5f1a7d2
+Revises: d7f3a9e2b614
+Create Date: 2026-10-18 12:20:14.538127
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3c8e5f1a7d2'
+down_revision: Union[str, None] = 'd7f3a9e2b614'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Primary keys are already indexed
+    op.drop_index('ix_roles_id', table_name='roles')
+    op.drop_index('ix_policies_id', table_name='policies')
+    op.drop_index('ix_permissions_id', table_name='permissions')
+    # Leading column of _role_policy_unq
+    op.drop_index('ix_permissions_role_id', table_name='permissions')
+    op.drop_index('ix_wildcard_permissions_category_action', table_name='wildcard_permissions')
+
+    op.create_index(
+        'ix_roles_live_role', 'roles', ['role'], unique=False,
+        postgresql_where=sa.text('deleted IS NULL'),
+        sqlite_where=sa.text('deleted IS NULL'),
+        postgresql_include=['id'],
+    )
+    op.create_index(
+        'ix_policies_live_category_action', 'policies', ['category', 'action'], unique=False,
+        postgresql_where=sa.text('deleted IS NULL'),
+        sqlite_where=sa.text('deleted IS NULL'),
+        postgresql_include=['id'],
+    )
+    op.create_index(
+        'ix_permissions_live_role_policy', 'permissions', ['role_id', 'policy_id'], unique=False,
+        postgresql_where=sa.text('deleted IS NULL'),
+        sqlite_where=sa.text('deleted IS NULL'),
+    )
+    op.create_index(
+        'ix_wildcard_permissions_live_category_action', 'wildcard_permissions', ['category', 'action'], unique=False,
+        postgresql_where=sa.text('deleted IS NULL'),
+        sqlite_where=sa.text('deleted IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_wildcard_permissions_live_category_action', table_name='wildcard_permissions')
+    op.drop_index('ix_permissions_live_role_policy', table_name='permissions')
+    op.drop_index('ix_policies_live_category_action', table_name='policies')
+    op.drop_index('ix_roles_live_role', table_name='roles')
+
+    op.create_index('ix_wildcard_permissions_category_action', 'wildcard_permissions', ['category', 'action'], unique=False)
+    op.create_index(op.f('ix_permissions_role_id'), 'permissions', ['role_id'], unique=False)
+    op.create_index(op.f('ix_permissions_id'), 'permissions', ['id'], unique=False)
+    op.create_index(op.f('ix_policies_id'), 'policies', ['id'], unique=False)
+    op.create_index(op.f('ix_roles_id'), 'roles', ['id'], unique=False)
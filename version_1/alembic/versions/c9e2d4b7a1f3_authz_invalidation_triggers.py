@@ -0,0 +1,106 @@
+"""authz invalidation triggers
+
+Revision ID: c9e2d4b7a1f3
+Revises: b3c8e5f1a7d2
+Create Date: 2026-10-18 13:41:09.215733
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c9e2d4b7a1f3'
+down_revision: Union[str, None] = 'b3c8e5f1a7d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# table -> (column holding role ids, column holding policy ids)
+WATCHED_TABLES = {
+    'roles': ('id', None),
+    'policies': (None, 'id'),
+    'permissions': ('role_id', 'policy_id'),
+    'wildcard_permissions': ('role_id', None),
+    'role_parents': (None, None),
+    'role_closure': (None, None),
+}
+
+# Statement-level triggers send one notification per statement, however many
+# rows it touched. Ids are dropped when the payload would exceed the
+# 8000 byte NOTIFY limit, which subscribers treat as "anything changed".
+NOTIFY_FUNCTION = """
+CREATE OR REPLACE FUNCTION authz_notify_change() RETURNS trigger
+LANGUAGE plpgsql AS $$
+DECLARE
+    role_column text := TG_ARGV[0];
+    policy_column text := TG_ARGV[1];
+    role_ids jsonb := '[]';
+    policy_ids jsonb := '[]';
+    ids jsonb;
+    payload text;
+BEGIN
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        IF role_column <> '' THEN
+            SELECT coalesce(jsonb_agg(DISTINCT to_jsonb(r) ->> role_column), '[]') INTO ids FROM new_rows r;
+            role_ids := role_ids || ids;
+        END IF;
+        IF policy_column <> '' THEN
+            SELECT coalesce(jsonb_agg(DISTINCT to_jsonb(r) ->> policy_column), '[]') INTO ids FROM new_rows r;
+            policy_ids := policy_ids || ids;
+        END IF;
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        IF role_column <> '' THEN
+            SELECT coalesce(jsonb_agg(DISTINCT to_jsonb(r) ->> role_column), '[]') INTO ids FROM old_rows r;
+            role_ids := role_ids || ids;
+        END IF;
+        IF policy_column <> '' THEN
+            SELECT coalesce(jsonb_agg(DISTINCT to_jsonb(r) ->> policy_column), '[]') INTO ids FROM old_rows r;
+            policy_ids := policy_ids || ids;
+        END IF;
+    END IF;
+
+    payload := jsonb_build_object(
+        'table', TG_TABLE_NAME, 'op', lower(TG_OP), 'role_ids', role_ids, 'policy_ids', policy_ids
+    )::text;
+    IF octet_length(payload) > 7900 THEN
+        payload := jsonb_build_object('table', TG_TABLE_NAME, 'op', lower(TG_OP))::text;
+    END IF;
+
+    PERFORM pg_notify('authz_invalidation', payload);
+    RETURN NULL;
+END;
+$$;
+"""
+
+TRANSITION_TABLES = {
+    'INSERT': 'REFERENCING NEW TABLE AS new_rows',
+    'UPDATE': 'REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows',
+    'DELETE': 'REFERENCING OLD TABLE AS old_rows',
+}
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute(NOTIFY_FUNCTION)
+    for table, (role_column, policy_column) in WATCHED_TABLES.items():
+        for operation, referencing in TRANSITION_TABLES.items():
+            op.execute(
+                f"CREATE TRIGGER authz_notify_{operation.lower()} AFTER {operation} ON {table} "
+                f"{referencing} FOR EACH STATEMENT "
+                f"EXECUTE FUNCTION authz_notify_change('{role_column or ''}', '{policy_column or ''}')"
+            )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for table in WATCHED_TABLES:
+        for operation in TRANSITION_TABLES:
+            op.execute(f"DROP TRIGGER IF EXISTS authz_notify_{operation.lower()} ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS authz_notify_change()")
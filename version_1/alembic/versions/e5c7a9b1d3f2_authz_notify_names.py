@@ -0,0 +1,149 @@
+"""authz notify names
+
+Revision ID: e5c7a9b1d3f2
+Revises: a8d4f2c6e1b9
+Create Date: 2026-10-18 18:12:44.530917
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5c7a9b1d3f2'
+down_revision: Union[str, None] = 'a8d4f2c6e1b9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Same trigger arguments as c9e2d4b7a1f3, but the payload carries what
+# subscribers evict: role names (with every role inheriting from them) and
+# policy [category, action] pairs, so they no longer query the database per
+# event. Ids that do not resolve, e.g. of hard-deleted rows, or a payload
+# above the 8000 byte NOTIFY limit send a global event instead.
+NOTIFY_FUNCTION = """
+CREATE OR REPLACE FUNCTION authz_notify_change() RETURNS trigger
+LANGUAGE plpgsql AS $$
+DECLARE
+    role_column text := TG_ARGV[0];
+    policy_column text := TG_ARGV[1];
+    role_ids jsonb := '[]';
+    policy_ids jsonb := '[]';
+    ids jsonb;
+    role_names jsonb;
+    policy_keys jsonb;
+    payload text;
+BEGIN
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        IF role_column <> '' THEN
+            SELECT coalesce(jsonb_agg(DISTINCT to_jsonb(r) ->> role_column), '[]') INTO ids FROM new_rows r;
+            role_ids := role_ids || ids;
+        END IF;
+        IF policy_column <> '' THEN
+            SELECT coalesce(jsonb_agg(DISTINCT to_jsonb(r) ->> policy_column), '[]') INTO ids FROM new_rows r;
+            policy_ids := policy_ids || ids;
+        END IF;
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        IF role_column <> '' THEN
+            SELECT coalesce(jsonb_agg(DISTINCT to_jsonb(r) ->> role_column), '[]') INTO ids FROM old_rows r;
+            role_ids := role_ids || ids;
+        END IF;
+        IF policy_column <> '' THEN
+            SELECT coalesce(jsonb_agg(DISTINCT to_jsonb(r) ->> policy_column), '[]') INTO ids FROM old_rows r;
+            policy_ids := policy_ids || ids;
+        END IF;
+    END IF;
+
+    SELECT coalesce(jsonb_agg(DISTINCT ro.role), '[]') INTO role_names
+    FROM roles ro
+    WHERE ro.id IN (SELECT value::uuid FROM jsonb_array_elements_text(role_ids))
+       OR ro.id IN (
+           SELECT rc.descendant_id FROM role_closure rc
+           WHERE rc.ancestor_id IN (SELECT value::uuid FROM jsonb_array_elements_text(role_ids))
+       );
+    SELECT coalesce(jsonb_agg(DISTINCT jsonb_build_array(p.category, p.action)), '[]') INTO policy_keys
+    FROM policies p
+    WHERE p.id IN (SELECT value::uuid FROM jsonb_array_elements_text(policy_ids));
+
+    IF (SELECT count(*) FROM roles WHERE id IN (SELECT value::uuid FROM jsonb_array_elements_text(role_ids)))
+           <> (SELECT count(DISTINCT value) FROM jsonb_array_elements_text(role_ids))
+       OR jsonb_array_length(policy_keys) < (SELECT count(DISTINCT value) FROM jsonb_array_elements_text(policy_ids))
+    THEN
+        role_names := '[]';
+        policy_keys := '[]';
+    END IF;
+
+    payload := jsonb_build_object(
+        'table', TG_TABLE_NAME, 'op', lower(TG_OP), 'roles', role_names, 'policies', policy_keys
+    )::text;
+    IF octet_length(payload) > 7900 THEN
+        payload := jsonb_build_object('table', TG_TABLE_NAME, 'op', lower(TG_OP))::text;
+    END IF;
+
+    PERFORM pg_notify('authz_invalidation', payload);
+    RETURN NULL;
+END;
+$$;
+"""
+
+# authz_notify_change() as created by c9e2d4b7a1f3
+ID_NOTIFY_FUNCTION = """
+CREATE OR REPLACE FUNCTION authz_notify_change() RETURNS trigger
+LANGUAGE plpgsql AS $$
+DECLARE
+    role_column text := TG_ARGV[0];
+    policy_column text := TG_ARGV[1];
+    role_ids jsonb := '[]';
+    policy_ids jsonb := '[]';
+    ids jsonb;
+    payload text;
+BEGIN
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        IF role_column <> '' THEN
+            SELECT coalesce(jsonb_agg(DISTINCT to_jsonb(r) ->> role_column), '[]') INTO ids FROM new_rows r;
+            role_ids := role_ids || ids;
+        END IF;
+        IF policy_column <> '' THEN
+            SELECT coalesce(jsonb_agg(DISTINCT to_jsonb(r) ->> policy_column), '[]') INTO ids FROM new_rows r;
+            policy_ids := policy_ids || ids;
+        END IF;
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        IF role_column <> '' THEN
+            SELECT coalesce(jsonb_agg(DISTINCT to_jsonb(r) ->> role_column), '[]') INTO ids FROM old_rows r;
+            role_ids := role_ids || ids;
+        END IF;
+        IF policy_column <> '' THEN
+            SELECT coalesce(jsonb_agg(DISTINCT to_jsonb(r) ->> policy_column), '[]') INTO ids FROM old_rows r;
+            policy_ids := policy_ids || ids;
+        END IF;
+    END IF;
+
+    payload := jsonb_build_object(
+        'table', TG_TABLE_NAME, 'op', lower(TG_OP), 'role_ids', role_ids, 'policy_ids', policy_ids
+    )::text;
+    IF octet_length(payload) > 7900 THEN
+        payload := jsonb_build_object('table', TG_TABLE_NAME, 'op', lower(TG_OP))::text;
+    END IF;
+
+    PERFORM pg_notify('authz_invalidation', payload);
+    RETURN NULL;
+END;
+$$;
+"""
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute(NOTIFY_FUNCTION)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute(ID_NOTIFY_FUNCTION)
@@ -0,0 +1,58 @@
+"""uuidv7 pk defaults
+
+Revision ID: f1a6c3e8b2d4
+Revises: c9e2d4b7a1f3
+Create Date: 2026-10-18 15:02:36.804219
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1a6c3e8b2d4'
+down_revision: Union[str, None] = 'c9e2d4b7a1f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ('policies', 'roles', 'permissions', 'wildcard_permissions', 'role_parents')
+
+# Server-side counterpart of app.db.ids.uuid7 for rows inserted outside the
+# application. The ten random bytes come from gen_random_uuid() (core since
+# PostgreSQL 13), so pgcrypto is not needed.
+UUID7_FUNCTION = """
+CREATE OR REPLACE FUNCTION uuid_generate_v7() RETURNS uuid
+LANGUAGE plpgsql VOLATILE AS $$
+DECLARE
+    value bytea;
+BEGIN
+    value := substring(int8send((extract(epoch FROM clock_timestamp()) * 1000)::bigint) FROM 3)
+        || substring(uuid_send(gen_random_uuid()) FROM 7);
+    value := set_byte(value, 6, (get_byte(value, 6) & 15) | 112);
+    value := set_byte(value, 8, (get_byte(value, 8) & 63) | 128);
+    RETURN encode(value, 'hex')::uuid;
+END;
+$$;
+"""
+
+
+def upgrade() -> None:
+    # The application generates uuid7 ids client-side (see app.db.ids); this
+    # makes raw SQL inserts time-ordered as well. Existing uuid4 keys stay.
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute(UUID7_FUNCTION)
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=sa.text('uuid_generate_v7()'))
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=None)
+    op.execute("DROP FUNCTION IF EXISTS uuid_generate_v7()")
@@ -0,0 +1,19 @@
+from .engine import CompiledMatrix, PermissionEngine, load_matrix, load_matrix_async, permission_engine
+from .cache import DecisionCache, CachedPermissionChecker, install_invalidation, decision_cache
+from .hierarchy import add_parent, remove_parent, rebuild_closure, soft_delete_role, restore_role
+from .queries import (
+    AncestorRole, pattern_matches_policy,
+    has_permission, check_many, category_actions, role_policies,
+    has_permission_async, check_many_async, category_actions_async, role_policies_async,
+)
+from .views import PolicyView, RoleView, role_views, role_views_async
+
+__all__ = [
+    "CompiledMatrix", "PermissionEngine", "load_matrix", "load_matrix_async", "permission_engine",
+    "DecisionCache", "CachedPermissionChecker", "install_invalidation", "decision_cache",
+    "add_parent", "remove_parent", "rebuild_closure", "soft_delete_role", "restore_role",
+    "AncestorRole", "pattern_matches_policy",
+    "has_permission", "check_many", "category_actions", "role_policies",
+    "has_permission_async", "check_many_async", "category_actions_async", "role_policies_async",
+    "PolicyView", "RoleView", "role_views", "role_views_async",
+]
@@ -0,0 +1,542 @@
+"""Invalidation bus for permission changes.
+
+Whenever permission data changes an InvalidationEvent is published naming
+the table, the affected roles (with every role inheriting from them) and the
+affected policies as (category, action) pairs. Names are resolved by the
+publisher, so subscribers in every process evict just what changed without
+querying the database. An event without names stands for "anything may have
+changed".
+
+Backends:
+
+    local     in-process only; publish() calls subscribers directly
+    unix      every subscriber on the host binds a datagram socket in a shared
+              directory and publish() sends to each of them
+    postgres  LISTEN/NOTIFY; the triggers added in migration c9e2d4b7a1f3
+              (payload names since e5c7a9b1d3f2) notify on every statement
+              changing the permission tables, so writes from any client are seen
+
+Usage:
+    python -m app.authz.bus listen --backend postgres
+    python -m app.authz.bus publish --backend unix --table permissions --role ADMIN --policy USER:READ
+"""
+
+import argparse
+import json
+import logging
+import os
+import select
+import socket
+import threading
+import uuid
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Set, Tuple
+
+from sqlalchemy import event, select as sql_select, text
+from sqlalchemy.orm import Session
+
+from app.authz.cache import WATCHED_MODELS, DecisionCache, watched_table
+from app.authz.engine import PolicyKey
+from app.models import Policy, Role, Permission, RoleClosure, WildcardPermission
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHANNEL = "authz_invalidation"
+
+# Datagrams above this size are replaced by an event without names
+MAX_DATAGRAM = 65000
+
+
+class InvalidationEvent(NamedTuple):
+    """A change to permission data."""
+
+    table: str
+    operation: str
+    # Affected role names, including every role inheriting from them
+    roles: Tuple[str, ...] = ()
+    # Affected policies as (category, action)
+    policies: Tuple[PolicyKey, ...] = ()
+
+    @property
+    def is_global(self) -> bool:
+        """Return True if the event does not say which rows changed."""
+        return not (self.roles or self.policies)
+
+    def to_json(self) -> str:
+        return json.dumps({
+            "table": self.table,
+            "op": self.operation,
+            "roles": list(self.roles),
+            "policies": [list(key) for key in self.policies],
+        })
+
+    @classmethod
+    def from_json(cls, payload) -> "InvalidationEvent":
+        data = json.loads(payload)
+        try:
+            policies = tuple((category, action) for category, action in data.get("policies") or ())
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Invalid policies in invalidation event: {e}") from e
+        return cls(
+            data.get("table", ""),
+            data.get("op", ""),
+            tuple(str(role) for role in data.get("roles") or ()),
+            policies,
+        )
+
+    def without_names(self) -> "InvalidationEvent":
+        """Return the same change as a global event."""
+        return InvalidationEvent(self.table, self.operation)
+
+
+Subscriber = Callable[[InvalidationEvent], None]
+
+
+class InvalidationBus(ABC):
+    """Abstract base class for invalidation bus backends."""
+
+    name = None
+
+    def __init__(self):
+        self._subscribers: List[Subscriber] = []
+        self._lock = threading.Lock()
+
+    @abstractmethod
+    def subscribe(self, callback: Subscriber) -> None:
+        """Register a callback receiving every event, starting to receive if needed."""
+        pass
+
+    def unsubscribe(self, callback: Subscriber) -> None:
+        """Remove a callback registered with subscribe()."""
+        with self._lock:
+            self._subscribers.remove(callback)
+
+    @abstractmethod
+    def publish(self, event: InvalidationEvent) -> None:
+        """Send an event to every subscriber of the bus."""
+        pass
+
+    def start(self) -> None:
+        """Start receiving events from other processes."""
+
+    def close(self) -> None:
+        """Stop receiving events and release resources."""
+
+    def _add_subscriber(self, callback: Subscriber) -> None:
+        with self._lock:
+            self._subscribers.append(callback)
+
+    def _dispatch(self, event: InvalidationEvent) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for callback in subscribers:
+            try:
+                callback(event)
+            except Exception:
+                logger.exception(f"Invalidation subscriber {callback!r} failed")
+
+
+class LocalBus(InvalidationBus):
+    """Delivers events to subscribers of this process only."""
+
+    name = "local"
+
+    def subscribe(self, callback: Subscriber) -> None:
+        self._add_subscriber(callback)
+
+    def publish(self, event: InvalidationEvent) -> None:
+        self._dispatch(event)
+
+
+class UnixSocketBus(InvalidationBus):
+    """Delivers events to every process on the host through Unix datagram sockets.
+
+    Each started bus binds ``<directory>/<pid>-<id>.sock``; publishing sends
+    the event to every socket in the directory and removes sockets whose
+    process is gone.
+    """
+
+    name = "unix"
+
+    def __init__(self, directory: Optional[str] = None):
+        """
+        Initialize the bus.
+
+        Args:
+            directory: Directory shared by all processes. Defaults to
+                settings.AUTHZ_BUS_SOCKET_DIR.
+        """
+        super().__init__()
+        if directory is None:
+            from app.core.config import settings
+            directory = settings.AUTHZ_BUS_SOCKET_DIR
+
+        self.directory = Path(directory)
+        self.path: Optional[Path] = None
+        self._socket: Optional[socket.socket] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def subscribe(self, callback: Subscriber) -> None:
+        self._add_subscriber(callback)
+        if self._socket is None:
+            self.start()
+
+    def start(self) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.path = self.directory / f"{os.getpid()}-{uuid.uuid4().hex[:8]}.sock"
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self._socket.bind(str(self.path))
+        self._thread = threading.Thread(target=self._receive, name="authz-bus-unix", daemon=True)
+        self._thread.start()
+
+    def _receive(self) -> None:
+        while True:
+            try:
+                payload = self._socket.recv(MAX_DATAGRAM)
+            except OSError:
+                return
+            if not payload:
+                return
+            try:
+                event = InvalidationEvent.from_json(payload)
+            except ValueError:
+                logger.warning(f"Ignoring malformed invalidation datagram on {self.path}")
+                continue
+            self._dispatch(event)
+
+    def publish(self, event: InvalidationEvent) -> None:
+        payload = event.to_json().encode()
+        if len(payload) > MAX_DATAGRAM:
+            payload = event.without_names().to_json().encode()
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sender:
+            sender.setblocking(False)
+            for peer in self.directory.glob("*.sock"):
+                try:
+                    sender.sendto(payload, str(peer))
+                except (ConnectionRefusedError, FileNotFoundError):
+                    # Owner exited without cleaning up
+                    peer.unlink(missing_ok=True)
+                except BlockingIOError:
+                    logger.warning(f"Invalidation queue of {peer} is full; event dropped")
+
+    def close(self) -> None:
+        if self._socket is None:
+            return
+        # Closing does not interrupt a blocked recv(); an empty datagram does
+        with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sender:
+            sender.sendto(b"", str(self.path))
+        self._thread.join(timeout=1)
+        self._socket.close()
+        self.path.unlink(missing_ok=True)
+        self._socket = self._thread = self.path = None
+
+
+class PostgresBus(InvalidationBus):
+    """Delivers events through PostgreSQL LISTEN/NOTIFY.
+
+    The listener holds one dedicated connection outside the pool. If it is
+    lost, a global event is dispatched after reconnecting, since
+    notifications sent in the meantime are gone.
+    """
+
+    name = "postgres"
+
+    def __init__(self, engine=None, channel: str = DEFAULT_CHANNEL, poll_interval: float = 1.0):
+        """
+        Initialize the bus.
+
+        Args:
+            engine: Engine bound to PostgreSQL/psycopg2. Defaults to the app engine.
+            channel: Notification channel
+            poll_interval: Seconds between checks of the stop flag
+        """
+        super().__init__()
+        if engine is None:
+            from app.db.session import engine
+
+        self.engine = engine
+        self.channel = channel
+        self.poll_interval = poll_interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def subscribe(self, callback: Subscriber) -> None:
+        self._add_subscriber(callback)
+        if self._thread is None:
+            self.start()
+
+    def publish(self, event: InvalidationEvent) -> None:
+        payload = event.to_json()
+        # NOTIFY payloads are limited to 8000 bytes
+        if len(payload.encode()) > 7900:
+            payload = event.without_names().to_json()
+        with self.engine.begin() as conn:
+            conn.execute(text("SELECT pg_notify(:channel, :payload)"), {"channel": self.channel, "payload": payload})
+
+    def _connect(self):
+        connection = self.engine.raw_connection()
+        connection.detach()
+        dbapi_connection = connection.driver_connection
+        dbapi_connection.autocommit = True
+        with dbapi_connection.cursor() as cursor:
+            cursor.execute(f"LISTEN {self.engine.dialect.identifier_preparer.quote(self.channel)}")
+        return dbapi_connection
+
+    def start(self) -> None:
+        self._stop.clear()
+        connection = self._connect()
+        self._thread = threading.Thread(target=self._listen, args=(connection,), name="authz-bus-pg", daemon=True)
+        self._thread.start()
+
+    def _listen(self, connection) -> None:
+        while not self._stop.is_set():
+            try:
+                if select.select([connection], [], [], self.poll_interval)[0]:
+                    connection.poll()
+                    while connection.notifies:
+                        notify = connection.notifies.pop(0)
+                        try:
+                            self._dispatch(InvalidationEvent.from_json(notify.payload))
+                        except ValueError:
+                            logger.warning(f"Ignoring malformed notification on {self.channel}")
+            except Exception as e:
+                logger.warning(f"Lost LISTEN connection on {self.channel}: {e}")
+                connection.close()
+                while not self._stop.wait(self.poll_interval):
+                    try:
+                        connection = self._connect()
+                        break
+                    except Exception as e:
+                        logger.warning(f"Reconnecting LISTEN on {self.channel} failed: {e}")
+                else:
+                    return
+                self._dispatch(InvalidationEvent("*", "reconnect"))
+
+        connection.close()
+
+    def close(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+INVALIDATION_BUSES = {
+    LocalBus.name: LocalBus,
+    UnixSocketBus.name: UnixSocketBus,
+    PostgresBus.name: PostgresBus,
+}
+
+
+def create_invalidation_bus(name: Optional[str] = None) -> Optional[InvalidationBus]:
+    """
+    Create and start the configured bus.
+
+    Args:
+        name: Backend name. Defaults to settings.AUTHZ_BUS; empty disables the bus.
+
+    Returns:
+        Started bus, or None when disabled
+    """
+    if name is None:
+        from app.core.config import settings
+        name = settings.AUTHZ_BUS
+
+    if not name:
+        return None
+    if name not in INVALIDATION_BUSES:
+        raise ValueError(f"Unknown invalidation bus '{name}'; expected one of {', '.join(INVALIDATION_BUSES)}")
+
+    bus = INVALIDATION_BUSES[name]()
+    bus.start()
+    return bus
+
+
+def _resolve_roles(session: Session, role_ids: Set[object]) -> Dict[object, Set[str]]:
+    """Map role ids to the names of the role and of every role inheriting from it."""
+    if not role_ids:
+        return {}
+    conn = session.connection()
+    affected = {
+        role_id: {role}
+        for role_id, role in conn.execute(sql_select(Role.id, Role.role).where(Role.id.in_(role_ids)))
+    }
+    for ancestor_id, role in conn.execute(
+        sql_select(RoleClosure.ancestor_id, Role.role)
+        .join(Role, Role.id == RoleClosure.descendant_id)
+        .where(RoleClosure.ancestor_id.in_(role_ids))
+    ):
+        if ancestor_id in affected:
+            affected[ancestor_id].add(role)
+    return affected
+
+
+def _resolve_policies(session: Session, policy_ids: Set[object]) -> Dict[object, PolicyKey]:
+    """Map policy ids to their (category, action)."""
+    if not policy_ids:
+        return {}
+    rows = session.connection().execute(
+        sql_select(Policy.id, Policy.category, Policy.action).where(Policy.id.in_(policy_ids))
+    )
+    return {policy_id: (category, action) for policy_id, category, action in rows}
+
+
+def _changed_names(obj, roles_by_id, policies_by_id) -> Optional[Tuple[Set[str], Set[PolicyKey]]]:
+    """
+    Return the (role names, policy keys) a changed ORM object affects.
+
+    Returns:
+        Names to evict; empty sets when anything may have changed (hierarchy
+        edits), None when an id did not resolve
+    """
+    if isinstance(obj, Role):
+        return {obj.role}, set()
+    if isinstance(obj, Policy):
+        return set(), {(obj.category, obj.action)}
+    if isinstance(obj, (Permission, WildcardPermission)):
+        roles = roles_by_id.get(obj.role_id)
+        if roles is None:
+            return None
+        if isinstance(obj, WildcardPermission):
+            return roles, set()
+        policy = policies_by_id.get(obj.policy_id)
+        return None if policy is None else (roles, {policy})
+    # Hierarchy changes affect every descendant
+    return set(), set()
+
+
+def install_bus_publisher(bus: InvalidationBus, session_factory=None) -> None:
+    """
+    Publish an event for every committed change to the permission tables.
+
+    Role and policy ids are resolved to names when the change is flushed, in
+    the same transaction, so subscribers never query the database. INSERT,
+    UPDATE and DELETE statements do not say which rows they touched and are
+    published as global events.
+
+    Not needed with PostgresBus, whose triggers also cover writes made
+    outside this application.
+
+    Args:
+        bus: Bus to publish to
+        session_factory: sessionmaker to listen on. Defaults to SessionLocal.
+    """
+    if session_factory is None:
+        from app.db.session import SessionLocal
+        session_factory = SessionLocal
+
+    def record(session: Session, table: str, operation: str, roles=(), policies=()):
+        events: Dict[Tuple[str, str], Dict] = session.info.setdefault("authz_bus_events", {})
+        pending = events.setdefault((table, operation), {"roles": set(), "policies": set(), "global": False})
+        pending["roles"].update(roles)
+        pending["policies"].update(policies)
+        if not (roles or policies):
+            pending["global"] = True
+
+    @event.listens_for(session_factory, "after_flush")
+    def after_flush(session, flush_context):
+        changes = [
+            (operation, obj)
+            for operation, collection in (("insert", session.new), ("update", session.dirty), ("delete", session.deleted))
+            for obj in collection
+            if isinstance(obj, WATCHED_MODELS)
+        ]
+        if not changes:
+            return
+
+        grants = [obj for _, obj in changes if isinstance(obj, (Permission, WildcardPermission))]
+        roles_by_id = _resolve_roles(session, {obj.role_id for obj in grants})
+        policies_by_id = _resolve_policies(session, {obj.policy_id for obj in grants if isinstance(obj, Permission)})
+
+        for operation, obj in changes:
+            names = _changed_names(obj, roles_by_id, policies_by_id)
+            record(session, obj.__tablename__, operation, *(names or ()))
+
+    @event.listens_for(session_factory, "do_orm_execute")
+    def do_orm_execute(orm_execute_state):
+        table = watched_table(orm_execute_state)
+        if table is not None:
+            operation = "insert" if orm_execute_state.is_insert else "update" if orm_execute_state.is_update else "delete"
+            record(orm_execute_state.session, table.name, operation)
+
+    @event.listens_for(session_factory, "after_commit")
+    def after_commit(session):
+        for (table, operation), pending in session.info.pop("authz_bus_events", {}).items():
+            if pending["global"]:
+                bus.publish(InvalidationEvent(table, operation))
+            else:
+                bus.publish(InvalidationEvent(
+                    table, operation, tuple(sorted(pending["roles"])), tuple(sorted(pending["policies"], key=str))
+                ))
+
+    @event.listens_for(session_factory, "after_rollback")
+    def after_rollback(session):
+        session.info.pop("authz_bus_events", None)
+
+
+class CacheInvalidator:
+    """Bus subscriber evicting only the affected entries of a DecisionCache.
+
+    Entries of the event's roles and policies are dropped. Global events and
+    changes to existing roles or policies (renames, deletes) clear the whole
+    cache.
+    """
+
+    def __init__(self, cache: DecisionCache):
+        """
+        Initialize the subscriber.
+
+        Args:
+            cache: Cache to evict from
+        """
+        self.cache = cache
+
+    def __call__(self, event: InvalidationEvent) -> None:
+        if event.is_global or (event.table in ("roles", "policies") and event.operation != "insert"):
+            self.cache.invalidate()
+            return
+
+        roles = set(event.roles)
+        policies = set(event.policies)
+        self.cache.invalidate_where(lambda key: key[0] in roles or (key[1], key[2]) in policies)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect the permission invalidation bus")
+    parser.add_argument("command", choices=["listen", "publish"])
+    parser.add_argument("--backend", choices=list(INVALIDATION_BUSES), help="Defaults to AUTHZ_BUS")
+    parser.add_argument("--table", default="permissions")
+    parser.add_argument("--operation", default="update")
+    parser.add_argument("--role", action="append", default=[], help="Affected role name")
+    parser.add_argument("--policy", action="append", default=[], help="Affected policy as CATEGORY:ACTION")
+    args = parser.parse_args()
+
+    policies = []
+    for policy in args.policy:
+        category, sep, action = policy.partition(":")
+        if not sep:
+            parser.error(f"--policy {policy!r} is not CATEGORY:ACTION")
+        policies.append((category, action))
+
+    bus = create_invalidation_bus(args.backend)
+    if bus is None:
+        parser.error("no backend given and AUTHZ_BUS is not set")
+
+    try:
+        if args.command == "publish":
+            bus.publish(InvalidationEvent(args.table, args.operation, tuple(args.role), tuple(policies)))
+            return
+
+        bus.subscribe(lambda event: print(event.to_json(), flush=True))
+        print(f"Listening on the {bus.name} bus, Ctrl-C to stop", flush=True)
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        bus.close()
+
+
+if __name__ == "__main__":
+    main()
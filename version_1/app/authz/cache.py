@@ -0,0 +1,282 @@
+"""Permission decision cache with LRU/TTL eviction."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import Table, event
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from app.models import Policy, Role, Permission, RoleClosure, RoleParent, WildcardPermission
+from app.authz.queries import check_many, has_permission
+
+
+DecisionKey = Tuple[str, str, str]
+
+WATCHED_MODELS = (Policy, Role, Permission, WildcardPermission, RoleParent, RoleClosure)
+
+WATCHED_TABLES = frozenset(model.__table__ for model in WATCHED_MODELS)
+
+
+class DecisionCache:
+    """Bounded LRU cache of (role, category, action) -> bool decisions."""
+
+    def __init__(self, maxsize: int = 10000, ttl: Optional[float] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of decisions kept
+            ttl: Seconds a decision stays valid. If None, entries never expire.
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[DecisionKey, Tuple[bool, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        # Bumped by every invalidation, so a decision loaded before one is
+        # not stored after it
+        self.generation = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: DecisionKey) -> Optional[bool]:
+        """
+        Return a cached decision, or None if absent or expired.
+
+        Args:
+            key: (role, category, action)
+
+        Returns:
+            Cached decision or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            allowed, stored_at = entry
+            if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                self.evictions += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return allowed
+
+    def set(self, key: DecisionKey, allowed: bool, generation: Optional[int] = None) -> None:
+        """
+        Store a decision, evicting the least recently used entry if full.
+
+        Args:
+            key: (role, category, action)
+            allowed: Decision
+            generation: The cache's generation read before the decision was
+                loaded. If the cache was invalidated since, the decision may
+                be stale and is not stored.
+        """
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._entries[key] = (allowed, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_load(self, key: DecisionKey, loader: Callable[[], bool]) -> bool:
+        """
+        Return a cached decision, computing and storing it on a miss.
+
+        Args:
+            key: (role, category, action)
+            loader: Zero-argument callable producing the decision
+
+        Returns:
+            Decision
+        """
+        allowed = self.get(key)
+        if allowed is None:
+            generation = self.generation
+            allowed = loader()
+            self.set(key, allowed, generation)
+        return allowed
+
+    def invalidate(self) -> None:
+        """Drop every cached decision."""
+        with self._lock:
+            self._entries.clear()
+            self.invalidations += 1
+            self.generation += 1
+
+    def invalidate_where(self, predicate: Callable[[DecisionKey], bool]) -> int:
+        """
+        Drop the cached decisions whose key matches a predicate.
+
+        Args:
+            predicate: Called with each (role, category, action) key
+
+        Returns:
+            Number of decisions dropped
+        """
+        with self._lock:
+            stale = [key for key in self._entries if predicate(key)]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += 1
+            self.generation += 1
+        return len(stale)
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss/eviction counters and the current size."""
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+
+class CachedPermissionChecker:
+    """Answers permission checks through a DecisionCache backed by the ORM."""
+
+    def __init__(self, cache: Optional[DecisionCache] = None):
+        """
+        Initialize the checker.
+
+        Args:
+            cache: Decision cache to use. Defaults to a new DecisionCache.
+        """
+        self.cache = cache if cache is not None else DecisionCache()
+
+    def is_allowed(self, db: Session, role: str, category: str, action: str) -> bool:
+        """
+        Check a grant, hitting the database only on a cache miss.
+
+        Args:
+            db: Database session used on a miss
+            role: Role name
+            category: Policy category
+            action: Policy action
+
+        Returns:
+            True if allowed, False otherwise
+        """
+        return self.cache.get_or_load(
+            (role, category, action),
+            lambda: has_permission(db, role, category, action),
+        )
+
+    def is_allowed_many(
+        self, db: Session, checks: Iterable[DecisionKey]
+    ) -> Dict[DecisionKey, bool]:
+        """
+        Check many grants, resolving all cache misses with a single query.
+
+        Args:
+            db: Database session used for the misses
+            checks: (role, category, action) tuples
+
+        Returns:
+            Mapping of each requested tuple to its decision
+        """
+        decisions = {}
+        misses = []
+
+        for key in dict.fromkeys(checks):
+            allowed = self.cache.get(key)
+            if allowed is None:
+                misses.append(key)
+            else:
+                decisions[key] = allowed
+
+        if misses:
+            generation = self.cache.generation
+            for key, allowed in check_many(db, misses).items():
+                self.cache.set(key, allowed, generation)
+                decisions[key] = allowed
+
+        return decisions
+
+
+def _touches_watched_models(session: Session) -> bool:
+    """Return True if the session has pending writes to the permission tables."""
+    for collection in (session.new, session.dirty, session.deleted):
+        for obj in collection:
+            if isinstance(obj, WATCHED_MODELS):
+                return True
+    return False
+
+
+def watched_table(orm_execute_state: ORMExecuteState) -> Optional[Table]:
+    """
+    Return the permission table an INSERT, UPDATE or DELETE statement writes to.
+
+    Covers ORM statements such as ``update(Permission)`` as well as Core
+    statements on the table itself (``Permission.__table__.insert()``), which
+    have no bind mapper.
+
+    Returns:
+        One of WATCHED_TABLES, or None for reads and other tables
+    """
+    if not (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+        return None
+    table = getattr(orm_execute_state.statement, "table", None)
+    return table if table in WATCHED_TABLES else None
+
+
+def install_invalidation(cache: DecisionCache, session_factory=None) -> None:
+    """
+    Invalidate a cache whenever permission data is committed.
+
+    Listens on the session factory for ORM flushes and INSERT/UPDATE/DELETE
+    statements, ORM or Core (see watched_table()), touching any of
+    WATCHED_MODELS, and clears the cache once the transaction commits.
+    Rolled-back changes leave the cache intact.
+
+    Args:
+        cache: Cache to invalidate
+        session_factory: sessionmaker to listen on. Defaults to SessionLocal,
+            which already invalidates decision_cache.
+    """
+    if session_factory is None:
+        from app.db.session import SessionLocal
+        session_factory = SessionLocal
+
+    def mark_dirty(session: Session) -> None:
+        session.info["authz_cache_dirty"] = True
+
+    @event.listens_for(session_factory, "after_flush")
+    def after_flush(session, flush_context):
+        if _touches_watched_models(session):
+            mark_dirty(session)
+
+    @event.listens_for(session_factory, "do_orm_execute")
+    def do_orm_execute(orm_execute_state):
+        if watched_table(orm_execute_state) is not None:
+            mark_dirty(orm_execute_state.session)
+
+    @event.listens_for(session_factory, "after_commit")
+    def after_commit(session):
+        if session.info.pop("authz_cache_dirty", False):
+            cache.invalidate()
+
+    @event.listens_for(session_factory, "after_rollback")
+    def after_rollback(session):
+        session.info.pop("authz_cache_dirty", None)
+
+
+decision_cache = DecisionCache()
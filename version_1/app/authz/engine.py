@@ -0,0 +1,370 @@
+"""In-memory permission decision engine."""
+
+import logging
+import threading
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models import Policy, Role, Permission, RoleClosure, WildcardPermission, WILDCARD
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+
+logger = logging.getLogger(__name__)
+
+PolicyKey = Tuple[str, str]
+
+
+class CompiledMatrix:
+    """Immutable role x policy matrix compiled from the permission tables.
+
+    Every live (category, action) pair is interned to a bit position and every
+    live role is compiled to an integer bitmask of the policies it holds.
+    """
+
+    __slots__ = ("policy_keys", "policy_names", "policy_index", "role_masks")
+
+    def __init__(
+        self,
+        policy_keys: List[PolicyKey],
+        policy_names: List[str],
+        role_masks: Dict[str, int],
+    ):
+        """
+        Initialize the compiled matrix.
+
+        Args:
+            policy_keys: (category, action) pairs, indexed by bit position
+            policy_names: Policy names, indexed by bit position
+            role_masks: Mapping of role name to policy bitmask
+        """
+        self.policy_keys = tuple(policy_keys)
+        self.policy_names = tuple(policy_names)
+        self.policy_index = {key: bit for bit, key in enumerate(self.policy_keys)}
+        self.role_masks = dict(role_masks)
+
+    @classmethod
+    def empty(cls) -> "CompiledMatrix":
+        """Return a matrix that denies everything."""
+        return cls([], [], {})
+
+    @classmethod
+    def compile(
+        cls,
+        roles: Iterable[Tuple[object, str]],
+        policies: Iterable[Tuple[object, str, str, str]],
+        grants: Iterable[Tuple[object, object]],
+        wildcards: Iterable[Tuple[object, str, str]] = (),
+        inheritance: Iterable[Tuple[object, object]] = (),
+    ) -> "CompiledMatrix":
+        """
+        Compile raw rows into a matrix.
+
+        Args:
+            roles: (role_id, role) rows
+            policies: (policy_id, policy_name, category, action) rows
+            grants: (role_id, policy_id) rows
+            wildcards: (role_id, category, action) pattern rows, where either
+                side may be "*"
+            inheritance: (descendant_id, ancestor_id) closure rows; a role
+                holds every grant of its ancestors
+
+        Returns:
+            Compiled matrix
+        """
+        policy_keys = []
+        policy_names = []
+        bit_by_policy_id = {}
+        all_mask = 0
+        category_masks: Dict[str, int] = {}
+        action_masks: Dict[str, int] = {}
+
+        for policy_id, policy_name, category, action in policies:
+            bit = len(policy_keys)
+            bit_by_policy_id[policy_id] = bit
+            policy_keys.append((category, action))
+            policy_names.append(policy_name)
+            all_mask |= 1 << bit
+            category_masks[category] = category_masks.get(category, 0) | 1 << bit
+            action_masks[action] = action_masks.get(action, 0) | 1 << bit
+
+        role_by_id = {role_id: role for role_id, role in roles}
+        own_masks = {role_id: 0 for role_id in role_by_id}
+
+        for role_id, policy_id in grants:
+            bit = bit_by_policy_id.get(policy_id)
+            if role_id not in own_masks or bit is None:
+                continue
+            own_masks[role_id] |= 1 << bit
+
+        for role_id, category, action in wildcards:
+            if role_id not in own_masks:
+                continue
+            if category == WILDCARD and action == WILDCARD:
+                mask = all_mask
+            elif action == WILDCARD:
+                mask = category_masks.get(category, 0)
+            elif category == WILDCARD:
+                mask = action_masks.get(action, 0)
+            else:
+                mask = category_masks.get(category, 0) & action_masks.get(action, 0)
+            own_masks[role_id] |= mask
+
+        effective_masks = dict(own_masks)
+        for descendant_id, ancestor_id in inheritance:
+            if descendant_id not in own_masks or ancestor_id not in own_masks:
+                continue
+            effective_masks[descendant_id] |= own_masks[ancestor_id]
+
+        role_masks = {role_by_id[role_id]: mask for role_id, mask in effective_masks.items()}
+
+        return cls(policy_keys, policy_names, role_masks)
+
+    def is_allowed(self, role: str, category: str, action: str) -> bool:
+        """Check whether a role holds the (category, action) policy."""
+        bit = self.policy_index.get((category, action))
+        if bit is None:
+            return False
+        return bool(self.role_masks.get(role, 0) >> bit & 1)
+
+    def policies_for(self, role: str) -> List[PolicyKey]:
+        """Return the (category, action) pairs granted to a role."""
+        mask = self.role_masks.get(role, 0)
+        return [key for bit, key in enumerate(self.policy_keys) if mask >> bit & 1]
+
+
+def _matrix_statements():
+    """Build the statements loading live roles, policies, grants and inheritance."""
+    roles = select(Role.id, Role.role).where(Role.deleted.is_(None))
+    policies = (
+        select(Policy.id, Policy.policy_name, Policy.category, Policy.action)
+        .where(Policy.deleted.is_(None))
+        .order_by(Policy.category, Policy.action)
+    )
+    grants = (
+        select(Permission.role_id, Permission.policy_id)
+        .where(Permission.deleted.is_(None))
+    )
+    wildcards = (
+        select(WildcardPermission.role_id, WildcardPermission.category, WildcardPermission.action)
+        .where(WildcardPermission.deleted.is_(None))
+    )
+    inheritance = select(RoleClosure.descendant_id, RoleClosure.ancestor_id)
+    return roles, policies, grants, wildcards, inheritance
+
+
+def load_matrix(db: Session) -> CompiledMatrix:
+    """
+    Load live roles, policies and permissions and compile them.
+
+    Wildcard grants are expanded against the live policies and every role
+    inherits the grants of its ancestors in ``role_closure``. Soft-deleted
+    rows of any of the tables are ignored.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Compiled matrix
+    """
+    roles, policies, grants, wildcards, inheritance = _matrix_statements()
+    return CompiledMatrix.compile(
+        db.execute(roles).all(),
+        db.execute(policies).all(),
+        db.execute(grants).all(),
+        db.execute(wildcards).all(),
+        db.execute(inheritance).all(),
+    )
+
+
+async def load_matrix_async(db: "AsyncSession") -> CompiledMatrix:
+    """Async variant of load_matrix()."""
+    roles, policies, grants, wildcards, inheritance = _matrix_statements()
+    return CompiledMatrix.compile(
+        (await db.execute(roles)).all(),
+        (await db.execute(policies)).all(),
+        (await db.execute(grants)).all(),
+        (await db.execute(wildcards)).all(),
+        (await db.execute(inheritance)).all(),
+    )
+
+
+class PermissionEngine:
+    """Answers permission checks from a compiled in-memory matrix.
+
+    The matrix is swapped atomically on reload, so readers never take a lock.
+    """
+
+    def __init__(self, session_factory=None):
+        """
+        Initialize the engine.
+
+        Args:
+            session_factory: Callable returning a new Session, used by reload()
+                when no session is passed. Defaults to SessionLocal.
+        """
+        self._session_factory = session_factory
+        self._matrix = CompiledMatrix.empty()
+        self._loaded = False
+        self._reload_lock = threading.Lock()
+        self._shared = None
+
+    @property
+    def matrix(self) -> CompiledMatrix:
+        """Return the currently active matrix."""
+        if self._shared is not None:
+            return self._shared.matrix
+        return self._matrix
+
+    @property
+    def loaded(self) -> bool:
+        """Return True once the engine has been loaded at least once."""
+        return self._loaded
+
+    def reload(self, db: Optional[Session] = None) -> CompiledMatrix:
+        """
+        Rebuild the matrix from the database and swap it in.
+
+        Args:
+            db: Database session. If None, a new session is opened.
+
+        Returns:
+            The newly active matrix
+        """
+        with self._reload_lock:
+            if db is not None:
+                matrix = load_matrix(db)
+            else:
+                if self._session_factory is None:
+                    from app.db.session import SessionLocal
+                    self._session_factory = SessionLocal
+
+                session = self._session_factory()
+                try:
+                    matrix = load_matrix(session)
+                finally:
+                    session.close()
+
+            self._matrix = matrix
+            self._shared = None
+            self._loaded = True
+            return matrix
+
+    async def reload_async(self, db: "AsyncSession") -> CompiledMatrix:
+        """
+        Rebuild the matrix from an AsyncSession and swap it in.
+
+        Args:
+            db: Async database session
+
+        Returns:
+            The newly active matrix
+        """
+        matrix = await load_matrix_async(db)
+        self._matrix = matrix
+        self._shared = None
+        self._loaded = True
+        return matrix
+
+    def load_snapshot(self, path: str, max_age: Optional[float] = None) -> CompiledMatrix:
+        """
+        Swap in the matrix of a memory-mapped snapshot.
+
+        Args:
+            path: Snapshot file written by app.authz.snapshot
+            max_age: Reject snapshots older than this many seconds
+
+        Returns:
+            The newly active matrix
+
+        Raises:
+            OSError: If the snapshot cannot be read
+            ValueError: If the snapshot is invalid or stale
+        """
+        from app.authz.snapshot import load_snapshot
+
+        matrix = load_snapshot(path, max_age).matrix
+        self._matrix = matrix
+        self._shared = None
+        self._loaded = True
+        return matrix
+
+    def attach_shared(self, name: str) -> CompiledMatrix:
+        """
+        Serve checks from a matrix published in shared memory.
+
+        New generations published under ``name`` are picked up on the next
+        check. reload() and load_snapshot() detach again.
+
+        Args:
+            name: Shared memory name used by the publisher
+
+        Returns:
+            The currently published matrix
+
+        Raises:
+            FileNotFoundError: If nothing is published under ``name``
+        """
+        from app.authz.shared import SharedMatrixReader
+
+        self._shared = SharedMatrixReader(name)
+        self._loaded = True
+        return self._shared.matrix
+
+    def warm_start(self, path: Optional[str] = None, max_age: Optional[float] = None) -> CompiledMatrix:
+        """
+        Load the matrix without querying the database when possible.
+
+        The shared memory matrix named by settings.AUTHZ_SHARED_MATRIX is
+        tried first, then the snapshot file, then the database.
+
+        Args:
+            path: Snapshot file. Defaults to settings.AUTHZ_SNAPSHOT_PATH.
+            max_age: Maximum snapshot age in seconds. Defaults to
+                settings.AUTHZ_SNAPSHOT_MAX_AGE.
+
+        Returns:
+            The newly active matrix
+        """
+        from app.core.config import settings
+
+        path = settings.AUTHZ_SNAPSHOT_PATH if path is None else path
+        max_age = settings.AUTHZ_SNAPSHOT_MAX_AGE if max_age is None else max_age
+
+        if settings.AUTHZ_SHARED_MATRIX:
+            try:
+                matrix = self.attach_shared(settings.AUTHZ_SHARED_MATRIX)
+                if self._shared.generation:
+                    return matrix
+                self._shared = None
+                logger.warning("Shared permission matrix has not been published yet")
+            except FileNotFoundError as e:
+                logger.warning(f"Shared permission matrix unavailable: {e}")
+
+        if path:
+            try:
+                return self.load_snapshot(path, max_age or None)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Permission snapshot unusable, loading from database: {e}")
+
+        return self.reload()
+
+    def is_allowed(self, role: str, category: str, action: str) -> bool:
+        """
+        Check whether a role may perform an action on a category.
+
+        Args:
+            role: Role name
+            category: Policy category
+            action: Policy action
+
+        Returns:
+            True if allowed, False otherwise
+        """
+        return self.matrix.is_allowed(role, category, action)
+
+
+permission_engine = PermissionEngine()
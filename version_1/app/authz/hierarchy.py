@@ -0,0 +1,288 @@
+"""Role inheritance edges and their transitive closure.
+
+``role_parents`` holds the edges an administrator edits; ``role_closure``
+holds every (ancestor, descendant) pair reachable through live edges between
+live roles, so the effective grants of a role are one indexed lookup instead
+of a recursive walk.
+The functions here change edges and keep the closure in step within the same
+transaction.
+"""
+
+from collections import deque
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy.sql import func
+
+from app.models import Role, RoleParent, RoleClosure
+
+
+def _live_edges(db: Session) -> Dict[object, Set[object]]:
+    """
+    Return a mapping of role id to the ids of its live direct parents.
+
+    Edges from or to a soft-deleted role are left out, so a deleted role
+    also stops passing on the grants of its own ancestors.
+    """
+    child = aliased(Role)
+    parent = aliased(Role)
+    parents: Dict[object, Set[object]] = {}
+    for role_id, parent_id in db.execute(
+        select(RoleParent.role_id, RoleParent.parent_id)
+        .join(child, child.id == RoleParent.role_id)
+        .join(parent, parent.id == RoleParent.parent_id)
+        .where(RoleParent.deleted.is_(None), child.deleted.is_(None), parent.deleted.is_(None))
+    ):
+        parents.setdefault(role_id, set()).add(parent_id)
+    return parents
+
+
+def _edge_descendants(db: Session, role_id) -> Set[object]:
+    """Return the ids of every role below ``role_id`` through live edges, ignoring role deletion."""
+    children: Dict[object, Set[object]] = {}
+    for child_id, parent_id in db.execute(
+        select(RoleParent.role_id, RoleParent.parent_id).where(RoleParent.deleted.is_(None))
+    ):
+        children.setdefault(parent_id, set()).add(child_id)
+
+    found: Set[object] = set()
+    queue = deque(children.get(role_id, ()))
+    while queue:
+        descendant_id = queue.popleft()
+        if descendant_id in found or descendant_id == role_id:
+            continue
+        found.add(descendant_id)
+        queue.extend(children.get(descendant_id, ()))
+    return found
+
+
+def compute_ancestors(parents: Dict[object, Set[object]], role_id) -> Dict[object, int]:
+    """
+    Breadth-first walk up the hierarchy from one role.
+
+    Args:
+        parents: Mapping of role id to direct parent ids
+        role_id: Role to start from
+
+    Returns:
+        Mapping of ancestor id to shortest path length
+
+    Raises:
+        ValueError: If the role is its own ancestor
+    """
+    depths: Dict[object, int] = {}
+    queue = deque((parent_id, 1) for parent_id in parents.get(role_id, ()))
+
+    while queue:
+        ancestor_id, depth = queue.popleft()
+        if ancestor_id == role_id:
+            raise ValueError(f"Role hierarchy cycle through role {role_id}")
+        if ancestor_id in depths:
+            continue
+        depths[ancestor_id] = depth
+        queue.extend((parent_id, depth + 1) for parent_id in parents.get(ancestor_id, ()))
+
+    return depths
+
+
+def descendants_of(db: Session, role_id) -> Set[object]:
+    """Return the ids of every role inheriting from ``role_id``."""
+    return set(db.execute(
+        select(RoleClosure.descendant_id).where(RoleClosure.ancestor_id == role_id)
+    ).scalars())
+
+
+def _ancestor_depths(db: Session, role_id) -> Dict[object, int]:
+    """Return the closure's ancestors of a role with their depth."""
+    return dict(db.execute(
+        select(RoleClosure.ancestor_id, RoleClosure.depth).where(RoleClosure.descendant_id == role_id)
+    ).all())
+
+
+def rebuild_closure(db: Session, role_ids: Optional[Iterable[object]] = None) -> int:
+    """
+    Recompute closure rows from the live edges.
+
+    Args:
+        db: Database session
+        role_ids: Descendants whose ancestor rows are recomputed. If None,
+            the whole closure is rebuilt.
+
+    Returns:
+        Number of closure rows written
+
+    Raises:
+        ValueError: If the live edges contain a cycle
+    """
+    parents = _live_edges(db)
+    if role_ids is None:
+        targets = set(parents)
+        db.execute(delete(RoleClosure))
+    else:
+        targets = set(role_ids)
+        if not targets:
+            return 0
+        db.execute(delete(RoleClosure).where(RoleClosure.descendant_id.in_(targets)))
+
+    rows = [
+        {"ancestor_id": ancestor_id, "descendant_id": role_id, "depth": depth}
+        for role_id in targets
+        for ancestor_id, depth in compute_ancestors(parents, role_id).items()
+    ]
+    if rows:
+        db.execute(RoleClosure.__table__.insert(), rows)
+    return len(rows)
+
+
+def add_parent(db: Session, role_id, parent_id) -> RoleParent:
+    """
+    Make ``role_id`` inherit from ``parent_id`` and extend the closure.
+
+    Every ancestor of the parent (and the parent itself) becomes an ancestor
+    of the role and of all its descendants; only those pairs are written.
+
+    Args:
+        db: Database session
+        role_id: Inheriting role
+        parent_id: Role to inherit from
+
+    Returns:
+        The live edge
+
+    Raises:
+        ValueError: If the edge would create a cycle
+    """
+    if role_id == parent_id or role_id in _ancestor_depths(db, parent_id):
+        raise ValueError(f"Role {role_id} cannot inherit from {parent_id}: cycle")
+
+    edge = db.execute(
+        select(RoleParent).where(RoleParent.role_id == role_id, RoleParent.parent_id == parent_id)
+    ).scalar_one_or_none()
+    if edge is None:
+        edge = RoleParent(role_id=role_id, parent_id=parent_id)
+        db.add(edge)
+    elif edge.deleted is None:
+        return edge
+    else:
+        edge.deleted = None
+    db.flush()
+
+    if db.scalar(select(func.count()).where(Role.id.in_([role_id, parent_id]), Role.deleted.is_not(None))):
+        # The edge takes effect once both roles are live again (restore_role())
+        return edge
+
+    above = {parent_id: 0, **_ancestor_depths(db, parent_id)}
+    below = {role_id: 0, **{
+        descendant_id: depth for descendant_id, depth in db.execute(
+            select(RoleClosure.descendant_id, RoleClosure.depth)
+            .where(RoleClosure.ancestor_id == role_id)
+        )
+    }}
+    wanted: Dict[Tuple[object, object], int] = {
+        (ancestor_id, descendant_id): up + down + 1
+        for ancestor_id, up in above.items()
+        for descendant_id, down in below.items()
+    }
+
+    existing = {
+        (ancestor_id, descendant_id): depth
+        for ancestor_id, descendant_id, depth in db.execute(
+            select(RoleClosure.ancestor_id, RoleClosure.descendant_id, RoleClosure.depth)
+            .where(RoleClosure.descendant_id.in_(list(below)), RoleClosure.ancestor_id.in_(list(above)))
+        )
+    }
+
+    inserts = [
+        {"ancestor_id": ancestor_id, "descendant_id": descendant_id, "depth": depth}
+        for (ancestor_id, descendant_id), depth in wanted.items()
+        if (ancestor_id, descendant_id) not in existing
+    ]
+    if inserts:
+        db.execute(RoleClosure.__table__.insert(), inserts)
+
+    for (ancestor_id, descendant_id), depth in wanted.items():
+        if existing.get((ancestor_id, descendant_id), depth) > depth:
+            db.execute(
+                RoleClosure.__table__.update()
+                .where(RoleClosure.ancestor_id == ancestor_id, RoleClosure.descendant_id == descendant_id)
+                .values(depth=depth)
+            )
+
+    return edge
+
+
+def remove_parent(db: Session, role_id, parent_id) -> bool:
+    """
+    Soft-delete an inheritance edge and recompute the affected closure rows.
+
+    Only the role and its descendants can lose ancestors, so only their rows
+    are recomputed.
+
+    Args:
+        db: Database session
+        role_id: Inheriting role
+        parent_id: Parent to stop inheriting from
+
+    Returns:
+        True if a live edge was removed
+    """
+    edge = db.execute(
+        select(RoleParent).where(
+            RoleParent.role_id == role_id,
+            RoleParent.parent_id == parent_id,
+            RoleParent.deleted.is_(None),
+        )
+    ).scalar_one_or_none()
+    if edge is None:
+        return False
+
+    edge.deleted = func.now()
+    db.flush()
+    rebuild_closure(db, {role_id} | descendants_of(db, role_id))
+    return True
+
+
+def soft_delete_role(db: Session, role_id) -> bool:
+    """
+    Soft-delete a role and recompute the closure rows that went through it.
+
+    The role's descendants lose it and every ancestor reached only through
+    it; the role itself keeps no ancestors while deleted.
+
+    Args:
+        db: Database session
+        role_id: Role to delete
+
+    Returns:
+        True if a live role was deleted
+    """
+    role = db.get(Role, role_id)
+    if role is None or role.deleted is not None:
+        return False
+
+    role.deleted = func.now()
+    db.flush()
+    rebuild_closure(db, {role_id} | _edge_descendants(db, role_id))
+    return True
+
+
+def restore_role(db: Session, role_id) -> bool:
+    """
+    Undo soft_delete_role() and put the role back into the closure.
+
+    Args:
+        db: Database session
+        role_id: Role to restore
+
+    Returns:
+        True if a deleted role was restored
+    """
+    role = db.get(Role, role_id)
+    if role is None or role.deleted is None:
+        return False
+
+    role.deleted = None
+    db.flush()
+    rebuild_closure(db, {role_id} | _edge_descendants(db, role_id))
+    return True
@@ -0,0 +1,236 @@
+"""Permission lookups against the database.
+
+Each lookup is built as a Core ``select()`` so the same statement runs on a
+synchronous Session and on an AsyncSession. Grants come from explicit
+``permissions`` rows and from ``wildcard_permissions`` patterns, which are
+matched against live policies through the (category, action) index. A role
+also holds every grant of its live ancestors, looked up in ``role_closure``.
+"""
+
+from typing import TYPE_CHECKING, Dict, Iterable, List, Tuple
+
+from sqlalchemy import and_, exists, or_, select, tuple_, union
+from sqlalchemy.orm import Session, aliased
+
+from app.models import Policy, Role, Permission, RoleClosure, WildcardPermission, WILDCARD
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+
+DecisionKey = Tuple[str, str, str]
+
+# Live ancestor of the role being checked, shared with app.authz.views
+AncestorRole = aliased(Role, name="ancestor_role")
+
+
+def _granted_to(grantor_id):
+    """
+    Return the condition that a grant held by ``grantor_id`` applies to Role.
+
+    Role is the role being checked; the grant applies if it is held by the
+    role itself or by one of its live ancestors.
+    """
+    inherited = (
+        select(RoleClosure.ancestor_id)
+        .join(AncestorRole, AncestorRole.id == RoleClosure.ancestor_id)
+        .where(RoleClosure.descendant_id == Role.id, AncestorRole.deleted.is_(None))
+    )
+    return or_(grantor_id == Role.id, grantor_id.in_(inherited))
+
+
+def _live_grants(*columns):
+    """Return a select over live permissions joined to live roles and policies."""
+    return (
+        select(*columns)
+        .select_from(Role)
+        .join(Permission, _granted_to(Permission.role_id))
+        .join(Policy, Policy.id == Permission.policy_id)
+        .where(
+            Role.deleted.is_(None),
+            Policy.deleted.is_(None),
+            Permission.deleted.is_(None),
+        )
+    )
+
+
+def pattern_matches_policy():
+    """Return the condition matching a wildcard pattern against a policy."""
+    return and_(
+        or_(WildcardPermission.category == WILDCARD, WildcardPermission.category == Policy.category),
+        or_(WildcardPermission.action == WILDCARD, WildcardPermission.action == Policy.action),
+    )
+
+
+def _live_wildcard_grants(*columns):
+    """Return a select over live wildcard grants expanded to live policies."""
+    return (
+        select(*columns)
+        .select_from(Role)
+        .join(WildcardPermission, _granted_to(WildcardPermission.role_id))
+        .join(Policy, pattern_matches_policy())
+        .where(
+            Role.deleted.is_(None),
+            Policy.deleted.is_(None),
+            WildcardPermission.deleted.is_(None),
+        )
+    )
+
+
+def has_permission_stmt(role: str, category: str, action: str):
+    """Build the EXISTS statement for a single grant."""
+    explicit = _live_grants(Permission.id).where(
+        Role.role == role,
+        Policy.category == category,
+        Policy.action == action,
+    )
+    wildcard = _live_wildcard_grants(WildcardPermission.id).where(
+        Role.role == role,
+        Policy.category == category,
+        Policy.action == action,
+        WildcardPermission.category.in_([category, WILDCARD]),
+        WildcardPermission.action.in_([action, WILDCARD]),
+    )
+    return select(or_(exists(explicit), exists(wildcard)))
+
+
+def check_many_stmt(keys: List[DecisionKey]):
+    """Build the row-value IN statement matching many grants at once."""
+    columns = (Role.role, Policy.category, Policy.action)
+    return union(
+        _live_grants(*columns).where(tuple_(*columns).in_(keys)),
+        _live_wildcard_grants(*columns).where(tuple_(*columns).in_(keys)),
+    )
+
+
+def category_actions_stmt(role: str, category: str):
+    """Build the statement listing a role's actions within a category."""
+    filters = (Role.role == role, Policy.category == category)
+    granted = union(
+        _live_grants(Policy.action).where(*filters),
+        _live_wildcard_grants(Policy.action).where(
+            *filters, WildcardPermission.category.in_([category, WILDCARD])
+        ),
+    ).subquery()
+    return select(granted.c.action).order_by(granted.c.action)
+
+
+def role_policies_stmt(role: str):
+    """Build the statement listing the live policies granted to a role."""
+    granted = union(
+        _live_grants(Policy.id).where(Role.role == role),
+        _live_wildcard_grants(Policy.id).where(Role.role == role),
+    )
+    return (
+        select(Policy)
+        .where(Policy.id.in_(granted))
+        .order_by(Policy.category, Policy.action)
+    )
+
+
+def has_permission(db: Session, role: str, category: str, action: str) -> bool:
+    """
+    Check a single (role, category, action) grant with one query.
+
+    Soft-deleted roles, policies and permissions never grant access.
+
+    Args:
+        db: Database session
+        role: Role name
+        category: Policy category
+        action: Policy action
+
+    Returns:
+        True if allowed, False otherwise
+    """
+    return bool(db.execute(has_permission_stmt(role, category, action)).scalar())
+
+
+def check_many(db: Session, checks: Iterable[DecisionKey]) -> Dict[DecisionKey, bool]:
+    """
+    Resolve many (role, category, action) checks with one set-based query.
+
+    The requested tuples are matched with a row-value IN list against the
+    permissions/roles/policies join, so the number of round trips does not
+    grow with the batch size.
+
+    Args:
+        db: Database session
+        checks: (role, category, action) tuples
+
+    Returns:
+        Mapping of each requested tuple to its decision
+    """
+    keys = list(dict.fromkeys(checks))
+    if not keys:
+        return {}
+
+    allowed = {tuple(row) for row in db.execute(check_many_stmt(keys))}
+    return {key: tuple(key) in allowed for key in keys}
+
+
+def category_actions(db: Session, role: str, category: str) -> List[str]:
+    """
+    Return every action a role holds within a category.
+
+    Args:
+        db: Database session
+        role: Role name
+        category: Policy category
+
+    Returns:
+        Sorted list of allowed actions
+    """
+    return list(db.execute(category_actions_stmt(role, category)).scalars())
+
+
+def role_policies(db: Session, role: str) -> List[Policy]:
+    """
+    Return the live policies granted to a role.
+
+    Unlike Role.policies this skips soft-deleted rows and needs no lazy load,
+    so it also works on an AsyncSession through role_policies_async().
+
+    Args:
+        db: Database session
+        role: Role name
+
+    Returns:
+        List of Policy instances
+    """
+    return list(db.execute(role_policies_stmt(role)).scalars())
+
+
+async def has_permission_async(
+    db: "AsyncSession", role: str, category: str, action: str
+) -> bool:
+    """Async variant of has_permission()."""
+    result = await db.execute(has_permission_stmt(role, category, action))
+    return bool(result.scalar())
+
+
+async def check_many_async(
+    db: "AsyncSession", checks: Iterable[DecisionKey]
+) -> Dict[DecisionKey, bool]:
+    """Async variant of check_many()."""
+    keys = list(dict.fromkeys(checks))
+    if not keys:
+        return {}
+
+    result = await db.execute(check_many_stmt(keys))
+    allowed = {tuple(row) for row in result}
+    return {key: tuple(key) in allowed for key in keys}
+
+
+async def category_actions_async(
+    db: "AsyncSession", role: str, category: str
+) -> List[str]:
+    """Async variant of category_actions()."""
+    result = await db.execute(category_actions_stmt(role, category))
+    return list(result.scalars())
+
+
+async def role_policies_async(db: "AsyncSession", role: str) -> List[Policy]:
+    """Async variant of role_policies()."""
+    result = await db.execute(role_policies_stmt(role))
+    return list(result.scalars())
@@ -0,0 +1,225 @@
+"""Permission matrix shared between processes through shared memory.
+
+One process (the publisher) compiles the matrix and copies it, in the
+snapshot format, into a fresh shared memory segment. Every worker on the host
+maps that segment, so the role masks are held once per host instead of once
+per worker.
+
+A small control segment holds a generation counter and the name of the
+active data segment. Publishing writes a new data segment, then updates the
+control block under a seqlock: the generation is odd while the block is being
+rewritten and even once it is consistent. Readers compare the generation on
+each access and only attach to the new segment when it moved, so the read
+path takes no locks.
+
+Usage:
+    python -m app.authz.shared --name rbac_matrix --interval 30
+"""
+
+import argparse
+import struct
+import sys
+import time
+from multiprocessing import resource_tracker, shared_memory
+from typing import Optional
+
+from app.authz.engine import CompiledMatrix
+from app.authz.snapshot import dump_matrix, parse_snapshot
+
+_CONTROL = struct.Struct("<QQ64s")
+_GENERATION = struct.Struct("<Q")
+_ATTACH_RETRIES = 100
+
+# Segments created by a publisher in this process; their tracker registration
+# is the publisher's own and must survive readers attaching to them
+_OWNED = set()
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Attach to an existing segment without letting this process unlink it."""
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+
+    # Before 3.13 attaching registers the segment with the resource tracker,
+    # which would unlink it when this process exits
+    segment = shared_memory.SharedMemory(name=name)
+    if name not in _OWNED:
+        resource_tracker.unregister(segment._name, "shared_memory")
+    return segment
+
+
+def _create(name: str, size: int) -> shared_memory.SharedMemory:
+    """Create a segment owned by this process."""
+    segment = shared_memory.SharedMemory(name=name, create=True, size=size)
+    _OWNED.add(name)
+    return segment
+
+
+def _unlink(segment: shared_memory.SharedMemory) -> None:
+    """Close and remove a segment created with _create()."""
+    segment.close()
+    segment.unlink()
+    _OWNED.discard(segment.name)
+
+
+class SharedMatrixPublisher:
+    """Owns the shared segments and publishes new matrix generations."""
+
+    def __init__(self, name: str):
+        """
+        Create the control segment.
+
+        Args:
+            name: Base name of the shared memory segments
+
+        Raises:
+            FileExistsError: If another publisher already owns ``name``
+        """
+        self.name = name
+        self.generation = 0
+        self._control = _create(name, _CONTROL.size)
+        _CONTROL.pack_into(self._control.buf, 0, 0, 0, b"")
+        self._segment: Optional[shared_memory.SharedMemory] = None
+
+    def publish(self, matrix: CompiledMatrix) -> int:
+        """
+        Publish a matrix as the next generation.
+
+        Args:
+            matrix: Matrix to publish
+
+        Returns:
+            The new generation number
+        """
+        data = dump_matrix(matrix)
+        generation = self.generation + 2
+        segment_name = f"{self.name}_{generation}"
+
+        segment = _create(segment_name, len(data))
+        segment.buf[:len(data)] = data
+
+        _GENERATION.pack_into(self._control.buf, 0, generation - 1)
+        _CONTROL.pack_into(self._control.buf, 0, generation - 1, len(data), segment_name.encode())
+        _GENERATION.pack_into(self._control.buf, 0, generation)
+
+        previous, self._segment = self._segment, segment
+        self.generation = generation
+        if previous is not None:
+            # Readers still mapping the old generation keep their pages
+            _unlink(previous)
+        return generation
+
+    def publish_from_db(self, db=None) -> int:
+        """
+        Compile the matrix from the database and publish it.
+
+        Args:
+            db: Database session. If None, a new session is opened.
+
+        Returns:
+            The new generation number
+        """
+        from app.authz.engine import load_matrix
+
+        if db is not None:
+            return self.publish(load_matrix(db))
+
+        from app.db.session import SessionLocal
+
+        session = SessionLocal()
+        try:
+            return self.publish(load_matrix(session))
+        finally:
+            session.close()
+
+    def close(self) -> None:
+        """Remove every segment owned by the publisher."""
+        for segment in (self._segment, self._control):
+            if segment is not None:
+                _unlink(segment)
+        self._segment = None
+
+
+class SharedMatrixReader:
+    """Reads the matrix published under a name, following new generations."""
+
+    def __init__(self, name: str):
+        """
+        Attach to the control segment.
+
+        Args:
+            name: Base name used by the publisher
+
+        Raises:
+            FileNotFoundError: If no publisher created ``name``
+        """
+        self.name = name
+        self._control = _attach(name)
+        self._generation = 0
+        self._matrix = CompiledMatrix.empty()
+
+    @property
+    def generation(self) -> int:
+        """Return the generation of the matrix last returned."""
+        return self._generation
+
+    @property
+    def matrix(self) -> CompiledMatrix:
+        """Return the current matrix, attaching to a newer generation if published."""
+        if _GENERATION.unpack_from(self._control.buf, 0)[0] != self._generation:
+            self._refresh()
+        return self._matrix
+
+    def _refresh(self) -> None:
+        for _ in range(_ATTACH_RETRIES):
+            generation, size, segment_name = _CONTROL.unpack_from(self._control.buf, 0)
+            if generation % 2:
+                time.sleep(0)
+                continue
+            if generation == 0:
+                return
+
+            try:
+                segment = _attach(segment_name.rstrip(b"\0").decode())
+            except FileNotFoundError:
+                # Replaced and unlinked between reading the name and attaching
+                continue
+
+            if _GENERATION.unpack_from(self._control.buf, 0)[0] != generation:
+                segment.close()
+                continue
+
+            snapshot = parse_snapshot(segment.buf, size, f"{self.name}@{generation}", keepalive=segment)
+            self._matrix = snapshot.matrix
+            self._generation = generation
+            return
+
+        raise RuntimeError(f"Could not attach to shared matrix {self.name}: publisher keeps changing it")
+
+    def close(self) -> None:
+        """Detach from the control segment."""
+        self._control.close()
+
+
+def main():
+    from app.core.config import settings
+
+    parser = argparse.ArgumentParser(description="Publish the permission matrix to shared memory")
+    parser.add_argument("--name", default=settings.AUTHZ_SHARED_MATRIX or "rbac_matrix", help="Shared memory name")
+    parser.add_argument("--interval", type=float, default=60, help="Seconds between republishing from the database")
+    args = parser.parse_args()
+
+    publisher = SharedMatrixPublisher(args.name)
+    try:
+        while True:
+            generation = publisher.publish_from_db()
+            print(f"Published generation {generation} under {args.name}", flush=True)
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        publisher.close()
+
+
+if __name__ == "__main__":
+    main()
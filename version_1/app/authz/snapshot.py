@@ -0,0 +1,307 @@
+"""Binary snapshot of the compiled permission matrix.
+
+A snapshot lets worker processes answer permission checks without touching
+the database at startup. The file is memory-mapped read-only, so every
+process on a host shares the same page cache copy of the role masks.
+
+Layout (little-endian):
+
+    header   magic, format version, build time, policy/role counts, mask width
+    policies (category, action, policy_name) per bit, length-prefixed UTF-8;
+             a length of 0xFFFF stands for NULL
+    roles    role name per slot, length-prefixed UTF-8
+    masks    one fixed-width bitmask per role slot, 8-byte aligned
+
+Usage:
+    python -m app.authz.snapshot export --output /var/run/rbac/matrix.snap
+"""
+
+import argparse
+import mmap
+import os
+import struct
+import tempfile
+import time
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from app.authz.engine import CompiledMatrix, PolicyKey, load_matrix
+
+MAGIC = b"RBACSNAP"
+FORMAT_VERSION = 2
+
+_HEADER = struct.Struct("<8sHHdIII")
+_LENGTH = struct.Struct("<H")
+# Length written for None; policies.category and policies.action are nullable
+_NULL_LENGTH = 0xFFFF
+_ALIGNMENT = 8
+
+
+def _pack_string(value: Optional[str]) -> bytes:
+    if value is None:
+        return _LENGTH.pack(_NULL_LENGTH)
+    encoded = value.encode("utf-8")
+    if len(encoded) >= _NULL_LENGTH:
+        raise ValueError(f"String of {len(encoded)} bytes is too long for a snapshot")
+    return _LENGTH.pack(len(encoded)) + encoded
+
+
+def _read_string(buffer, offset: int) -> Tuple[Optional[str], int]:
+    (length,) = _LENGTH.unpack_from(buffer, offset)
+    offset += _LENGTH.size
+    if length == _NULL_LENGTH:
+        return None, offset
+    return bytes(buffer[offset:offset + length]).decode("utf-8"), offset + length
+
+
+def _mask_width(policy_count: int) -> int:
+    """Return the number of bytes holding one role mask."""
+    return (policy_count + 7) // 8
+
+
+def dump_matrix(matrix: CompiledMatrix) -> bytes:
+    """
+    Serialize a compiled matrix to the snapshot format.
+
+    Args:
+        matrix: Matrix to serialize
+
+    Returns:
+        Snapshot bytes
+    """
+    width = _mask_width(len(matrix.policy_keys))
+    roles = sorted(matrix.role_masks)
+
+    parts = [_HEADER.pack(MAGIC, FORMAT_VERSION, 0, time.time(), len(matrix.policy_keys), len(roles), width)]
+    for (category, action), policy_name in zip(matrix.policy_keys, matrix.policy_names):
+        parts.append(_pack_string(category) + _pack_string(action) + _pack_string(policy_name))
+    for role in roles:
+        parts.append(_pack_string(role))
+
+    size = sum(map(len, parts))
+    parts.append(b"\0" * (-size % _ALIGNMENT))
+    for role in roles:
+        parts.append(matrix.role_masks[role].to_bytes(width, "little"))
+
+    return b"".join(parts)
+
+
+def write_snapshot(matrix: CompiledMatrix, path: str) -> int:
+    """
+    Write a matrix snapshot atomically.
+
+    The file is written next to ``path`` and renamed over it, so processes
+    that already mapped the previous snapshot keep reading a consistent copy.
+
+    Args:
+        matrix: Matrix to write
+        path: Destination file
+
+    Returns:
+        Number of bytes written
+    """
+    data = dump_matrix(matrix)
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".matrix-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+    return len(data)
+
+
+class MappedRoleMasks(Mapping):
+    """Read-only role -> bitmask mapping decoded on access from a mapped file."""
+
+    def __init__(self, buffer, offset: int, width: int, slots: Dict[str, int], keepalive=None):
+        """
+        Initialize the mapping.
+
+        Args:
+            buffer: Mapped snapshot
+            offset: Start of the masks section
+            width: Bytes per mask
+            slots: Mapping of role name to slot index
+            keepalive: Object owning the buffer, released with the mapping
+        """
+        self._keepalive = keepalive
+        self._buffer = buffer
+        self._offset = offset
+        self._width = width
+        self._slots = slots
+
+    def __getitem__(self, role: str) -> int:
+        start = self._offset + self._slots[role] * self._width
+        return int.from_bytes(self._buffer[start:start + self._width], "little")
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._slots)
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+
+class Snapshot:
+    """A memory-mapped snapshot and the matrix it serves."""
+
+    def __init__(self, path: str, built_at: float, matrix: CompiledMatrix):
+        self.path = path
+        self.built_at = built_at
+        self.matrix = matrix
+
+    @property
+    def age(self) -> float:
+        """Return the snapshot age in seconds."""
+        return time.time() - self.built_at
+
+
+def parse_snapshot(buffer, size: int, source: str, max_age: Optional[float] = None,
+                   keepalive=None) -> Snapshot:
+    """
+    Decode a snapshot held in a buffer without copying the role masks.
+
+    Args:
+        buffer: Object supporting the buffer protocol (mmap, memoryview)
+        size: Number of valid bytes in the buffer
+        source: Description of the buffer used in error messages
+        max_age: Reject snapshots built more than this many seconds ago
+        keepalive: Object owning the buffer, kept alive with the matrix
+
+    Returns:
+        Decoded snapshot
+
+    Raises:
+        ValueError: If the buffer is not a valid snapshot, or is too old
+    """
+    try:
+        if size < _HEADER.size:
+            raise ValueError(f"Snapshot {source} is truncated")
+
+        magic, version, _, built_at, policy_count, role_count, width = _HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{source} is not a permission matrix snapshot")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Snapshot {source} has format version {version}, expected {FORMAT_VERSION}")
+        if width != _mask_width(policy_count):
+            raise ValueError(f"Snapshot {source} has an invalid mask width")
+
+        age = time.time() - built_at
+        if max_age is not None and age > max_age:
+            raise ValueError(f"Snapshot {source} is stale ({age:.0f}s old, max {max_age:.0f}s)")
+
+        offset = _HEADER.size
+        policy_keys: List[PolicyKey] = []
+        policy_names: List[str] = []
+        for _ in range(policy_count):
+            category, offset = _read_string(buffer, offset)
+            action, offset = _read_string(buffer, offset)
+            policy_name, offset = _read_string(buffer, offset)
+            policy_keys.append((category, action))
+            policy_names.append(policy_name)
+
+        slots: Dict[str, int] = {}
+        for slot in range(role_count):
+            role, offset = _read_string(buffer, offset)
+            slots[role] = slot
+
+        offset += -offset % _ALIGNMENT
+        if offset + role_count * width != size:
+            raise ValueError(f"Snapshot {source} is truncated")
+    except (struct.error, UnicodeDecodeError) as e:
+        raise ValueError(f"Snapshot {source} is corrupt: {e}") from e
+
+    matrix = CompiledMatrix(policy_keys, policy_names, {})
+    # Masks stay in the shared buffer instead of being copied per process
+    matrix.role_masks = MappedRoleMasks(buffer, offset, width, slots, keepalive)
+    return Snapshot(source, built_at, matrix)
+
+
+def load_snapshot(path: str, max_age: Optional[float] = None) -> Snapshot:
+    """
+    Memory-map a snapshot read-only.
+
+    Only the name tables are decoded up front; role masks are read from the
+    shared mapping on each check.
+
+    Args:
+        path: Snapshot file
+        max_age: Reject snapshots built more than this many seconds ago
+
+    Returns:
+        Loaded snapshot
+
+    Raises:
+        OSError: If the file cannot be opened or mapped
+        ValueError: If the file is not a valid snapshot, or is too old
+    """
+    with open(path, "rb") as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    try:
+        return parse_snapshot(buffer, len(buffer), path, max_age)
+    except ValueError:
+        buffer.close()
+        raise
+
+
+def export_snapshot(path: str, db=None) -> int:
+    """
+    Compile the matrix from the database and write it as a snapshot.
+
+    Args:
+        path: Destination file
+        db: Database session. If None, a new session is opened.
+
+    Returns:
+        Number of bytes written
+    """
+    if db is not None:
+        return write_snapshot(load_matrix(db), path)
+
+    from app.db.session import SessionLocal
+
+    session = SessionLocal()
+    try:
+        return write_snapshot(load_matrix(session), path)
+    finally:
+        session.close()
+
+
+def main():
+    from app.core.config import settings
+
+    parser = argparse.ArgumentParser(description="Permission matrix snapshots")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export = commands.add_parser("export", help="Write a snapshot of the current matrix")
+    export.add_argument("--output", default=settings.AUTHZ_SNAPSHOT_PATH, help="Snapshot file to write")
+
+    inspect = commands.add_parser("inspect", help="Print a snapshot's header")
+    inspect.add_argument("path", nargs="?", default=settings.AUTHZ_SNAPSHOT_PATH)
+
+    args = parser.parse_args()
+
+    if args.command == "export":
+        if not args.output:
+            parser.error("--output is required when AUTHZ_SNAPSHOT_PATH is not set")
+        size = export_snapshot(args.output)
+        print(f"Wrote {size} bytes to {args.output}")
+    else:
+        snapshot = load_snapshot(args.path)
+        print(
+            f"{snapshot.path}: format {FORMAT_VERSION}, {len(snapshot.matrix.policy_keys)} policies, "
+            f"{len(snapshot.matrix.role_masks)} roles, built {snapshot.age:.0f}s ago"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""Read-only views of roles and their effective policies.
+
+Listing roles through ``Role.policies`` lazy-loads each role's policies with
+its own query and keeps every row as a tracked ORM object. The views here are
+built from two set-based Core queries instead, one for the roles and one for
+all of their grants (select-in loading without the ORM), and returned as
+immutable named tuples that never enter a session's identity map. Policies
+shared by several roles are the same PolicyView object.
+
+Effective policies follow the same rules as the lookups in queries: explicit
+and wildcard grants, inherited from live ancestors, soft-deleted rows skipped.
+"""
+
+from typing import TYPE_CHECKING, Dict, Iterable, List, NamedTuple, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import select, union, union_all
+from sqlalchemy.orm import Session
+
+from app.models import Permission, Policy, Role, RoleClosure, WildcardPermission
+from .queries import AncestorRole, pattern_matches_policy
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class PolicyView(NamedTuple):
+    """A live policy."""
+
+    id: UUID
+    policy_name: str
+    category: str
+    action: str
+
+
+class RoleView(NamedTuple):
+    """A live role with the policies it holds directly, by wildcard or by inheritance."""
+
+    id: UUID
+    role: str
+    policies: Tuple[PolicyView, ...]
+
+
+def _role_filter(roles: Optional[Iterable[str]]):
+    """Return the WHERE clauses restricting a listing to some role names."""
+    return () if roles is None else (Role.role.in_(list(roles)),)
+
+
+def roles_stmt(roles: Optional[Iterable[str]] = None):
+    """Build the statement listing live roles."""
+    return (
+        select(Role.id, Role.role)
+        .where(Role.deleted.is_(None), *_role_filter(roles))
+        .order_by(Role.role)
+    )
+
+
+def _grantors():
+    """
+    Return (role id, grantor id) pairs: each role with itself and its live ancestors.
+
+    The lookups in queries test one role's ancestors with a correlated
+    subquery; for a listing of many roles an equality join on this set lets
+    the database walk the role_id indexes instead.
+    """
+    return union_all(
+        select(Role.id.label("role_id"), Role.id.label("grantor_id")),
+        select(RoleClosure.descendant_id, RoleClosure.ancestor_id)
+        .join(AncestorRole, AncestorRole.id == RoleClosure.ancestor_id)
+        .where(AncestorRole.deleted.is_(None)),
+    ).subquery("grantors")
+
+
+def role_grants_stmt(roles: Optional[Iterable[str]] = None):
+    """Build the statement listing (role id, policy columns) for every effective grant."""
+    grantors = _grantors()
+    columns = (Role.id.label("role_id"), Policy.id, Policy.policy_name, Policy.category, Policy.action)
+    filters = (Role.deleted.is_(None), Policy.deleted.is_(None), *_role_filter(roles))
+    explicit = (
+        select(*columns)
+        .select_from(Role)
+        .join(grantors, grantors.c.role_id == Role.id)
+        .join(Permission, Permission.role_id == grantors.c.grantor_id)
+        .join(Policy, Policy.id == Permission.policy_id)
+        .where(Permission.deleted.is_(None), *filters)
+    )
+    wildcard = (
+        select(*columns)
+        .select_from(Role)
+        .join(grantors, grantors.c.role_id == Role.id)
+        .join(WildcardPermission, WildcardPermission.role_id == grantors.c.grantor_id)
+        .join(Policy, pattern_matches_policy())
+        .where(WildcardPermission.deleted.is_(None), *filters)
+    )
+    granted = union(explicit, wildcard).subquery()
+    return select(granted).order_by(granted.c.category, granted.c.action)
+
+
+def build_role_views(role_rows, grant_rows) -> List[RoleView]:
+    """
+    Assemble views from the rows of roles_stmt() and role_grants_stmt().
+
+    Args:
+        role_rows: (id, role) rows
+        grant_rows: (role id, policy id, policy name, category, action) rows
+
+    Returns:
+        RoleView per role, in the order of role_rows
+    """
+    policies: Dict[UUID, PolicyView] = {}
+    granted: Dict[UUID, List[PolicyView]] = {}
+    for role_id, policy_id, policy_name, category, action in grant_rows:
+        view = policies.get(policy_id)
+        if view is None:
+            view = policies[policy_id] = PolicyView(policy_id, policy_name, category, action)
+        granted.setdefault(role_id, []).append(view)
+
+    return [RoleView(role_id, role, tuple(granted.get(role_id, ()))) for role_id, role in role_rows]
+
+
+def role_views(db: Session, roles: Optional[Iterable[str]] = None) -> List[RoleView]:
+    """
+    List live roles with their effective policies in two queries.
+
+    Args:
+        db: Database session
+        roles: Role names to include. If None, every live role.
+
+    Returns:
+        RoleView per role, sorted by name; policies sorted by (category, action)
+    """
+    roles = None if roles is None else list(roles)
+    # Plain Core execution: the rows skip ORM result processing entirely
+    conn = db.connection()
+    role_rows = conn.execute(roles_stmt(roles)).all()
+    if not role_rows:
+        return []
+    return build_role_views(role_rows, conn.execute(role_grants_stmt(roles)))
+
+
+async def role_views_async(
+    db: "AsyncSession", roles: Optional[Iterable[str]] = None
+) -> List[RoleView]:
+    """Async variant of role_views()."""
+    roles = None if roles is None else list(roles)
+    conn = await db.connection()
+    role_rows = (await conn.execute(roles_stmt(roles))).all()
+    if not role_rows:
+        return []
+    return build_role_views(role_rows, await conn.execute(role_grants_stmt(roles)))
@@ -0,0 +1,58 @@
+from functools import lru_cache
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from app.core.config import get_settings
+from app.db.session import pool_options
+
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+}
+
+def to_async_url(url: str) -> str:
+    """Swap the synchronous driver in a database URL for its asyncio counterpart."""
+    parsed = make_url(url)
+    drivername = ASYNC_DRIVERS.get(parsed.drivername, parsed.drivername)
+    return parsed.set(drivername=drivername).render_as_string(hide_password=False)
+
+def async_pool_options() -> dict:
+    """Pool arguments from settings, with QueuePool swapped for its asyncio variant."""
+    options = pool_options(get_settings())
+    if options.get("poolclass") is QueuePool:
+        options["poolclass"] = AsyncAdaptedQueuePool
+    return options
+
+@lru_cache(maxsize=None)
+def get_async_engine() -> AsyncEngine:
+    """Create the asyncio engine on first use."""
+    settings = get_settings()
+    return create_async_engine(
+        to_async_url(settings.DATABASE_URL),
+        echo=settings.DEBUG,
+        **async_pool_options()
+    )
+
+@lru_cache(maxsize=None)
+def get_async_session_factory() -> async_sessionmaker:
+    """Create the AsyncSession factory on first use."""
+    return async_sessionmaker(
+        bind=get_async_engine(),
+        class_=AsyncSession,
+        autoflush=False,
+        expire_on_commit=False
+    )
+
+def __getattr__(name: str):
+    if name == "async_engine":
+        return get_async_engine()
+    if name == "AsyncSessionLocal":
+        return get_async_session_factory()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+async def get_async_db():
+    async with get_async_session_factory()() as db:
+        yield db
@@ -0,0 +1,164 @@
+"""Live connection pool statistics."""
+
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import Pool, QueuePool
+
+logger = logging.getLogger(__name__)
+
+
+class PoolMetrics:
+    """Tracks checkout latency, waits and timeouts for an engine's pool.
+
+    Checkout latency is the time spent in ``Pool.connect()``, which includes
+    waiting for a free connection, opening new ones and the pre-ping round
+    trip. A checkout counts as a wait when every pooled and overflow
+    connection was already in use when it started.
+
+    Off by default (DB_POOL_METRICS), as every checkout pays for the timing.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._engine: Optional[Engine] = None
+        self.reset()
+
+    def reset(self) -> None:
+        """Zero every counter."""
+        with self._lock:
+            self.checkouts = 0
+            self.checkins = 0
+            self.connects = 0
+            self.invalidations = 0
+            self.timeouts = 0
+            self.waits = 0
+            self.wait_seconds = 0.0
+            self.checkout_seconds = 0.0
+            self.max_checkout_seconds = 0.0
+
+    def install(self, engine: Engine) -> None:
+        """
+        Start tracking the engine's pool.
+
+        ``engine.dispose()`` replaces the pool; the replacement is
+        instrumented too, through the engine's ``engine_disposed`` event.
+
+        Args:
+            engine: Engine whose pool to instrument
+        """
+        self._engine = engine
+        pool = engine.pool
+        self._time_connect(pool)
+        if event.contains(engine, "engine_disposed", self._on_engine_disposed):
+            return
+
+        # Pool.recreate() hands these listeners on to the replacement pool
+        event.listen(pool, "checkout", self._on_checkout)
+        event.listen(pool, "checkin", self._on_checkin)
+        event.listen(pool, "connect", self._on_connect)
+        event.listen(pool, "invalidate", self._on_invalidate)
+        event.listen(engine, "engine_disposed", self._on_engine_disposed)
+
+    def _on_engine_disposed(self, engine: Engine) -> None:
+        self._time_connect(engine.pool)
+
+    def _time_connect(self, pool: Pool) -> None:
+        # Checkout latency has no pool event to hang on, so connect() is wrapped
+        if getattr(pool, "_pool_metrics_installed", False):
+            return
+
+        connect = pool.connect
+
+        def timed_connect():
+            exhausted = self._is_exhausted(pool)
+            started = time.perf_counter()
+            try:
+                return connect()
+            except exc.TimeoutError:
+                with self._lock:
+                    self.timeouts += 1
+                logger.warning(f"Connection pool exhausted: {self.pool_status()}")
+                raise
+            finally:
+                elapsed = time.perf_counter() - started
+                with self._lock:
+                    self.checkout_seconds += elapsed
+                    self.max_checkout_seconds = max(self.max_checkout_seconds, elapsed)
+                    if exhausted:
+                        self.waits += 1
+                        self.wait_seconds += elapsed
+
+        pool.connect = timed_connect
+        pool._pool_metrics_installed = True
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy):
+        with self._lock:
+            self.checkouts += 1
+
+    def _on_checkin(self, dbapi_connection, connection_record):
+        with self._lock:
+            self.checkins += 1
+
+    def _on_connect(self, dbapi_connection, connection_record):
+        with self._lock:
+            self.connects += 1
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception):
+        with self._lock:
+            self.invalidations += 1
+
+    def pool_status(self) -> Dict[str, Any]:
+        """Return the pool's live size, checked-out and overflow counts where available."""
+        if self._engine is None:
+            return {}
+
+        pool = self._engine.pool
+        status = {"pool_class": type(pool).__name__}
+        for name in ("size", "checkedin", "checkedout", "overflow"):
+            method = getattr(pool, name, None)
+            if callable(method):
+                status[name] = method()
+        timeout = getattr(pool, "timeout", None)
+        if callable(timeout):
+            status["timeout"] = timeout()
+        return status
+
+    def is_exhausted(self) -> bool:
+        """Return True if no pooled or overflow connection is free."""
+        if self._engine is None:
+            return False
+        return self._is_exhausted(self._engine.pool)
+
+    @staticmethod
+    def _is_exhausted(pool: Pool) -> bool:
+        # Only QueuePool has a bounded size to exhaust
+        if not isinstance(pool, QueuePool) or pool._max_overflow < 0:
+            return False
+        return pool.checkedout() >= pool.size() + pool._max_overflow
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the live pool status together with the counters."""
+        with self._lock:
+            counters = {
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "connects": self.connects,
+                "invalidations": self.invalidations,
+                "timeouts": self.timeouts,
+                "waits": self.waits,
+                "wait_seconds": self.wait_seconds,
+                "checkout_seconds": self.checkout_seconds,
+                "avg_checkout_ms": (
+                    self.checkout_seconds / self.checkouts * 1000 if self.checkouts else 0.0
+                ),
+                "max_checkout_ms": self.max_checkout_seconds * 1000,
+            }
+        return {**self.pool_status(), **counters}
+
+
+pool_metrics = PoolMetrics()
@@ -0,0 +1,192 @@
+"""Query count and latency instrumentation based on SQLAlchemy engine events."""
+
+import heapq
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+NO_SCOPE = ("-", "-")
+
+_scope: ContextVar[Tuple[str, str]] = ContextVar("query_profiler_scope", default=NO_SCOPE)
+
+
+class QueryProfiler:
+    """Collects query count, DB time and the slowest statements per scope.
+
+    A scope is a (stage, table) pair set with ``stage()``; queries issued
+    outside any stage are recorded under ("-", "-"). The stage label is held
+    in a context variable, so concurrent threads and tasks keep their own.
+    """
+
+    def __init__(self, slowest: int = 10, statement_length: int = 300):
+        """
+        Initialize the profiler.
+
+        Args:
+            slowest: Number of slowest statements kept
+            statement_length: Maximum characters kept per recorded statement
+        """
+        self.slowest = slowest
+        self.statement_length = statement_length
+        self.enabled = False
+        self._engines: List[Engine] = []
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Discard everything collected so far."""
+        with self._lock:
+            self._scopes: Dict[Tuple[str, str], Dict[str, float]] = {}
+            self._slowest: List[Tuple[float, int, str, str, str]] = []
+            self._sequence = 0
+
+    def _bucket(self, scope: Tuple[str, str]) -> Dict[str, float]:
+        bucket = self._scopes.get(scope)
+        if bucket is None:
+            bucket = {"queries": 0, "db_seconds": 0.0, "wall_seconds": 0.0, "calls": 0}
+            self._scopes[scope] = bucket
+        return bucket
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_profiler_start", []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["query_profiler_start"].pop()
+        elapsed = time.perf_counter() - started
+        scope = _scope.get()
+
+        with self._lock:
+            bucket = self._bucket(scope)
+            bucket["queries"] += 1
+            bucket["db_seconds"] += elapsed
+
+            self._sequence += 1
+            entry = (elapsed, self._sequence, scope[0], scope[1], statement[:self.statement_length])
+            if len(self._slowest) < self.slowest:
+                heapq.heappush(self._slowest, entry)
+            elif elapsed > self._slowest[0][0]:
+                heapq.heapreplace(self._slowest, entry)
+
+    def install(self, engine: Engine) -> None:
+        """
+        Start recording queries issued through an engine.
+
+        Args:
+            engine: Engine to instrument
+        """
+        if engine in self._engines:
+            return
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+        self._engines.append(engine)
+        self.enabled = True
+
+    def uninstall(self) -> None:
+        """Stop recording on every instrumented engine."""
+        for engine in self._engines:
+            event.remove(engine, "before_cursor_execute", self._before_cursor_execute)
+            event.remove(engine, "after_cursor_execute", self._after_cursor_execute)
+        self._engines = []
+        self.enabled = False
+
+    @contextmanager
+    def stage(self, name: str, table: Optional[str] = None):
+        """
+        Attribute queries and wall time inside the block to a stage.
+
+        Does nothing unless the profiler is installed on an engine.
+
+        Args:
+            name: Stage name (e.g. 'prepare', 'insert')
+            table: Table the stage works on
+        """
+        if not self.enabled:
+            yield
+            return
+
+        scope = (name, table or "-")
+        token = _scope.set(scope)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            _scope.reset(token)
+            with self._lock:
+                bucket = self._bucket(scope)
+                bucket["wall_seconds"] += elapsed
+                bucket["calls"] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Return the collected counters.
+
+        Returns:
+            Dictionary with totals, per-scope counters and the slowest statements
+        """
+        with self._lock:
+            scopes = [
+                {"stage": stage, "table": table, **bucket}
+                for (stage, table), bucket in sorted(self._scopes.items())
+            ]
+            slowest = [
+                {"seconds": elapsed, "stage": stage, "table": table, "statement": statement}
+                for elapsed, _, stage, table, statement in sorted(self._slowest, reverse=True)
+            ]
+
+        return {
+            "queries": sum(scope["queries"] for scope in scopes),
+            "db_seconds": sum(scope["db_seconds"] for scope in scopes),
+            "scopes": scopes,
+            "slowest": slowest,
+        }
+
+    def format_report(self) -> str:
+        """Render the collected counters as a plain-text table."""
+        snapshot = self.snapshot()
+        lines = [
+            f"{'stage':<10} {'table':<20} {'calls':>7} {'queries':>8} {'db s':>10} {'wall s':>10}",
+        ]
+        for scope in snapshot["scopes"]:
+            lines.append(
+                f"{scope['stage']:<10} {scope['table']:<20} {scope['calls']:>7} "
+                f"{scope['queries']:>8} {scope['db_seconds']:>10.4f} {scope['wall_seconds']:>10.4f}"
+            )
+        lines.append(f"total: {snapshot['queries']} queries, {snapshot['db_seconds']:.4f}s in DB")
+
+        if snapshot["slowest"]:
+            lines.append("slowest statements:")
+            for entry in snapshot["slowest"]:
+                statement = " ".join(entry["statement"].split())
+                lines.append(
+                    f"  {entry['seconds'] * 1000:9.2f} ms  [{entry['stage']}/{entry['table']}] {statement}"
+                )
+
+        return "\n".join(lines)
+
+
+query_profiler = QueryProfiler()
+
+
+def install_query_profiler(engine: Optional[Engine] = None) -> QueryProfiler:
+    """
+    Instrument the application engine, or the given one, with query_profiler.
+
+    Sessions from SessionLocal/get_db are then counted; read the counters with
+    ``query_profiler.snapshot()`` and group them with ``query_profiler.stage()``.
+
+    Args:
+        engine: Engine to instrument. Defaults to app.db.session.engine.
+
+    Returns:
+        The shared profiler
+    """
+    if engine is None:
+        from app.db.session import engine
+    query_profiler.install(engine)
+    return query_profiler
@@ -1,17 +1,94 @@
+from functools import lru_cache
+from typing import Any, Dict
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.orm import sessionmaker
-from app.core.config import settings
+from sqlalchemy.pool import NullPool, QueuePool, SingletonThreadPool, StaticPool
+from app.core.config import Settings, get_settings
+
+POOL_CLASSES = {
+    "queue": QueuePool,
+    "null": NullPool,
+    "static": StaticPool,
+    "singleton": SingletonThreadPool,
+}
+
+def pool_options(config: Settings) -> Dict[str, Any]:
+    """Build create_engine() pool arguments from settings."""
+    options: Dict[str, Any] = {
+        "pool_pre_ping": config.DB_POOL_PRE_PING,
+        "pool_recycle": config.DB_POOL_RECYCLE,
+    }
+
+    if config.DB_POOL_CLASS:
+        if config.DB_POOL_CLASS not in POOL_CLASSES:
+            raise ValueError(
+                f"Unknown DB_POOL_CLASS '{config.DB_POOL_CLASS}', expected one of: {', '.join(POOL_CLASSES)}"
+            )
+        pool_class = POOL_CLASSES[config.DB_POOL_CLASS]
+        options["poolclass"] = pool_class
+    else:
+        url = make_url(config.DATABASE_URL)
+        in_memory = url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+        pool_class = SingletonThreadPool if in_memory else QueuePool
+
+    if pool_class is QueuePool:
+        options.update(
+            pool_size=config.DB_POOL_SIZE,
+            max_overflow=config.DB_MAX_OVERFLOW,
+            pool_timeout=config.DB_POOL_TIMEOUT,
+            pool_use_lifo=config.DB_POOL_USE_LIFO,
+        )
+
+    return options
+
+@lru_cache(maxsize=None)
+def get_engine() -> Engine:
+    """Create the application engine on first use."""
+    settings = get_settings()
+    engine = create_engine(
+        settings.DATABASE_URL,
+        echo=settings.DEBUG,
+        **pool_options(settings)
+    )
+
+    if settings.DB_POOL_METRICS:
+        from app.db.pool_metrics import pool_metrics
+        pool_metrics.install(engine)
+
+    return engine
+
+@lru_cache(maxsize=None)
+def get_schema_engine(schema: str) -> Engine:
+    """
+    Return the application engine writing unqualified tables to ``schema``.
+
+    The engine shares get_engine()'s pool; only its schema_translate_map
+    differs, so one pool serves every tenant schema.
+    """
+    return get_engine().execution_options(schema_translate_map={None: schema})
+
+@lru_cache(maxsize=None)
+def get_session_factory() -> sessionmaker:
+    """Create the application sessionmaker on first use, invalidating decision_cache on commit."""
+    from app.authz.cache import decision_cache, install_invalidation
 
-engine = create_engine(
-    settings.DATABASE_URL,
-    pool_pre_ping=True,
-    echo=settings.DEBUG
-)
+    factory = sessionmaker(autoflush=False, bind=get_engine())
+    install_invalidation(decision_cache, factory)
+    return factory
 
-SessionLocal = sessionmaker(autoflush=False, bind=engine)
+def __getattr__(name: str):
+    # ``engine`` and ``SessionLocal`` are created when first imported or
+    # accessed, not when this module is loaded
+    if name == "engine":
+        return get_engine()
+    if name == "SessionLocal":
+        return get_session_factory()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def get_db():
-    db=SessionLocal()
+    db=get_session_factory()()
     try:
         yield db
     finally:
@@ -1,5 +1,8 @@
 from .policies import Policy
 from .roles import Role
 from .permissions import Permission
+from .wildcard_permissions import WildcardPermission, WILDCARD
+from .role_hierarchy import RoleParent, RoleClosure
+from .seed_state import SeedState, SeedCheckpoint
 
-# __all__ = ["Role", "Policy", "Permission"]
\ No newline at end of file
+# __all__ = ["Role", "Policy", "Permission", "WildcardPermission", "RoleParent", "RoleClosure", "SeedState", "SeedCheckpoint"]
\ No newline at end of file
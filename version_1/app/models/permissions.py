@@ -1,16 +1,16 @@
-from sqlalchemy import Column, UUID, Integer, Float, String, Text, Boolean, DateTime, Date, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, UUID, Integer, Float, String, Text, Boolean, DateTime, Date, ForeignKey, UniqueConstraint, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.db.base import Base
 from .policies import Policy
 from .roles import Role
-import uuid
+from app.db.ids import uuid7
 
 class Permission(Base):
     __tablename__ = "permissions"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, index=True, default=uuid.uuid4)
-    role_id = Column(UUID, ForeignKey(Role.id), nullable=False, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    role_id = Column(UUID, ForeignKey(Role.id), nullable=False)
     policy_id = Column(UUID, ForeignKey(Policy.id), nullable=False, index=True)
     deleted = Column(DateTime(timezone=True))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -18,6 +18,12 @@ class Permission(Base):
 
     __table_args__ = (
         UniqueConstraint('role_id', 'policy_id', name='_role_policy_unq'),
+        # Live grants of a role; role_id alone is served by the unique constraint
+        Index(
+            'ix_permissions_live_role_policy', 'role_id', 'policy_id',
+            postgresql_where=deleted.is_(None),
+            sqlite_where=deleted.is_(None),
+        ),
     )
 
     role = relationship("Role", back_populates="permissions")
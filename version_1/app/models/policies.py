@@ -1,14 +1,14 @@
-from sqlalchemy import UniqueConstraint, Column, Integer, String, Float, Boolean, DateTime, Text, Enum, ForeignKey, Date, UUID
+from sqlalchemy import UniqueConstraint, Index, Column, Integer, String, Float, Boolean, DateTime, Text, Enum, ForeignKey, Date, UUID
 from sqlalchemy.sql import func, expression
 from sqlalchemy.orm import relationship
 from app.db.base import Base
 
-import uuid
+from app.db.ids import uuid7
 
 class Policy(Base):
     __tablename__ = "policies"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, index=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
 
     # Guest Information
     policy_name = Column(String(100), nullable=False, unique=True)
@@ -18,7 +18,16 @@ class Policy(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
-    __table_args__ = (UniqueConstraint('category', 'action', name='_category_action_unq'),)
+    __table_args__ = (
+        UniqueConstraint('category', 'action', name='_category_action_unq'),
+        # Live-row lookups by (category, action); covers id for index-only scans
+        Index(
+            'ix_policies_live_category_action', 'category', 'action',
+            postgresql_where=deleted.is_(None),
+            sqlite_where=deleted.is_(None),
+            postgresql_include=['id'],
+        ),
+    )
 
     permissions = relationship(
         "Permission",
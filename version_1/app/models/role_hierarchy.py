@@ -0,0 +1,38 @@
+from sqlalchemy import Column, UUID, Integer, DateTime, ForeignKey, UniqueConstraint, Index
+from sqlalchemy.sql import func
+from app.db.base import Base
+from .roles import Role
+from app.db.ids import uuid7
+
+class RoleParent(Base):
+    """Inheritance edge: ``role_id`` inherits every grant of ``parent_id``."""
+    __tablename__ = "role_parents"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    role_id = Column(UUID, ForeignKey(Role.id), nullable=False)
+    parent_id = Column(UUID, ForeignKey(Role.id), nullable=False)
+    deleted = Column(DateTime(timezone=True))
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        UniqueConstraint('role_id', 'parent_id', name='_role_parent_unq'),
+    )
+
+
+class RoleClosure(Base):
+    """Transitive closure of live RoleParent edges.
+
+    One row per (ancestor, descendant) pair reachable through one or more
+    edges, with the length of the shortest path. A role is not stored as its
+    own ancestor. Maintained by app.authz.hierarchy.
+    """
+    __tablename__ = "role_closure"
+
+    ancestor_id = Column(UUID, ForeignKey(Role.id), primary_key=True)
+    descendant_id = Column(UUID, ForeignKey(Role.id), primary_key=True)
+    depth = Column(Integer, nullable=False)
+
+    __table_args__ = (
+        Index('ix_role_closure_descendant_ancestor', 'descendant_id', 'ancestor_id'),
+    )
\ No newline at end of file
@@ -1,18 +1,28 @@
-from sqlalchemy import Column, UUID, Integer, Float, String, Text, Boolean, DateTime, Date, ForeignKey
+from sqlalchemy import Column, Index, UUID, Integer, Float, String, Text, Boolean, DateTime, Date, ForeignKey
 from sqlalchemy.sql import func, expression
 from sqlalchemy.orm import relationship
 from app.db.base import Base
-import uuid
+from app.db.ids import uuid7
 
 class Role(Base):
     __tablename__ = "roles"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, index=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     role = Column(String(50), unique=True, nullable=False)
     deleted = Column(DateTime(timezone=True))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
+    __table_args__ = (
+        # Live-row lookups by name; covers id for index-only scans
+        Index(
+            'ix_roles_live_role', 'role',
+            postgresql_where=deleted.is_(None),
+            sqlite_where=deleted.is_(None),
+            postgresql_include=['id'],
+        ),
+    )
+
     # Relationships
     permissions = relationship(
         "Permission",
@@ -20,6 +30,21 @@ class Role(Base):
         cascade="all, delete-orphan"
     )
 
+    wildcard_permissions = relationship(
+        "WildcardPermission",
+        back_populates="role",
+        cascade="all, delete-orphan"
+    )
+
+    # Direct parents; effective grants also include every ancestor's, see RoleClosure
+    parents = relationship(
+        "Role",
+        secondary="role_parents",
+        primaryjoin="and_(Role.id == RoleParent.role_id, RoleParent.deleted.is_(None))",
+        secondaryjoin="Role.id == RoleParent.parent_id",
+        viewonly=True
+    )
+
     # Relationship to access policies directly
     policies = relationship(
         "Policy",
@@ -0,0 +1,27 @@
+from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy.sql import func
+from app.db.base import Base
+
+class SeedState(Base):
+    """Content hash of the last seed file applied, used for incremental seeding."""
+    __tablename__ = "seed_state"
+
+    source = Column(String(255), primary_key=True)
+    table_name = Column(String(100), nullable=False)
+    content_hash = Column(String(64), nullable=False)
+    row_count = Column(Integer)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+class SeedCheckpoint(Base):
+    """Progress through a seed file in chunked mode, committed with the rows it counts."""
+    __tablename__ = "seed_checkpoints"
+
+    source = Column(String(255), primary_key=True)
+    table_name = Column(String(100), nullable=False)
+    content_hash = Column(String(64), nullable=False)
+    records_done = Column(Integer, nullable=False, default=0)
+    rows_written = Column(Integer, nullable=False, default=0)
+    completed_at = Column(DateTime(timezone=True))
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -0,0 +1,37 @@
+from sqlalchemy import Column, UUID, String, DateTime, ForeignKey, UniqueConstraint, Index
+from sqlalchemy.sql import func
+from sqlalchemy.orm import relationship
+from app.db.base import Base
+from .roles import Role
+from app.db.ids import uuid7
+
+WILDCARD = "*"
+
+class WildcardPermission(Base):
+    """Grants a role every live policy matching a (category, action) pattern.
+
+    Either side may be "*": ("*", "*") covers all policies, ("USER", "*")
+    every action on a category and ("*", "READ") one action on every category.
+    Matching is resolved at check time, so new policies are covered without
+    adding rows.
+    """
+    __tablename__ = "wildcard_permissions"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    role_id = Column(UUID, ForeignKey(Role.id), nullable=False)
+    category = Column(String(100), nullable=False, default=WILDCARD, server_default=WILDCARD)
+    action = Column(String(20), nullable=False, default=WILDCARD, server_default=WILDCARD)
+    deleted = Column(DateTime(timezone=True))
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        UniqueConstraint('role_id', 'category', 'action', name='_role_category_action_unq'),
+        Index(
+            'ix_wildcard_permissions_live_category_action', 'category', 'action',
+            postgresql_where=deleted.is_(None),
+            sqlite_where=deleted.is_(None),
+        ),
+    )
+
+    role = relationship("Role", back_populates="wildcard_permissions")
\ No newline at end of file
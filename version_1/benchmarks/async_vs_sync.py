@@ -0,0 +1,93 @@
+"""Compare permission lookup throughput on the sync and async session paths.
+
+The sync path runs lookups from a thread pool, the async path runs them as
+concurrent tasks on one event loop. Both hit the database configured by
+DATABASE_URL, which must already be migrated and seeded.
+
+Usage:
+    python -m benchmarks.async_vs_sync
+    python -m benchmarks.async_vs_sync --requests 5000 --concurrency 64
+"""
+
+import argparse
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
+
+from sqlalchemy import select
+
+from app.authz.queries import has_permission, has_permission_async
+from app.db.async_session import AsyncSessionLocal, async_engine
+from app.db.session import SessionLocal
+from app.models import Policy, Role
+
+
+def load_checks(limit: int = 100) -> List[Tuple[str, str, str]]:
+    """Build a list of (role, category, action) checks from the seeded data."""
+    with SessionLocal() as db:
+        roles = db.execute(select(Role.role).limit(limit)).scalars().all()
+        policies = db.execute(select(Policy.category, Policy.action).limit(limit)).all()
+    return [(role, category, action) for role in roles for category, action in policies]
+
+
+def run_sync(checks: List[Tuple[str, str, str]], requests: int, concurrency: int) -> float:
+    """Run lookups through SessionLocal from a thread pool and return elapsed seconds."""
+
+    def worker(index: int) -> bool:
+        with SessionLocal() as db:
+            return has_permission(db, *checks[index % len(checks)])
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(worker, range(requests)))
+    return time.perf_counter() - started
+
+
+async def run_async(checks: List[Tuple[str, str, str]], requests: int, concurrency: int) -> float:
+    """Run lookups through AsyncSessionLocal as concurrent tasks and return elapsed seconds."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def worker(index: int) -> bool:
+        async with semaphore:
+            async with AsyncSessionLocal() as db:
+                return await has_permission_async(db, *checks[index % len(checks)])
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(i) for i in range(requests)))
+    elapsed = time.perf_counter() - started
+    await async_engine.dispose()
+    return elapsed
+
+
+def compare(requests: int, concurrency: int) -> Dict[str, float]:
+    """Run both paths and return their throughput in lookups per second."""
+    checks = load_checks()
+    if not checks:
+        raise SystemExit("No roles/policies found - seed the database first")
+
+    sync_elapsed = run_sync(checks, requests, concurrency)
+    async_elapsed = asyncio.run(run_async(checks, requests, concurrency))
+
+    return {
+        "requests": requests,
+        "concurrency": concurrency,
+        "sync_ops_per_sec": requests / sync_elapsed,
+        "async_ops_per_sec": requests / async_elapsed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000, help="Total lookups per path")
+    parser.add_argument("--concurrency", type=int, default=32, help="Concurrent lookups in flight")
+    args = parser.parse_args()
+
+    result = compare(args.requests, args.concurrency)
+    print(f"requests={result['requests']} concurrency={result['concurrency']}")
+    print(f"sync : {result['sync_ops_per_sec']:10.1f} lookups/s")
+    print(f"async: {result['async_ops_per_sec']:10.1f} lookups/s")
+
+
+if __name__ == "__main__":
+    main()
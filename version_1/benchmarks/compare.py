@@ -0,0 +1,43 @@
+"""Compare two benchmark result files produced by benchmarks.run or benchmarks.importtime.
+
+Usage:
+    python -m benchmarks.compare baseline.json candidate.json
+"""
+
+import argparse
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterator, Tuple
+
+
+def flatten(results: Dict[str, Any], prefix: str = "") -> Iterator[Tuple[str, float]]:
+    """Yield (dotted.path, value) for every numeric leaf."""
+    for key, value in results.items():
+        path = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            yield from flatten(value, path)
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            yield path, float(value)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("candidate", type=Path)
+    args = parser.parse_args()
+
+    baseline = json.loads(args.baseline.read_text())
+    candidate = json.loads(args.candidate.read_text())
+    sections = ("seed", "lookups", "listing", "importtime")
+    before = dict(flatten({section: baseline.get(section, {}) for section in sections}))
+    after = dict(flatten({section: candidate.get(section, {}) for section in sections}))
+
+    print(f"baseline : {baseline['meta']['commit'][:12]}  candidate: {candidate['meta']['commit'][:12]}")
+    for path in sorted(before.keys() & after.keys()):
+        old, new = before[path], after[path]
+        change = f"{(new - old) / old * 100:+8.1f}%" if old else "     n/a"
+        print(f"{path:60s} {old:14.3f} {new:14.3f} {change}")
+
+
+if __name__ == "__main__":
+    main()
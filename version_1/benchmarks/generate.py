@@ -0,0 +1,172 @@
+"""Synthetic seed data generator for benchmarks.
+
+Writes 1_policies, 2_roles and 3_permissions seed files in the same shape as
+seeds/data, at a configurable scale.
+
+Usage:
+    python -m benchmarks.generate --out /tmp/seed-bench
+    python -m benchmarks.generate --out /tmp/seed-bench --policies 10000 --roles 1000 --density 0.05
+    python -m benchmarks.generate --out /tmp/seed-bench --format ndjson --gzip
+"""
+
+import argparse
+import gzip
+import json
+import random
+from pathlib import Path
+from typing import Any, Dict, List
+
+ACTIONS = ["CREATE", "READ", "UPDATE", "DELETE", "LIST", "EXPORT", "APPROVE", "ARCHIVE"]
+
+
+def make_policies(count: int) -> List[Dict[str, Any]]:
+    """Build ``count`` policies with unique (category, action) pairs."""
+    return [
+        {
+            "policy_name": f"{ACTIONS[i % len(ACTIONS)].lower()}_resource_{i // len(ACTIONS)}",
+            "category": f"RESOURCE_{i // len(ACTIONS)}",
+            "action": ACTIONS[i % len(ACTIONS)],
+        }
+        for i in range(count)
+    ]
+
+
+def make_roles(count: int) -> List[Dict[str, Any]]:
+    """Build ``count`` roles."""
+    return [{"role": f"ROLE_{i}"} for i in range(count)]
+
+
+def make_permissions(
+    roles: List[Dict[str, Any]],
+    policies: List[Dict[str, Any]],
+    density: float,
+    wildcard_roles: int,
+    rng: random.Random,
+) -> List[Dict[str, Any]]:
+    """
+    Build permission entries granting each role a random subset of policies.
+
+    Args:
+        roles: Generated roles
+        policies: Generated policies
+        density: Fraction of policies granted to each role (0.0 - 1.0)
+        wildcard_roles: Number of leading roles granted "*" instead
+        rng: Random number generator
+
+    Returns:
+        Permission entries
+    """
+    names = [policy["policy_name"] for policy in policies]
+    per_role = max(0, min(len(names), round(len(names) * density)))
+    permissions = []
+
+    for index, role in enumerate(roles):
+        if index < wildcard_roles:
+            permissions.append({"role": role["role"], "policies": "*"})
+        elif per_role:
+            permissions.append({"role": role["role"], "policies": rng.sample(names, per_role)})
+
+    return permissions
+
+
+def write_seed_file(
+    out: Path,
+    stem: str,
+    table_name: str,
+    records: List[Dict[str, Any]],
+    fmt: str,
+    compress: bool,
+) -> Path:
+    """Write records as a .json or .ndjson seed file, optionally gzip-compressed."""
+    path = out / f"{stem}.{fmt}" if not compress else out / f"{stem}.{fmt}.gz"
+    opener = gzip.open if compress else open
+
+    with opener(path, "wt", encoding="utf-8") as f:
+        if fmt == "json":
+            json.dump({"schema": "public", "table_name": table_name, "data": records}, f)
+        else:
+            for record in records:
+                f.write(json.dumps(record))
+                f.write("\n")
+
+    return path
+
+
+def generate(
+    out: Path,
+    policies: int = 1000,
+    roles: int = 100,
+    density: float = 0.1,
+    wildcard_roles: int = 1,
+    fmt: str = "json",
+    compress: bool = False,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """
+    Generate a full synthetic seed set.
+
+    Returns:
+        Summary of what was written
+    """
+    rng = random.Random(seed)
+    out.mkdir(parents=True, exist_ok=True)
+    for stale in out.glob("[0-9]_*"):
+        stale.unlink()
+
+    policy_data = make_policies(policies)
+    role_data = make_roles(roles)
+    permission_data = make_permissions(role_data, policy_data, density, wildcard_roles, rng)
+
+    files = [
+        write_seed_file(out, "1_policies", "policies", policy_data, fmt, compress),
+        write_seed_file(out, "2_roles", "roles", role_data, fmt, compress),
+        write_seed_file(out, "3_permissions", "permissions", permission_data, fmt, compress),
+    ]
+
+    grants = sum(
+        policies if entry["policies"] == "*" else len(entry["policies"])
+        for entry in permission_data
+    )
+    return {
+        "out": str(out),
+        "files": [path.name for path in files],
+        "policies": policies,
+        "roles": roles,
+        "density": density,
+        "wildcard_roles": wildcard_roles,
+        "grants": grants,
+    }
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Register the generator options on a parser."""
+    parser.add_argument("--policies", type=int, default=1000, help="Number of policies")
+    parser.add_argument("--roles", type=int, default=100, help="Number of roles")
+    parser.add_argument("--density", type=float, default=0.1, help="Fraction of policies granted per role")
+    parser.add_argument("--wildcard-roles", type=int, default=1, help="Roles granted every policy with '*'")
+    parser.add_argument("--format", choices=["json", "ndjson"], default="json", help="Seed file format")
+    parser.add_argument("--gzip", action="store_true", help="Gzip-compress the seed files")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--out", type=Path, required=True, help="Directory to write seed files to")
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    summary = generate(
+        args.out,
+        policies=args.policies,
+        roles=args.roles,
+        density=args.density,
+        wildcard_roles=args.wildcard_roles,
+        fmt=args.format,
+        compress=args.gzip,
+        seed=args.seed,
+    )
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Import-time benchmark for the CLI entry points and core modules.
+
+Each target is imported in a fresh interpreter under ``python -X importtime``.
+Reports the median wall time of the import, the cumulative import time
+reported by the interpreter, and the slowest modules by self time. Results
+are JSON so runs can be compared with benchmarks.compare.
+
+Usage:
+    python -m benchmarks.importtime
+    python -m benchmarks.importtime --target seeds.__main__ --top 20
+    python -m benchmarks.importtime --max-ms 150 --target seeds.__main__
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from statistics import median
+from typing import Any, Dict, List, Tuple
+
+from benchmarks.run import git_commit
+
+DEFAULT_TARGETS = [
+    "seeds.__main__",
+    "seeds.core.seeder",
+    "app.core.config",
+    "app.db.session",
+    "app.models",
+    "app.authz",
+]
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int]]:
+    """
+    Parse ``-X importtime`` output.
+
+    Returns:
+        (module, self microseconds, cumulative microseconds) per import
+    """
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|", 2)
+        imports.append((module.strip(), int(self_us), int(cumulative_us)))
+    return imports
+
+
+def measure(target: str, runs: int) -> Dict[str, Any]:
+    """Import a module ``runs`` times in fresh interpreters and summarize."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [str(ROOT), os.environ.get("PYTHONPATH")])))
+    wall_ms = []
+    imports: List[Tuple[str, int, int]] = []
+
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+            capture_output=True, text=True, env=env, cwd=ROOT,
+        )
+        wall_ms.append((time.perf_counter() - started) * 1000)
+        if result.returncode != 0:
+            raise RuntimeError(f"Importing {target} failed:\n{result.stderr[-2000:]}")
+        imports = parse_importtime(result.stderr)
+
+    by_self = sorted(imports, key=lambda entry: entry[1], reverse=True)
+    return {
+        "wall_ms": median(wall_ms),
+        "import_ms": sum(self_us for _, self_us, _ in imports) / 1000,
+        "modules": len(imports),
+        "slowest": {module: self_us / 1000 for module, self_us, _ in by_self},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--target", action="append", help="Module to import (repeatable)")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per target")
+    parser.add_argument("--top", type=int, default=10, help="Slowest modules listed per target")
+    parser.add_argument("--max-ms", type=float, help="Fail if any target's median wall time exceeds this")
+    parser.add_argument("--output", type=Path, help="Write JSON results here instead of stdout")
+    args = parser.parse_args()
+
+    baseline = measure("sys", args.runs)["wall_ms"]
+    results = {}
+    for target in args.target or DEFAULT_TARGETS:
+        result = measure(target, args.runs)
+        result["slowest"] = dict(list(result["slowest"].items())[:args.top])
+        results[target] = result
+        print(
+            f"{target:24s} {result['wall_ms']:8.1f} ms wall  {result['import_ms']:8.1f} ms imports  "
+            f"{result['modules']:5d} modules",
+            file=sys.stderr,
+        )
+
+    report = {
+        "meta": {"commit": git_commit(), "python": sys.version.split()[0], "interpreter_ms": baseline},
+        "importtime": results,
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(output)
+    else:
+        print(output)
+
+    if args.max_ms is not None:
+        slow = [target for target, result in results.items() if result["wall_ms"] > args.max_ms]
+        if slow:
+            print(f"Over {args.max_ms:.0f} ms: {', '.join(slow)}", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,13 @@
-from .core.seeder import Seeder
 from .constants import MODEL_MAPPING
 
-__all__ = ['Seeder', 'MODEL_MAPPING']
\ No newline at end of file
+
+def __getattr__(name: str):
+    # Importing the package (e.g. for ``python -m seeds``) does not load the
+    # seeder and the ORM until they are used
+    if name == "Seeder":
+        from .core.seeder import Seeder
+        return Seeder
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ['Seeder', 'MODEL_MAPPING']
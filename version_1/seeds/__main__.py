@@ -3,13 +3,25 @@
 Usage:
     python -m seeds
     python -m seeds --model Policy,Role
+    python -m seeds --plan
+    python -m seeds --loader=copy
+    python -m seeds --incremental
+    python -m seeds --workers 4
+    python -m seeds --schemas 'tenant_*' --workers 8
+    python -m seeds --commit-every 50000
+    python -m seeds --commit-every 50000 --resume
+    python -m seeds --profile
+    python -m seeds --profile=seed-profile.json
+    python -m seeds --export-snapshot=/var/run/rbac/matrix.snap
 """
 
 import argparse
+import json
 import sys
 from pathlib import Path
 
-from seeds.core.seeder import Seeder
+from seeds.constants import BULK_LOADER_NAMES
+from seeds.utils.loader import DEFAULT_CHUNK_SIZE
 from seeds.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -30,18 +42,120 @@ def parse_arguments() -> argparse.Namespace:
         help="Run without committing changes to database",
         action="store_true"
     )
+    parser.add_argument(
+        "--plan",
+        help="Validate seed files and print the rows that would be written, without a database",
+        action="store_true"
+    )
+    parser.add_argument(
+        "--loader",
+        help="Bulk insert strategy; 'copy' uses PostgreSQL COPY and falls back to 'core' elsewhere",
+        choices=BULK_LOADER_NAMES,
+        default="core"
+    )
+    parser.add_argument(
+        "--chunk-size",
+        help="Number of records read, prepared and inserted at a time",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE
+    )
+    parser.add_argument(
+        "--incremental",
+        help="Skip unchanged seed files and apply only inserts, updates and soft-deletes",
+        action="store_true"
+    )
+    parser.add_argument(
+        "--commit-every",
+        help="Commit every N records and checkpoint progress per seed file (default: one all-or-nothing transaction)",
+        type=int,
+        metavar="N"
+    )
+    parser.add_argument(
+        "--resume",
+        help="Continue a chunked seed from its last checkpoint",
+        action="store_true"
+    )
+    parser.add_argument(
+        "--schemas",
+        help="Comma-separated schemas or patterns (e.g. 'tenant_*') to seed every file into, one transaction each",
+        type=str
+    )
+    parser.add_argument(
+        "--workers",
+        help="Number of tables (or, with --schemas, schemas) seeded concurrently; each commits separately when > 1",
+        type=int,
+        default=1
+    )
+    parser.add_argument(
+        "--profile",
+        help="Record query count and DB time per stage/table and write a JSON report (default: seed-profile.json)",
+        nargs="?",
+        const="seed-profile.json",
+        metavar="PATH"
+    )
+    parser.add_argument(
+        "--export-snapshot",
+        help="Write a permission matrix snapshot after seeding (default: AUTHZ_SNAPSHOT_PATH)",
+        nargs="?",
+        const="",
+        metavar="PATH"
+    )
     return parser.parse_args()
 
 def main():
     """Main entry point for the seeder."""
     args = parse_arguments()
 
+    # Imported here so --help and argument errors return without loading the ORM
+    from app.db.profiling import install_query_profiler, query_profiler
+    from seeds.core.seeder import Seeder
+
     models = [m.strip() for m in args.model.split(",")] if args.model else None
+    schemas = [s.strip() for s in args.schemas.split(",")] if args.schemas else None
+
+    seeder = Seeder(
+        models=models,
+        dry_run=args.dry_run,
+        loader=args.loader,
+        chunk_size=args.chunk_size,
+        incremental=args.incremental,
+        workers=args.workers,
+        commit_every=args.commit_every,
+        resume=args.resume,
+        schemas=schemas
+    )
+
+    if args.plan:
+        plan = seeder.plan()
+        print(plan.format_report())
+        if not plan.ok:
+            logger.error("Seed plan found problems")
+            sys.exit(1)
+        logger.info("Seed plan is valid")
+        return
 
     logger.info(f"Starting seeder for models: {models or 'all'}")
 
-    seeder = Seeder(models=models, dry_run=args.dry_run)
-    seeder.run()
+    if args.profile:
+        install_query_profiler()
+
+    try:
+        seeder.run()
+    finally:
+        if args.profile:
+            Path(args.profile).write_text(json.dumps(query_profiler.snapshot(), indent=2))
+            logger.info(f"Profile summary:\n{query_profiler.format_report()}")
+            logger.info(f"Profile report written to {args.profile}")
+
+    if args.export_snapshot is not None and schemas:
+        logger.warning("--export-snapshot reads the default schema, skipping it for --schemas")
+    elif args.export_snapshot is not None and not args.dry_run:
+        from app.authz.snapshot import export_snapshot
+        from app.core.config import settings
+
+        path = args.export_snapshot or settings.AUTHZ_SNAPSHOT_PATH or "matrix.snap"
+        size = export_snapshot(path)
+        logger.info(f"Permission snapshot ({size} bytes) written to {path}")
 
     logger.info("Seeding process completed")
 
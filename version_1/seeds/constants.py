@@ -4,7 +4,29 @@ MODEL_MAPPING={
     "policies": "1_policies",
     "roles": "2_roles",
     "permissions": "3_permissions",
+    "role_parents": "4_role_parents",
 }
 
-# Seeding order 
-SEED_ORDER = ["policies", "roles", "permissions"]
\ No newline at end of file
+# Schema seed files declare to mean the connection's default schema; files
+# declaring any other schema are written there through schema_translate_map
+DEFAULT_SCHEMA = "public"
+
+# Natural keys used to match seed records against existing rows
+NATURAL_KEYS = {
+    "policies": ("policy_name",),
+    "roles": ("role",),
+    "permissions": ("role_id", "policy_id"),
+    "wildcard_permissions": ("role_id", "category", "action"),
+    "role_parents": ("role_id", "parent_id"),
+}
+
+# Other unique keys of a table. A record whose natural key is new but which
+# matches an existing row on one of these is applied to that row, e.g. a
+# policy renamed without changing its category and action.
+SECONDARY_KEYS = {
+    "policies": (("category", "action"),),
+}
+
+# Names accepted by seeds.core.bulk.get_bulk_loader(), kept here so the CLI
+# can validate --loader without importing SQLAlchemy
+BULK_LOADER_NAMES = ("core", "orm", "copy")
@@ -0,0 +1,451 @@
+"""Bulk insert strategies used by the seeder."""
+
+import io
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import insert, inspect, or_, select, text, tuple_, update
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+
+from seeds.constants import NATURAL_KEYS, SECONDARY_KEYS
+from seeds.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+COPY_CHUNK_SIZE = 10000
+
+
+def to_row_mappings(model, records: List[Any]) -> List[Dict[str, Any]]:
+    """
+    Convert prepared records into column mappings for ``model``.
+
+    ORM instances are read through their mapped columns. Columns left unset
+    that carry a Python-side scalar or callable default get it applied here,
+    so the rows can be written without going through the ORM.
+
+    Args:
+        model: Mapped model class
+        records: Model instances or column mappings
+
+    Returns:
+        List of column mappings
+    """
+    mapper = inspect(model)
+    columns = [attr.columns[0] for attr in mapper.column_attrs]
+    rows = []
+
+    for record in records:
+        if isinstance(record, dict):
+            row = dict(record)
+        else:
+            row = {
+                column.key: getattr(record, column.key)
+                for column in columns
+                if getattr(record, column.key) is not None
+            }
+
+        for column in columns:
+            if row.get(column.key) is None and column.default is not None:
+                default = column.default
+                if default.is_callable:
+                    row[column.key] = default.arg(None)
+                elif default.is_scalar:
+                    row[column.key] = default.arg
+
+        rows.append(row)
+
+    return rows
+
+
+class BulkLoader(ABC):
+    """Abstract base class for bulk insert strategies."""
+
+    name = None
+
+    @abstractmethod
+    def load(self, db: Session, model, records: List[Any]) -> int:
+        """
+        Write a chunk of prepared records.
+
+        Args:
+            db: Database session
+            model: Mapped model class
+            records: Model instances or column mappings
+
+        Returns:
+            Number of records written
+        """
+        pass
+
+    def finish(self, db: Session, model) -> None:
+        """Called once after every chunk of a table has been loaded."""
+        pass
+
+
+class OrmBulkLoader(BulkLoader):
+    """Inserts records through the ORM bulk APIs."""
+
+    name = "orm"
+
+    def load(self, db: Session, model, records: List[Any]) -> int:
+        """
+        Insert records into the model's table.
+
+        Args:
+            db: Database session
+            model: Mapped model class
+            records: Model instances or column mappings
+
+        Returns:
+            Number of records written
+        """
+        if isinstance(records[0], dict):
+            db.bulk_insert_mappings(model, records)
+        else:
+            db.bulk_save_objects(records)
+        return len(records)
+
+
+class CoreInsertLoader(BulkLoader):
+    """Inserts plain column mappings through a Core ``insert()`` executemany.
+
+    Rows skip the ORM unit of work entirely. The dialect batches them itself:
+    multi-row VALUES pages through insertmanyvalues where supported, the
+    DBAPI's executemany elsewhere.
+    """
+
+    name = "core"
+
+    def load(self, db: Session, model, records: List[Any]) -> int:
+        """
+        Insert records into the model's table.
+
+        Args:
+            db: Database session
+            model: Mapped model class
+            records: Column mappings sharing the same keys, or model instances
+
+        Returns:
+            Number of records written
+        """
+        rows = records if isinstance(records[0], dict) else to_row_mappings(model, records)
+        db.execute(insert(inspect(model).local_table), rows)
+        return len(rows)
+
+
+class PostgresCopyLoader(BulkLoader):
+    """Streams records through COPY into a staging table, then merges them.
+
+    The merge is a plain ``INSERT ... SELECT`` into the target table, so a
+    row violating a unique constraint such as ``_role_policy_unq`` raises
+    IntegrityError and fails the table, as with the Core loader.
+    """
+
+    name = "copy"
+
+    def __init__(self, chunk_size: int = COPY_CHUNK_SIZE, skip_conflicts: bool = False):
+        """
+        Initialize the loader.
+
+        Args:
+            chunk_size: Number of rows sent per COPY call
+            skip_conflicts: If True, merge with ``ON CONFLICT DO NOTHING`` and
+                only log how many conflicting rows were skipped
+        """
+        self.chunk_size = chunk_size
+        self.skip_conflicts = skip_conflicts
+
+    @staticmethod
+    def supports(db: Session) -> bool:
+        """Return True if the session is bound to PostgreSQL through psycopg2."""
+        dialect = db.get_bind().dialect
+        return dialect.name == "postgresql" and dialect.driver == "psycopg2"
+
+    @staticmethod
+    def encode_value(value: Any) -> str:
+        """Encode a value for COPY's text format."""
+        if value is None:
+            return "\\N"
+        if isinstance(value, bool):
+            return "t" if value else "f"
+        return (
+            str(value)
+            .replace("\\", "\\\\")
+            .replace("\t", "\\t")
+            .replace("\n", "\\n")
+            .replace("\r", "\\r")
+        )
+
+    def load(self, db: Session, model, records: List[Any]) -> int:
+        """
+        Copy records into the model's table.
+
+        Args:
+            db: Database session bound to PostgreSQL/psycopg2
+            model: Mapped model class
+            records: Model instances or column mappings
+
+        Returns:
+            Number of records written to the target table
+
+        Raises:
+            IntegrityError: If a record conflicts with an existing row and
+                skip_conflicts is off
+        """
+        rows = to_row_mappings(model, records)
+        table = model.__table__
+        quote = db.get_bind().dialect.identifier_preparer.quote
+
+        column_names = [column.name for column in table.columns if any(
+            column.name in row for row in rows
+        )]
+        # Raw SQL bypasses schema_translate_map, so apply it by hand
+        translate = db.connection().get_execution_options().get("schema_translate_map") or {}
+        schema = translate.get(table.schema, table.schema)
+        target = quote(table.name) if schema is None else f"{quote(schema)}.{quote(table.name)}"
+        stage = quote(f"_seed_stage_{table.name}")
+        columns = ", ".join(quote(name) for name in column_names)
+
+        db.execute(text(
+            f"CREATE TEMP TABLE IF NOT EXISTS {stage} "
+            f"(LIKE {target} INCLUDING DEFAULTS) ON COMMIT DROP"
+        ))
+        db.execute(text(f"TRUNCATE {stage}"))
+
+        cursor = db.connection().connection.dbapi_connection.cursor()
+        try:
+            for start in range(0, len(rows), self.chunk_size):
+                buffer = io.StringIO()
+                for row in rows[start:start + self.chunk_size]:
+                    buffer.write("\t".join(
+                        self.encode_value(row.get(name)) for name in column_names
+                    ))
+                    buffer.write("\n")
+                buffer.seek(0)
+                cursor.copy_expert(f"COPY {stage} ({columns}) FROM STDIN", buffer)
+        finally:
+            cursor.close()
+
+        on_conflict = " ON CONFLICT DO NOTHING" if self.skip_conflicts else ""
+        result = db.execute(text(
+            f"INSERT INTO {target} ({columns}) "
+            f"SELECT {columns} FROM {stage}{on_conflict}"
+        ))
+        inserted = result.rowcount
+
+        skipped = len(rows) - inserted
+        if skipped:
+            logger.warning(f"Skipped {skipped} conflicting rows while copying into '{table.name}'")
+
+        return inserted
+
+
+class UpsertLoader(BulkLoader):
+    """Applies only the differences between seed records and existing rows.
+
+    Records are matched on the table's natural key (see NATURAL_KEYS). New
+    keys are inserted, changed or soft-deleted rows are updated and revived
+    through ``INSERT ... ON CONFLICT DO UPDATE``, unchanged rows are left
+    alone. A record with a new natural key that matches an existing row on
+    one of the table's SECONDARY_KEYS updates that row instead, so renaming
+    a policy keeps its id and grants. Once the whole table has been loaded,
+    live rows whose key was not in the seed data are soft-deleted.
+    """
+
+    name = "upsert"
+
+    def __init__(self):
+        self.seen_keys: Dict[str, Set[Tuple[Any, ...]]] = {}
+        self.counts: Dict[str, Dict[str, int]] = {}
+
+    @staticmethod
+    def dialect_insert(db: Session):
+        """Return the dialect-specific insert() supporting ON CONFLICT."""
+        dialect = db.get_bind().dialect.name
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        elif dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            raise NotImplementedError(f"Upsert is not supported for '{dialect}'")
+        return insert
+
+    def load(self, db: Session, model, records: List[Any]) -> int:
+        table = model.__table__
+        key_names = NATURAL_KEYS[table.name]
+        key_columns = [table.c[name] for name in key_names]
+        rows = to_row_mappings(model, records)
+
+        seen = self.seen_keys.setdefault(table.name, set())
+        counts = self.counts.setdefault(
+            table.name, {"inserted": 0, "updated": 0, "unchanged": 0, "deleted": 0}
+        )
+
+        rows_by_key = {}
+        for row in rows:
+            rows_by_key[tuple(row.get(name) for name in key_names)] = row
+        seen.update(rows_by_key)
+
+        value_names = sorted({
+            name for row in rows for name in row
+            if name not in key_names and name != "id"
+        })
+        if len(key_columns) == 1:
+            key_filter = key_columns[0].in_([key[0] for key in rows_by_key])
+        else:
+            key_filter = tuple_(*key_columns).in_(list(rows_by_key))
+
+        existing = {
+            tuple(row[:len(key_names)]): row[len(key_names):]
+            for row in db.execute(
+                select(*key_columns, table.c.deleted, *(table.c[name] for name in value_names))
+                .where(key_filter)
+            )
+        }
+
+        rekeyed = self.update_secondary_matches(
+            db, table, [row for key, row in rows_by_key.items() if key not in existing]
+        )
+
+        changed = []
+        for key, row in rows_by_key.items():
+            current = existing.get(key)
+            if id(row) in rekeyed:
+                counts["updated"] += 1
+                continue
+            if current is None:
+                counts["inserted"] += 1
+            elif current[0] is not None or any(
+                row.get(name) != value for name, value in zip(value_names, current[1:])
+            ):
+                counts["updated"] += 1
+            else:
+                counts["unchanged"] += 1
+                continue
+            changed.append(row)
+
+        if not changed:
+            return len(rekeyed)
+
+        insert = self.dialect_insert(db)
+        statement = insert(table)
+        update_columns = {name: statement.excluded[name] for name in value_names}
+        update_columns["deleted"] = None
+        if "updated_at" in table.c:
+            update_columns["updated_at"] = func.now()
+
+        statement = statement.on_conflict_do_update(
+            index_elements=key_columns,
+            set_=update_columns,
+            where=or_(
+                table.c.deleted.isnot(None),
+                *(table.c[name].is_distinct_from(statement.excluded[name]) for name in value_names)
+            ),
+        )
+
+        column_names = {name for row in changed for name in row}
+        db.execute(statement, [
+            {name: row.get(name) for name in column_names} for row in changed
+        ])
+        return len(changed) + len(rekeyed)
+
+    @staticmethod
+    def update_secondary_matches(db: Session, table, rows: List[Dict[str, Any]]) -> Set[int]:
+        """
+        Apply records to the existing rows they match on a secondary key.
+
+        Args:
+            db: Database session
+            table: Target table
+            rows: Column mappings whose natural key matched no existing row
+
+        Returns:
+            ``id()`` of every mapping written this way
+        """
+        handled: Set[int] = set()
+        for key_names in SECONDARY_KEYS.get(table.name, ()):
+            by_key = {}
+            for row in rows:
+                key = tuple(row.get(name) for name in key_names)
+                # NULLs never conflict in a unique constraint
+                if id(row) not in handled and None not in key:
+                    by_key[key] = row
+            if not by_key:
+                continue
+
+            key_columns = [table.c[name] for name in key_names]
+            matches = db.execute(
+                select(table.c.id, *key_columns).where(tuple_(*key_columns).in_(list(by_key)))
+            ).all()
+            for match in matches:
+                row = by_key[tuple(match[1:])]
+                values = {name: value for name, value in row.items() if name != "id"}
+                values["deleted"] = None
+                if "updated_at" in table.c:
+                    values["updated_at"] = func.now()
+                db.execute(update(table).where(table.c.id == match.id).values(**values))
+                handled.add(id(row))
+        return handled
+
+    def finish(self, db: Session, model) -> None:
+        """Soft-delete live rows whose natural key was not in the seed data."""
+        table = model.__table__
+        key_names = NATURAL_KEYS[table.name]
+        seen = self.seen_keys.pop(table.name, set())
+
+        stale_ids = [
+            row.id for row in db.execute(
+                select(table.c.id, *(table.c[name] for name in key_names))
+                .where(table.c.deleted.is_(None))
+            )
+            if tuple(row[1:]) not in seen
+        ]
+
+        for start in range(0, len(stale_ids), COPY_CHUNK_SIZE):
+            db.execute(
+                update(table)
+                .where(table.c.id.in_(stale_ids[start:start + COPY_CHUNK_SIZE]))
+                .values(deleted=func.now())
+            )
+
+        counts = self.counts.pop(table.name, {})
+        counts["deleted"] = len(stale_ids)
+        logger.info(
+            f"Incremental seed of '{table.name}': "
+            + ", ".join(f"{count} {action}" for action, count in counts.items())
+        )
+
+
+BULK_LOADERS = {
+    CoreInsertLoader.name: CoreInsertLoader,
+    OrmBulkLoader.name: OrmBulkLoader,
+    PostgresCopyLoader.name: PostgresCopyLoader,
+}
+
+
+def get_bulk_loader(name: str, db: Optional[Session] = None):
+    """
+    Return a bulk loader instance by name.
+
+    The COPY loader falls back to the Core loader on non-PostgreSQL backends.
+
+    Args:
+        name: Loader name ('core', 'orm' or 'copy')
+        db: Session used to check backend support
+
+    Returns:
+        Bulk loader instance
+    """
+    loader_class = BULK_LOADERS.get(name)
+    if loader_class is None:
+        raise ValueError(f"Unknown loader '{name}', expected one of: {', '.join(BULK_LOADERS)}")
+
+    if loader_class is PostgresCopyLoader and db is not None and not PostgresCopyLoader.supports(db):
+        logger.warning(
+            f"COPY loader requires PostgreSQL/psycopg2, "
+            f"falling back to Core loader for '{db.get_bind().dialect.name}'"
+        )
+        return CoreInsertLoader()
+
+    return loader_class()
@@ -0,0 +1,163 @@
+"""Checkpointed, resumable seeding.
+
+In chunked mode a table is committed every ``commit_every`` records instead
+of once at the end. Each commit also stores, per seed file, how many records
+have been applied (``seed_checkpoints``), in the same transaction as the rows
+themselves, so the checkpoint never runs ahead of or behind the data. A rerun
+with resume enabled skips the records already applied and continues from the
+last commit.
+"""
+
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional
+
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+
+from app.models import SeedCheckpoint
+from seeds.utils.loader import SeedSource
+from seeds.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class CheckpointTracker:
+    """Commits one table's progress every ``commit_every`` records.
+
+    Feed the table's chunks through chunks(), call chunk_done() once each
+    chunk has been inserted and table_done() once the table is finished.
+    """
+
+    def __init__(self, db: Session, table_name: str, commit_every: int, resume: bool = False):
+        """
+        Initialize the tracker.
+
+        Args:
+            db: Database session the table is seeded in
+            table_name: Table being seeded
+            commit_every: Records applied between commits
+            resume: If True, continue from existing checkpoints; otherwise
+                the table's checkpoints are reset
+        """
+        self.db = db
+        self.table_name = table_name
+        self.commit_every = max(1, commit_every)
+        self.resume = resume
+        # True once a checkpoint with progress was found, so the table still
+        # needs finishing even if no records are left to apply
+        self.resumed = False
+        self.progress: Dict[str, Dict[str, Any]] = {}
+        self.current: Optional[str] = None
+        self.pending = 0
+
+    def start(self, source: SeedSource) -> Dict[str, Any]:
+        """
+        Load or create the checkpoint of a seed file.
+
+        Raises:
+            ValueError: If resuming and the file changed since its checkpoint
+        """
+        name = source.path.name
+        content_hash = source.content_hash()
+        row = self.db.execute(
+            select(
+                SeedCheckpoint.content_hash, SeedCheckpoint.records_done,
+                SeedCheckpoint.rows_written, SeedCheckpoint.completed_at,
+            ).where(SeedCheckpoint.source == name)
+        ).first()
+
+        if row is not None and self.resume:
+            if row.content_hash != content_hash:
+                raise ValueError(
+                    f"{name} changed since its checkpoint; reseed '{self.table_name}' without resuming"
+                )
+            if row.records_done and row.completed_at is None:
+                self.resumed = True
+            progress = {
+                "records_done": row.records_done,
+                "rows_written": row.rows_written,
+                "completed": row.completed_at is not None,
+            }
+        else:
+            if row is not None:
+                self.db.execute(delete(SeedCheckpoint).where(SeedCheckpoint.source == name))
+            self.db.execute(insert(SeedCheckpoint).values(
+                source=name, table_name=self.table_name, content_hash=content_hash,
+                records_done=0, rows_written=0,
+            ))
+            progress = {"records_done": 0, "rows_written": 0, "completed": False}
+
+        self.progress[name] = progress
+        return progress
+
+    def chunks(self, sources: List[SeedSource], chunk_size: int) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield the chunks still to be applied, skipping checkpointed records.
+
+        Chunks are cut short where the next commit is due, so every commit
+        lands exactly on a ``commit_every`` boundary. This relies on
+        chunk_done() being called before the next chunk is requested.
+
+        Args:
+            sources: Seed files of the table
+            chunk_size: Maximum number of records per chunk
+
+        Yields:
+            Lists of records
+        """
+        for source in sources:
+            progress = self.start(source)
+            name = source.path.name
+            if progress["completed"]:
+                logger.info(f"Skipping {name}, completed by an earlier run")
+                continue
+            if progress["records_done"]:
+                logger.info(f"Resuming {name} after {progress['records_done']} records")
+            else:
+                logger.info(f"Streaming data from {name}")
+
+            self.current = name
+            records = islice(source.iter_records(), progress["records_done"], None)
+            while True:
+                chunk = list(islice(records, min(chunk_size, self.commit_every - self.pending)))
+                if not chunk:
+                    break
+                yield chunk
+        self.current = None
+
+    def chunk_done(self, records: int, rows: int) -> None:
+        """
+        Count a chunk of the current file as applied, committing if due.
+
+        Args:
+            records: Records in the chunk
+            rows: Rows written for them
+        """
+        progress = self.progress[self.current]
+        progress["records_done"] += records
+        progress["rows_written"] += rows
+        self.pending += records
+        if self.pending >= self.commit_every:
+            self.commit()
+
+    def commit(self, completed: bool = False) -> None:
+        """Write the checkpoints and commit them with the rows they count."""
+        for name, progress in self.progress.items():
+            values = {
+                "records_done": progress["records_done"],
+                "rows_written": progress["rows_written"],
+            }
+            if completed:
+                values["completed_at"] = func.now()
+            self.db.execute(update(SeedCheckpoint).where(SeedCheckpoint.source == name).values(**values))
+        self.db.commit()
+        self.pending = 0
+        logger.info(
+            f"Checkpoint for '{self.table_name}': "
+            + ", ".join(f"{name} {progress['records_done']} records" for name, progress in self.progress.items())
+        )
+
+    def table_done(self) -> None:
+        """Mark every file of the table completed and commit."""
+        self.commit(completed=True)
@@ -0,0 +1,81 @@
+"""Table dependency graph derived from model foreign keys."""
+
+from typing import Dict, Iterable, List, Set
+
+import app.models  # noqa: F401 - registers every model on Base.metadata
+from app.db.base import Base
+
+
+def build_dependency_graph(table_names: Iterable[str]) -> Dict[str, Set[str]]:
+    """
+    Map each table to the tables it references through foreign keys.
+
+    Only dependencies among ``table_names`` are kept, so a table whose parent
+    is not being seeded in this run is treated as independent. Self-references
+    are ignored.
+
+    Args:
+        table_names: Tables being seeded
+
+    Returns:
+        Mapping of table name to the set of parent table names
+    """
+    selected = set(table_names)
+    graph = {}
+
+    for table_name in selected:
+        table = Base.metadata.tables.get(table_name)
+        parents = set()
+        if table is not None:
+            parents = {
+                foreign_key.column.table.name
+                for foreign_key in table.foreign_keys
+            }
+        graph[table_name] = (parents & selected) - {table_name}
+
+    return graph
+
+
+def dependency_order(graph: Dict[str, Set[str]]) -> List[str]:
+    """
+    Return tables in an order where every parent precedes its children.
+
+    Ties are broken by Base.metadata.sorted_tables so the order is stable.
+
+    Args:
+        graph: Mapping from build_dependency_graph()
+
+    Returns:
+        Topologically sorted table names
+
+    Raises:
+        ValueError: If the graph contains a cycle
+    """
+    rank = {table.name: index for index, table in enumerate(Base.metadata.sorted_tables)}
+    pending = {table: set(parents) for table, parents in graph.items()}
+    ordered = []
+
+    while pending:
+        ready = sorted(
+            (table for table, parents in pending.items() if not parents),
+            key=lambda table: (rank.get(table, len(rank)), table),
+        )
+        if not ready:
+            raise ValueError(f"Foreign key cycle between tables: {', '.join(sorted(pending))}")
+
+        for table in ready:
+            ordered.append(table)
+            del pending[table]
+        for parents in pending.values():
+            parents.difference_update(ready)
+
+    return ordered
+
+
+def dependents(graph: Dict[str, Set[str]]) -> Dict[str, Set[str]]:
+    """Invert a dependency graph into a mapping of table to child tables."""
+    children = {table: set() for table in graph}
+    for table, parents in graph.items():
+        for parent in parents:
+            children[parent].add(table)
+    return children
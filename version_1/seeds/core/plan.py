@@ -0,0 +1,430 @@
+"""Offline seed validation and planning.
+
+Checks seed files against rules compiled from the model tables (string
+lengths, NOT NULL columns, unique constraints), resolves the role and policy
+names that permissions and role parents refer to across files, and counts
+the rows a seed into an empty database would write, all without a database
+connection. Records are streamed, so memory grows with the number of unique
+keys rather than with file size.
+"""
+
+from functools import lru_cache
+from itertools import chain
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import String, UniqueConstraint
+
+from app.authz.hierarchy import compute_ancestors
+from app.db.base import Base
+from seeds.preparers.permission import PermissionPreparer
+from seeds.utils.loader import DEFAULT_CHUNK_SIZE, SeedSource
+
+DEFAULT_MAX_ERRORS = 20
+
+# Tables written as a side effect of seeding another table
+DERIVED_TABLES = {
+    "wildcard_permissions": "permissions",
+    "role_closure": "role_parents",
+}
+
+
+class TableSchema:
+    """Validation rules of one table, compiled from its model."""
+
+    def __init__(self, table_name: str):
+        """
+        Compile the rules of a table.
+
+        Args:
+            table_name: Table on Base.metadata
+        """
+        table = Base.metadata.tables[table_name]
+        self.table_name = table_name
+        self.lengths = {
+            column.name: column.type.length
+            for column in table.columns
+            if isinstance(column.type, String) and column.type.length
+        }
+        # Columns a record must supply: NOT NULL without any default
+        self.required = {
+            column.name
+            for column in table.columns
+            if not column.nullable
+            and not column.primary_key
+            and not column.foreign_keys
+            and column.default is None
+            and column.server_default is None
+        }
+        self.unique = [
+            tuple(column.name for column in constraint.columns)
+            for constraint in table.constraints
+            if isinstance(constraint, UniqueConstraint)
+        ]
+        # Columns a seed record can supply directly, with their rules
+        self.fields = sorted(self.required | set(self.lengths))
+        self.rules = [(field, self.lengths.get(field), field in self.required) for field in self.fields]
+
+    def is_valid(self, record: Dict[str, Any]) -> bool:
+        """Return True if the record passes check(); the fast path for valid records."""
+        get = record.get
+        for field, length, required in self.rules:
+            value = get(field)
+            if value is None:
+                if required:
+                    return False
+            elif length is not None and (value.__class__ is not str or len(value) > length):
+                return False
+        return True
+
+    def columns(self, chunk: List[Dict[str, Any]]) -> Optional[Dict[str, List[Any]]]:
+        """
+        Validate a chunk column by column.
+
+        Each rule is one pass over a column with C-level builtins, which is
+        much faster than checking record by record when nothing is wrong.
+
+        Args:
+            chunk: Seed records
+
+        Returns:
+            Column values by field if every record passes check(), else None
+        """
+        columns = {}
+        for field, length, required in self.rules:
+            values = columns[field] = [record.get(field) for record in chunk]
+            if None in values:
+                if required:
+                    return None
+                values = [value for value in values if value is not None]
+            if length is None or not values:
+                continue
+            if set(map(type, values)) != {str} or max(map(len, values)) > length:
+                return None
+        return columns
+
+    def check(self, record: Dict[str, Any], fields: Iterable[str]) -> List[str]:
+        """
+        Check the given fields of a record against NOT NULL and length rules.
+
+        Args:
+            record: Seed record
+            fields: Columns the record provides
+
+        Returns:
+            Error messages, empty if the record is valid
+        """
+        errors = []
+        for field in fields:
+            value = record.get(field)
+            if value is None:
+                if field in self.required:
+                    errors.append(f"'{field}' is required")
+                continue
+            length = self.lengths.get(field)
+            if length is None:
+                continue
+            if not isinstance(value, str):
+                errors.append(f"'{field}' must be a string, got {type(value).__name__}")
+            elif len(value) > length:
+                errors.append(f"'{field}' is {len(value)} characters, the limit is {length}")
+        return errors
+
+
+@lru_cache(maxsize=None)
+def compile_schema(table_name: str) -> TableSchema:
+    """Return the cached validation rules of a table."""
+    return TableSchema(table_name)
+
+
+class SeedPlan:
+    """Outcome of planning a seed: rows per table and the problems found."""
+
+    def __init__(self, max_errors: int = DEFAULT_MAX_ERRORS):
+        """
+        Initialize an empty plan.
+
+        Args:
+            max_errors: Error messages kept per table; the rest are only counted
+        """
+        self.max_errors = max_errors
+        self.records: Dict[str, int] = {}
+        self.rows: Dict[str, int] = {}
+        self.errors: Dict[str, List[str]] = {}
+        self.error_counts: Dict[str, int] = {}
+        # Seeded tables reported on; None for every planned table
+        self.tables: Optional[List[str]] = None
+
+    def error(self, table_name: str, location: Any, message: str) -> None:
+        """
+        Record a problem.
+
+        Args:
+            table_name: Table the problem belongs to
+            location: (file name, record index) or a free-form label
+            message: Description of the problem
+        """
+        count = self.error_counts.get(table_name, 0) + 1
+        self.error_counts[table_name] = count
+        if count <= self.max_errors:
+            if isinstance(location, tuple):
+                location = "{}[{}]".format(*location)
+            self.errors.setdefault(table_name, []).append(f"{location}: {message}")
+
+    def included(self) -> List[str]:
+        """Return the reported tables with the tables written for them, in plan order."""
+        tables = set(self.records if self.tables is None else self.tables)
+        return [
+            table_name for table_name in self.rows
+            if table_name in tables or DERIVED_TABLES.get(table_name) in tables
+        ]
+
+    @property
+    def ok(self) -> bool:
+        """True if no problems were found in the reported tables."""
+        return not any(self.error_counts.get(table_name) for table_name in self.included())
+
+    def format_report(self) -> str:
+        """Render the row counts and problems of the reported tables as text."""
+        included = self.included()
+
+        lines = [f"{'table':24s} {'records':>10s} {'rows':>10s} {'errors':>8s}"]
+        for table_name in included:
+            lines.append(
+                f"{table_name:24s} {self.records.get(table_name, ''):>10} {self.rows[table_name]:>10} "
+                f"{self.error_counts.get(table_name, 0):>8}"
+            )
+
+        for table_name in included:
+            messages = self.errors.get(table_name)
+            if not messages:
+                continue
+            lines.append(f"\n{table_name}:")
+            lines.extend(f"  {message}" for message in messages)
+            hidden = self.error_counts[table_name] - len(messages)
+            if hidden:
+                lines.append(f"  ... and {hidden} more")
+        return "\n".join(lines)
+
+
+class SeedPlanner:
+    """Validates seed files and counts rows without touching the database.
+
+    Tables whose records map one-to-one onto columns (policies, roles) are
+    checked against their compiled schema. Permissions and role parents
+    refer to roles and policies by name; the names are resolved against the
+    records planned earlier in the same run, so tables must be planned in
+    dependency order.
+    """
+
+    def __init__(self, max_errors: int = DEFAULT_MAX_ERRORS, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Initialize the planner.
+
+        Args:
+            max_errors: Error messages kept per table
+            chunk_size: Records validated together
+        """
+        self.plan = SeedPlan(max_errors)
+        self.chunk_size = chunk_size
+        # Names planned so far, per table and unique column
+        self.keys: Dict[str, Set[Any]] = {}
+        self.handlers: Dict[str, Callable[[str, Iterable[Tuple[str, int, List[Dict[str, Any]]]]], None]] = {
+            "permissions": self.plan_permissions,
+            "role_parents": self.plan_role_parents,
+        }
+
+    def chunks(self, sources: List[SeedSource]) -> Iterable[Tuple[str, int, List[Dict[str, Any]]]]:
+        """Yield (file name, index of the first record, records) for every chunk of the sources."""
+        for source in sources:
+            start = 0
+            for chunk in source.iter_chunks(self.chunk_size):
+                yield source.path.name, start, chunk
+                start += len(chunk)
+
+    @staticmethod
+    def records(chunks: Iterable[Tuple[str, int, List[Dict[str, Any]]]]) -> Iterable[Tuple[Any, Dict[str, Any]]]:
+        """Yield ((file name, index), record) for every record of the chunks."""
+        for name, start, chunk in chunks:
+            for index, record in enumerate(chunk, start):
+                yield (name, index), record
+
+    def run(self, groups: List[Tuple[str, List[SeedSource]]]) -> SeedPlan:
+        """
+        Plan every table.
+
+        Args:
+            groups: (table_name, sources) pairs in dependency order
+
+        Returns:
+            The completed plan
+        """
+        for table_name, sources in groups:
+            handler = self.handlers.get(table_name, self.plan_rows)
+            handler(table_name, self.chunks(sources))
+        return self.plan
+
+    def count(self, table_name: str, records: Optional[int], rows: int) -> None:
+        """Add to the record and row counts of a table; derived tables have no records."""
+        if records is not None:
+            self.plan.records[table_name] = self.plan.records.get(table_name, 0) + records
+        self.plan.rows[table_name] = self.plan.rows.get(table_name, 0) + rows
+
+    @staticmethod
+    def unique_keys(columns: Tuple[str, ...], values: Dict[str, List[Any]]) -> List[Any]:
+        """Return the non-NULL keys of a unique constraint; single-column keys stay bare."""
+        if len(columns) == 1:
+            keys = values[columns[0]]
+            return [key for key in keys if key is not None] if None in keys else keys
+        keys = list(zip(*(values[column] for column in columns)))
+        if any(None in values[column] for column in columns):
+            keys = [key for key in keys if None not in key]
+        return keys
+
+    def plan_rows(self, table_name: str, chunks: Iterable[Tuple[str, int, List[Dict[str, Any]]]]) -> None:
+        """Plan a table whose record fields are its columns."""
+        if table_name not in Base.metadata.tables:
+            self.plan.error(table_name, table_name, "no such table")
+            self.count(table_name, 0, 0)
+            return
+
+        schema = compile_schema(table_name)
+        # Keys seen so far per unique constraint; NULLs never collide
+        seen = [(columns, set()) for columns in schema.unique]
+        total = written = 0
+
+        for name, start, chunk in chunks:
+            total += len(chunk)
+            if self.plan_clean_chunk(schema, seen, chunk):
+                written += len(chunk)
+            else:
+                written += self.plan_records(table_name, schema, seen, self.records([(name, start, chunk)]))
+
+        for columns, keys in seen:
+            if len(columns) == 1:
+                self.keys[f"{table_name}.{columns[0]}"] = keys
+        self.count(table_name, total, written)
+
+    def plan_clean_chunk(self, schema: TableSchema, seen, chunk: List[Dict[str, Any]]) -> bool:
+        """
+        Accept a chunk in bulk if every record in it is valid.
+
+        Returns:
+            True if the chunk was accepted and its keys recorded; False, with
+            nothing recorded, if some record needs checking on its own
+        """
+        values = schema.columns(chunk)
+        if values is None:
+            return False
+
+        missing = {column for columns, _ in seen for column in columns if column not in values}
+        for column in missing:
+            values[column] = [record.get(column) for record in chunk]
+
+        new_keys = []
+        for columns, keys in seen:
+            chunk_keys = self.unique_keys(columns, values)
+            distinct = set(chunk_keys)
+            if len(distinct) != len(chunk_keys) or not keys.isdisjoint(distinct):
+                return False
+            new_keys.append(distinct)
+
+        for (_, keys), distinct in zip(seen, new_keys):
+            keys |= distinct
+        return True
+
+    def plan_records(self, table_name: str, schema: TableSchema, seen, records) -> int:
+        """Check records one at a time, reporting every problem. Returns the valid count."""
+        written = 0
+        for location, record in records:
+            errors = [] if schema.is_valid(record) else schema.check(record, schema.fields)
+            for columns, keys in seen:
+                if len(columns) == 1:
+                    key = record.get(columns[0])
+                    if key is None:
+                        continue
+                else:
+                    key = tuple(map(record.get, columns))
+                    if None in key:
+                        continue
+                if key in keys:
+                    errors.append(f"duplicate {', '.join(columns)} {key!r}")
+                else:
+                    keys.add(key)
+            if errors:
+                for message in errors:
+                    self.plan.error(table_name, location, message)
+            else:
+                written += 1
+        return written
+
+    def known(self, key: str) -> Set[Any]:
+        """Return the names planned for ``table.column``, empty if none were."""
+        return self.keys.get(key, set())
+
+    def plan_permissions(self, table_name: str, chunks: Iterable[Tuple[str, int, List[Dict[str, Any]]]]) -> None:
+        """Plan permissions, mirroring PermissionPreparer."""
+        roles = self.known("roles.role")
+        policies = self.known("policies.policy_name")
+        wildcard_schema = compile_schema("wildcard_permissions")
+        grants: Set[Tuple[str, str]] = set()
+        patterns: Set[Tuple[str, str, str]] = set()
+        total = 0
+
+        for location, record in self.records(chunks):
+            total += 1
+            role = record.get("role")
+            if role not in roles:
+                self.plan.error(table_name, location, f"unknown role {role!r}")
+                continue
+
+            for name in PermissionPreparer.normalize_policies(record.get("policies")):
+                pattern = PermissionPreparer.parse_pattern(name)
+                if pattern is None:
+                    if name in policies:
+                        grants.add((role, name))
+                    else:
+                        self.plan.error(table_name, location, f"unknown policy {name!r}")
+                    continue
+
+                category, action = pattern
+                errors = wildcard_schema.check({"category": category, "action": action}, ("category", "action"))
+                if errors:
+                    for message in errors:
+                        self.plan.error(table_name, location, f"pattern {name!r}: {message}")
+                    continue
+                patterns.add((role, category, action))
+
+        self.count(table_name, total, len(grants))
+        self.count("wildcard_permissions", None, len(patterns))
+
+    def plan_role_parents(self, table_name: str, chunks: Iterable[Tuple[str, int, List[Dict[str, Any]]]]) -> None:
+        """Plan role parents and the closure rows rebuilt from them."""
+        roles = self.known("roles.role")
+        parents: Dict[str, Set[str]] = {}
+        total = 0
+
+        for location, record in self.records(chunks):
+            total += 1
+            role = record.get("role")
+            names = record.get("parents") or []
+            if isinstance(names, str):
+                names = [names]
+
+            for name in chain([role], names):
+                if name not in roles:
+                    self.plan.error(table_name, location, f"unknown role {name!r}")
+            if role not in roles:
+                continue
+            parents.setdefault(role, set()).update(
+                name for name in names if name in roles and name != role
+            )
+
+        closure = 0
+        for role in parents:
+            try:
+                closure += len(compute_ancestors(parents, role))
+            except ValueError:
+                self.plan.error(table_name, role, "role hierarchy cycle")
+
+        self.count(table_name, total, sum(len(names) for names in parents.values()))
+        self.count("role_closure", None, closure)
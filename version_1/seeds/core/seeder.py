@@ -1,14 +1,28 @@
 """Main seeder class."""
 
+from fnmatch import fnmatchcase
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from itertools import chain
+from typing import List, Optional, Dict, Any, Iterable, Set, Tuple
 
+from sqlalchemy import inspect
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
-from seeds.constants import MODEL_MAPPING, SEED_ORDER
+from app.models import SeedState
+
+from seeds.constants import DEFAULT_SCHEMA, MODEL_MAPPING
+from seeds.core.bulk import CoreInsertLoader, UpsertLoader, get_bulk_loader
+from seeds.core.checkpoint import CheckpointTracker
+from app.db.profiling import query_profiler
+from seeds.core.graph import build_dependency_graph, dependency_order, dependents
+from seeds.core.plan import DEFAULT_MAX_ERRORS, SeedPlan, SeedPlanner
 from seeds.core.session import get_db_session
+from app.db.session import get_engine
 from seeds.preparers import PREPARERS
-from seeds.utils.loader import DataLoader
+from seeds.utils.loader import DEFAULT_CHUNK_SIZE, DataLoader, SeedSource
 from seeds.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -16,16 +30,50 @@ logger = get_logger(__name__)
 class Seeder:
     """Database seeder for populating tables with initial data."""
 
-    def __init__(self, models: Optional[List[str]] = None, dry_run: bool = False):
+    def __init__(
+        self,
+        models: Optional[List[str]] = None,
+        dry_run: bool = False,
+        loader: str = CoreInsertLoader.name,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        incremental: bool = False,
+        workers: int = 1,
+        commit_every: Optional[int] = None,
+        resume: bool = False,
+        schemas: Optional[List[str]] = None,
+    ):
         """
         Initialize the seeder.
 
         Args:
             models: List of model names to seed. If None, seeds all models.
             dry_run: If True, rollback changes instead of committing
+            loader: Bulk insert strategy ('core', 'orm' or 'copy')
+            chunk_size: Number of records read, prepared and inserted at a time
+            incremental: If True, skip unchanged files and upsert only differences
+            workers: Number of tables seeded concurrently. With more than one
+                worker each table is committed in its own session. When
+                several schemas are seeded, the number of schemas seeded
+                concurrently instead, each in its own transaction.
+            commit_every: If set, commit each table every this many records
+                and checkpoint progress per seed file instead of seeding
+                everything in one all-or-nothing transaction
+            resume: If True, continue chunked seeding from the checkpoints of
+                an earlier run. Implies chunked mode (every chunk_size records
+                unless commit_every is given).
+            schemas: Schemas to seed every file into, as names or fnmatch
+                patterns matched against the database's schemas. If None,
+                each file goes to the schema it declares.
         """
         self.models = models
         self.dry_run = dry_run
+        self.chunk_size = chunk_size
+        self.incremental = incremental
+        self.workers = max(1, workers)
+        self.resume = resume
+        self.commit_every = commit_every or (chunk_size if resume else None)
+        self.schemas = schemas
+        self.loader_name = loader
         self.data_folder = Path(__file__).parent.parent / 'data'
         self.loader = DataLoader(self.data_folder)
 
@@ -50,44 +98,33 @@ class Seeder:
 
         return patterns or ["*"]
     
-    def order_seed_data(self, seed_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def order_seed_data(self, seed_data: List[Any]) -> List[Any]:
         """
-        Order seed data based on SEED_ORDER to handle foreign key dependencies.
+        Order seed data so foreign key parents are seeded before children.
+
+        The order is derived from the foreign keys on Base.metadata.
 
         Args: 
-            seed_data: Unordered seed data
+            seed_data: Unordered seed data dictionaries or SeedSource objects
 
         Returns:
             Ordered seed data
         """
-        data_by_table = {
-            item.get("table_name"): item
-            for item in seed_data
-        }
+        data_by_table: Dict[str, List[Any]] = {}
+        for item in seed_data:
+            table_name = item.table_name if isinstance(item, SeedSource) else item.get("table_name")
+            data_by_table.setdefault(table_name, []).append(item)
 
-        ordered_tables = set(SEED_ORDER)
         ordered_data = []
-
-        for table in SEED_ORDER:
+        for table in dependency_order(build_dependency_graph(data_by_table)):
             logger.info(f"ordering for table '{table}'.")
-            if table in data_by_table:
-                ordered_data.append(data_by_table[table])
-            else:
-                logger.debug(f"Table '{table}' in SEED_ORDER but no data provided")
-
-        for table_name, item in data_by_table.items():
-            if table_name not in ordered_tables:
-                logger.warning(
-                    f"Table '{table_name}' not in SEED_ORDER, adding at end"
-                )
-                ordered_data.append(item)
-
+            ordered_data.extend(data_by_table[table])
 
         return ordered_data
 
     def seed_table(self, db, table_data: Dict[str, Any]) -> bool:
         """
-        Seed a single table with data
+        Seed a single table with in-memory data
 
         Args:
             db: Database session
@@ -96,29 +133,181 @@ class Seeder:
         Returns:
             True if successful, False otherwise
         """
-        table_name = table_data.get("table_name")
         data = table_data.get("data", [])
+        chunks = (
+            data[start:start + self.chunk_size]
+            for start in range(0, len(data), self.chunk_size)
+        )
+        return self.seed_chunks(db, table_data.get("table_name"), chunks)
 
-        if not data:
-            logger.info(f"No data to seed for table '{table_name}'")
-            return True
+    def group_sources(self, sources: List[SeedSource]) -> List[Tuple[str, List[SeedSource]]]:
+        """
+        Group ordered seed files by table, keeping the table order.
+
+        Args:
+            sources: Seed files ordered by order_seed_data()
+
+        Returns:
+            List of (table_name, sources) pairs
+        """
+        groups: Dict[str, List[SeedSource]] = {}
+        for source in sources:
+            groups.setdefault(source.table_name, []).append(source)
+        return list(groups.items())
+
+    def seed_sources(self, db, table_name: str, sources: List[SeedSource], bulk_loader=None) -> bool:
+        """
+        Seed a single table by streaming its seed files in chunks.
+
+        Args:
+            db: Database session
+            table_name: Table the files belong to
+            sources: Seed files to stream
+            bulk_loader: Insert strategy; defaults to make_bulk_loader()
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if self.commit_every:
+            # Upserts are idempotent, and resuming would hide the skipped
+            # keys from UpsertLoader.finish(), so incremental runs start over
+            checkpoints = CheckpointTracker(
+                db, table_name, self.commit_every, resume=self.resume and not self.incremental
+            )
+            chunks = checkpoints.chunks(sources, self.chunk_size)
+            return self.seed_chunks(db, table_name, chunks, bulk_loader, checkpoints)
+
+        for source in sources:
+            logger.info(f"Streaming data from {source.path.name}")
+        chunks = chain.from_iterable(source.iter_chunks(self.chunk_size) for source in sources)
+        return self.seed_chunks(db, table_name, chunks, bulk_loader)
+
+    def is_unchanged(
+        self,
+        db,
+        table_name: str,
+        hashes: Dict[str, str],
+        parents: Set[str],
+        changed_tables: Set[str],
+    ) -> bool:
+        """
+        Check whether a table can be skipped in incremental mode.
+
+        A table is skipped when every seed file has the hash recorded by the
+        last run and none of the tables it references changed in this run.
+
+        Args:
+            db: Database session
+            table_name: Table to check
+            hashes: Current content hash by source name
+            parents: Tables this table references
+            changed_tables: Tables already re-seeded in this run
 
-        preparer = PREPARERS.get(table_name)
+        Returns:
+            True if the table can be skipped
+        """
+        if parents & changed_tables:
+            return False
+
+        stored = dict(
+            db.query(SeedState.source, SeedState.content_hash)
+            .filter(SeedState.table_name == table_name)
+            .all()
+        )
+        return stored == hashes
+
+    def record_hashes(self, db, table_name: str, hashes: Dict[str, str]) -> None:
+        """Store the content hashes applied for a table."""
+        db.query(SeedState).filter(
+            SeedState.table_name == table_name,
+            SeedState.source.notin_(list(hashes)),
+        ).delete(synchronize_session=False)
+
+        for source, content_hash in hashes.items():
+            db.merge(SeedState(source=source, table_name=table_name, content_hash=content_hash))
+
+    def seed_chunks(
+        self,
+        db,
+        table_name: str,
+        chunks: Iterable[List[Dict[str, Any]]],
+        bulk_loader=None,
+        checkpoints: Optional[CheckpointTracker] = None,
+    ) -> bool:
+        """
+        Prepare and insert records chunk by chunk.
+
+        Args:
+            db: Database session
+            table_name: Table the records belong to
+            chunks: Iterable of record lists
+            bulk_loader: Insert strategy; defaults to make_bulk_loader()
+            checkpoints: Tracker committing progress in chunked mode
+
+        Returns:
+            True if successful, False otherwise
+        """
+        bulk_loader = bulk_loader or self.make_bulk_loader(db)
+        preparer = PREPARERS.create(table_name) if table_name in PREPARERS else None
         if not preparer:
             logger.warning(f"No preparer found for table '{table_name}'")
             return False
 
         try: 
-            model_data = preparer.prepare(db, data)
+            record_count = 0
+            inserted = 0
+            resumed = False
+            chunks = iter(chunks)
+
+            while True:
+                with query_profiler.stage("load", table_name):
+                    chunk = next(chunks, None)
+                if chunk is None:
+                    break
+
+                record_count += len(chunk)
+                if checkpoints is not None and checkpoints.resumed and not resumed:
+                    # Rows committed by the earlier run count as prepared
+                    resumed = True
+                    preparer.resume(db)
+                with query_profiler.stage("prepare", table_name):
+                    model_data = preparer.prepare(db, chunk)
+
+                batches = model_data.items() if isinstance(model_data, dict) else [(preparer.model, model_data)]
+                chunk_inserted = 0
+                for model, records in batches:
+                    if not records:
+                        continue
+                    with query_profiler.stage("insert", table_name):
+                        chunk_inserted += bulk_loader.load(db, model, records)
+                    with query_profiler.stage("flush", table_name):
+                        db.flush()
+                inserted += chunk_inserted
+
+                if checkpoints is not None:
+                    with query_profiler.stage("commit", table_name):
+                        checkpoints.chunk_done(len(chunk), chunk_inserted)
+
+            # A resumed table may have no records left but still needs finishing
+            if record_count or (checkpoints is not None and checkpoints.resumed):
+                with query_profiler.stage("insert", table_name):
+                    for model in preparer.models:
+                        bulk_loader.finish(db, model)
+                    preparer.finalize(db)
+            # Empty seed files are done too, or every resume would restart them
+            if checkpoints is not None:
+                with query_profiler.stage("commit", table_name):
+                    checkpoints.table_done()
+
+            if not record_count:
+                logger.info(f"No data to seed for table '{table_name}'")
+                return True
 
-            if not model_data:
+            if not inserted:
                 logger.info(f"No records prepared for table '{table_name}'")
                 return True
 
-            db.bulk_save_objects(model_data)
-            db.flush()
-
-            logger.info(f"Successfully seeded {len(model_data)} records into '{table_name}'")
+            logger.info(f"Successfully seeded {inserted} records into '{table_name}'")
             return True
         except IntegrityError as e:
             logger.error(f"Integrity error seeding '{table_name}': {e.orig}")
@@ -130,35 +319,342 @@ class Seeder:
             logger.error(f"Unexpected error seeding '{table_name}: {e}'")
             return False
     
+    def make_bulk_loader(self, db):
+        """
+        Return a new insert strategy for ``db``.
+
+        Loaders keep their state per table, so one loader can serve every
+        table seeded in a session: run_serial() builds one per schema run,
+        run_parallel() one per table.
+        """
+        if self.incremental:
+            return UpsertLoader()
+        return get_bulk_loader(self.loader_name, db)
+
+    def seed_group(
+        self,
+        db,
+        table_name: str,
+        sources: List[SeedSource],
+        parents: Set[str],
+        changed_tables: Set[str],
+        bulk_loader=None,
+    ) -> str:
+        """
+        Seed one table, honouring incremental mode.
+
+        Args:
+            db: Database session
+            table_name: Table to seed
+            sources: Seed files for the table
+            parents: Tables this table references
+            changed_tables: Tables re-seeded so far in this run; updated in place
+            bulk_loader: Insert strategy of the schema run; defaults to a new
+                one from make_bulk_loader()
+
+        Returns:
+            'success', 'failed' or 'unchanged'
+        """
+        hashes = {}
+        if self.incremental:
+            hashes = {source.path.name: source.content_hash() for source in sources}
+            if self.is_unchanged(db, table_name, hashes, parents, changed_tables):
+                logger.info(f"Table '{table_name}' unchanged, skipping")
+                return "unchanged"
+
+        if not self.seed_sources(db, table_name, sources, bulk_loader or self.make_bulk_loader(db)):
+            if self.commit_every:
+                # Keep what the last checkpoint committed, drop the partial chunk
+                db.rollback()
+            return "failed"
+
+        changed_tables.add(table_name)
+        if self.incremental:
+            self.record_hashes(db, table_name, hashes)
+        return "success"
+
+    def run_serial(
+        self,
+        groups: List[Tuple[str, List[SeedSource]]],
+        graph: Dict[str, Set[str]],
+        schema: Optional[str] = None,
+    ) -> Dict[str, int]:
+        """
+        Seed every table in dependency order within one transaction.
+
+        Args:
+            groups: (table_name, sources) pairs in dependency order
+            graph: Table dependency graph
+            schema: Schema to write to; None for the default schema
+
+        Returns:
+            Count of tables per outcome
+        """
+        counts = {"success": 0, "failed": 0, "unchanged": 0}
+        changed_tables = set()
+
+        with get_db_session(dry_run=self.dry_run, schema=schema) as db:
+            # Schemas are seeded concurrently, so the loader is not kept on self
+            bulk_loader = self.make_bulk_loader(db)
+            for table_name, sources in groups:
+                outcome = self.seed_group(db, table_name, sources, graph[table_name], changed_tables, bulk_loader)
+                counts[outcome] += 1
+
+        return counts
+
+    def run_parallel(
+        self,
+        groups: List[Tuple[str, List[SeedSource]]],
+        graph: Dict[str, Set[str]],
+        schema: Optional[str] = None,
+    ) -> Dict[str, int]:
+        """
+        Seed independent tables concurrently on a bounded thread pool.
+
+        Each table runs in its own session and transaction, and is started
+        as soon as all of its foreign key parents have been committed. Tables
+        whose parent failed are not attempted.
+
+        Args:
+            groups: (table_name, sources) pairs in dependency order
+            graph: Table dependency graph
+            schema: Schema to write to; None for the default schema
+
+        Returns:
+            Count of tables per outcome
+        """
+        counts = {"success": 0, "failed": 0, "unchanged": 0}
+        sources_by_table = dict(groups)
+        children = dependents(graph)
+        waiting = {table: set(graph[table]) for table in sources_by_table}
+        changed_tables = set()
+        lock = threading.Lock()
+
+        def seed(table_name: str) -> str:
+            with get_db_session(schema=schema) as db:
+                with lock:
+                    changed = set(changed_tables)
+                outcome = self.seed_group(db, table_name, sources_by_table[table_name], graph[table_name], changed)
+                if outcome == "failed":
+                    db.rollback()
+            if outcome == "success":
+                with lock:
+                    changed_tables.add(table_name)
+            return outcome
+
+        def block(table_name: str) -> None:
+            for child in children[table_name]:
+                if child in waiting:
+                    del waiting[child]
+                    logger.error(f"Skipping '{child}' because '{table_name}' failed")
+                    counts["failed"] += 1
+                    block(child)
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="seeder") as pool:
+            running = {}
+
+            def submit_ready() -> None:
+                for table_name in [table for table, parents in waiting.items() if not parents]:
+                    del waiting[table_name]
+                    running[pool.submit(seed, table_name)] = table_name
+
+            submit_ready()
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    table_name = running.pop(future)
+                    try:
+                        outcome = future.result()
+                    except Exception as e:
+                        logger.error(f"Seeding '{table_name}' aborted: {e}")
+                        outcome = "failed"
+                    counts[outcome] += 1
+
+                    if outcome == "failed":
+                        block(table_name)
+                    else:
+                        for child in children[table_name]:
+                            if child in waiting:
+                                waiting[child].discard(table_name)
+                submit_ready()
+
+        return counts
+
+    def plan(self, max_errors: int = DEFAULT_MAX_ERRORS) -> SeedPlan:
+        """
+        Validate the seed files and count the rows a seed would write, offline.
+
+        Every seed file is planned so that references from the selected
+        tables resolve, but only the selected tables are reported.
+
+        Args:
+            max_errors: Error messages kept per table
+
+        Returns:
+            The plan, reporting on the selected tables
+        """
+        selected = {source.table_name for source in self.loader.find_sources(self.get_file_patterns())}
+        sources = self.loader.find_sources(["*"])
+        groups = self.group_sources(self.order_seed_data(sources))
+
+        plan = SeedPlanner(max_errors, self.chunk_size).run(groups)
+        plan.tables = [table_name for table_name, _ in groups if table_name in selected]
+        return plan
+
+    @staticmethod
+    def target_schema(schema: Optional[str]) -> Optional[str]:
+        """Map a schema declared by a seed file to a translate target; None for the default."""
+        return None if not schema or schema == DEFAULT_SCHEMA else schema
+
+    def sources_by_schema(self, sources: List[SeedSource]) -> Dict[Optional[str], List[SeedSource]]:
+        """Group ordered seed files by the schema they declare, keeping their order."""
+        targets: Dict[Optional[str], List[SeedSource]] = {}
+        for source in sources:
+            targets.setdefault(self.target_schema(source.schema), []).append(source)
+        return targets
+
+    def resolve_schemas(self, names: List[str]) -> List[str]:
+        """
+        Expand schema names and fnmatch patterns against the database's schemas.
+
+        Args:
+            names: Schema names or patterns such as 'tenant_*'
+
+        Returns:
+            Distinct schema names in the given order
+        """
+        available = None
+        schemas: List[str] = []
+        for name in names:
+            if any(char in name for char in "*?["):
+                if available is None:
+                    available = inspect(get_engine()).get_schema_names()
+                matches = sorted(schema for schema in available if fnmatchcase(schema, name))
+                if not matches:
+                    logger.warning(f"No schemas match '{name}'")
+            else:
+                matches = [name]
+            schemas.extend(schema for schema in matches if schema not in schemas)
+        return schemas
+
+    def seed_schema(self, sources: List[SeedSource], schema: Optional[str] = None, workers: int = 1) -> Dict[str, int]:
+        """
+        Seed ordered seed files into one schema.
+
+        Args:
+            sources: Seed files ordered by order_seed_data()
+            schema: Schema to write to; None for the default schema
+            workers: Number of tables seeded concurrently
+
+        Returns:
+            Count of tables per outcome
+        """
+        groups = self.group_sources(sources)
+        graph = build_dependency_graph(table_name for table_name, _ in groups)
+
+        if workers > 1:
+            logger.info(f"Seeding {len(groups)} tables with {workers} workers")
+            return self.run_parallel(groups, graph, schema)
+        return self.run_serial(groups, graph, schema)
+
+    def run_schemas(self, targets: Dict[Optional[str], List[SeedSource]]) -> Dict[Optional[str], Dict[str, Any]]:
+        """
+        Seed several schemas concurrently on a bounded thread pool.
+
+        Each schema is seeded table by table in its own transaction (or its
+        own chunked commits), so one tenant failing leaves the others intact.
+
+        Args:
+            targets: Ordered seed files per schema
+
+        Returns:
+            Per schema: table counts, seconds taken and the error, if any
+        """
+        def seed(schema: Optional[str], sources: List[SeedSource]) -> Dict[str, Any]:
+            started = time.perf_counter()
+            try:
+                counts, error = self.seed_schema(sources, schema), None
+            except Exception as e:
+                counts, error = {}, str(e)
+            return {"counts": counts, "seconds": time.perf_counter() - started, "error": error}
+
+        results: Dict[Optional[str], Dict[str, Any]] = {}
+        logger.info(f"Seeding {len(targets)} schemas with {self.workers} workers")
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="seeder") as pool:
+            futures = {pool.submit(seed, schema, sources): schema for schema, sources in targets.items()}
+            for future in as_completed(futures):
+                schema = futures[future]
+                result = results[schema] = future.result()
+                if result["error"] or result["counts"].get("failed"):
+                    logger.error(f"Schema '{schema or DEFAULT_SCHEMA}' failed: {result['error'] or 'see errors above'}")
+                else:
+                    logger.info(f"Schema '{schema or DEFAULT_SCHEMA}' seeded in {result['seconds']:.2f}s")
+
+        return {schema: results[schema] for schema in targets}
+
+    @staticmethod
+    def format_schema_report(results: Dict[Optional[str], Dict[str, Any]], elapsed: float) -> str:
+        """Render per-schema outcomes and timings as a text table."""
+        lines = [f"{'schema':32s} {'status':8s} {'tables':>7s} {'failed':>7s} {'seconds':>9s}"]
+        for schema, result in results.items():
+            counts = result["counts"]
+            failed = bool(result["error"] or counts.get("failed"))
+            lines.append(
+                f"{schema or DEFAULT_SCHEMA:32s} {'failed' if failed else 'ok':8s} "
+                f"{sum(counts.values()):>7} {counts.get('failed', 0):>7} {result['seconds']:>9.2f}"
+            )
+        total = sum(result["seconds"] for result in results.values())
+        lines.append(f"{len(results)} schemas in {elapsed:.2f}s wall, {total:.2f}s summed")
+        return "\n".join(lines)
+
     def run(self) -> None:
         """Execute the seeding process."""
         try:
             file_patterns = self.get_file_patterns()
-            seed_data = self.loader.load_data(file_patterns)
+            sources = self.loader.find_sources(file_patterns)
 
-            if not seed_data:
+            if not sources:
                 logger.warning(f"No data files found to seed")
                 return 
 
-            ordered_data = self.order_seed_data(seed_data)
+            ordered_sources = self.order_seed_data(sources)
 
-            with get_db_session(dry_run=self.dry_run) as db:
-                success_count = 0
-                fail_count = 0
+            if self.commit_every and self.dry_run:
+                logger.warning("Dry run needs a single transaction, ignoring chunked commits")
+                self.commit_every = None
 
-                for table_data in ordered_data:
-                    if self.seed_table(db, table_data):
-                        success_count += 1
-                    else:
-                        fail_count += 1
-
-                logger.info(
-                    f"Seeding complete: {success_count} successful, {fail_count} failed"
-                )
+            if self.schemas:
+                schemas = self.resolve_schemas(self.schemas)
+                if not schemas:
+                    logger.warning(f"No schemas to seed for: {', '.join(self.schemas)}")
+                    return
+                targets = {schema: ordered_sources for schema in schemas}
+            else:
+                targets = self.sources_by_schema(ordered_sources)
 
+            if list(targets) != [None]:
+                started = time.perf_counter()
+                results = self.run_schemas(targets)
+                logger.info(f"Schema report:\n{self.format_schema_report(results, time.perf_counter() - started)}")
                 if self.dry_run:
                     logger.info("Dry run completed - no changes were committed")
+                return
+
+            workers = self.workers
+            if workers > 1 and self.dry_run:
+                logger.warning("Dry run needs a single transaction, seeding with one worker")
+                workers = 1
+
+            counts = self.seed_schema(ordered_sources, workers=workers)
+
+            logger.info(
+                f"Seeding complete: {counts['success']} successful, {counts['failed']} failed"
+                + (f", {counts['unchanged']} unchanged" if self.incremental else "")
+            )
+
+            if self.dry_run:
+                logger.info("Dry run completed - no changes were committed")
                 
         except Exception as e:
             logger.error(f"Fatal error during seeding: {e}")
-            raise
\ No newline at end of file
+            raise
@@ -1,27 +1,31 @@
 """Database session management."""
 
 from contextlib import contextmanager
-from typing import Generator
+from typing import Generator, Optional
 
 from sqlalchemy.orm import Session
 
-from app.db.session import SessionLocal
+from app.db.profiling import query_profiler
+from app.db.session import get_schema_engine, get_session_factory
 from seeds.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 @contextmanager
-def get_db_session(dry_run: bool = False) -> Generator[Session, None, None]:
+def get_db_session(dry_run: bool = False, schema: Optional[str] = None) -> Generator[Session, None, None]:
     """
     Context manager for database session handling.
 
     Args:
         dry_run: If True, rollback instead of commit
+        schema: Schema the models' tables are read from and written to;
+            None for the connection's default schema
 
     Yields:
         Database session
     """
-    db = SessionLocal()
+    factory = get_session_factory()
+    db = factory(bind=get_schema_engine(schema)) if schema else factory()
     try:
         yield db
 
@@ -29,7 +33,8 @@ def get_db_session(dry_run: bool = False) -> Generator[Session, None, None]:
             logger.info("Dry run mode: Rolling back changes")
             db.rollback()
         else:
-            db.commit()
+            with query_profiler.stage("commit"):
+                db.commit()
             logger.info("Changes committed to database")
 
     except Exception as e:
@@ -1,13 +1,62 @@
-"""Data perparers for seeding."""
+"""Data perparers for seeding.
 
-from seeds.preparers.policy import PolicyPreparer
-from seeds.preparers.role import RolePreparer
-from seeds.preparers.permission import PermissionPreparer
+Preparers are registered by table name and imported the first time their
+table is seeded, so the CLI only loads the models it actually touches.
+"""
 
-PREPARERS = {
-    "policies": PolicyPreparer(),
-    "roles": RolePreparer(),
-    "permissions": PermissionPreparer()
+from collections.abc import Mapping
+from importlib import import_module
+from typing import Dict, Iterator, Tuple
+
+# table name -> (module, class)
+PREPARER_PATHS: Dict[str, Tuple[str, str]] = {
+    "policies": ("seeds.preparers.policy", "PolicyPreparer"),
+    "roles": ("seeds.preparers.role", "RolePreparer"),
+    "permissions": ("seeds.preparers.permission", "PermissionPreparer"),
+    "role_parents": ("seeds.preparers.role_parent", "RoleParentPreparer"),
 }
 
-__all__ = ['PREPARERS', 'PolicyPreparer', 'RolePreparer', 'PermissionPreparer']
+
+class PreparerRegistry(Mapping):
+    """Table name -> preparer mapping instantiating each preparer on first access."""
+
+    def __init__(self, paths: Dict[str, Tuple[str, str]]):
+        self._paths = paths
+        self._preparers = {}
+
+    def __getitem__(self, table_name: str):
+        preparer = self._preparers.get(table_name)
+        if preparer is None:
+            preparer = self._preparers[table_name] = self.create(table_name)
+        return preparer
+
+    def create(self, table_name: str):
+        """
+        Return a new preparer for a table.
+
+        Preparers may keep state across the chunks of a table, so each seed
+        of a table uses its own instance; concurrent seeds, e.g. of several
+        schemas, never share one.
+        """
+        module_name, class_name = self._paths[table_name]
+        return getattr(import_module(module_name), class_name)()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._paths)
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+
+PREPARERS = PreparerRegistry(PREPARER_PATHS)
+
+_CLASSES = {class_name: module_name for module_name, class_name in PREPARER_PATHS.values()}
+
+
+def __getattr__(name: str):
+    if name in _CLASSES:
+        return getattr(import_module(_CLASSES[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ['PREPARERS', 'PolicyPreparer', 'RolePreparer', 'PermissionPreparer', 'RoleParentPreparer']
@@ -8,17 +8,52 @@ from sqlalchemy.orm import Session
 class BasePreparer(ABC):
     """Abstract base class for data preparers."""
 
+    # Model the prepared records belong to; used to insert plain row mappings
+    model = None
+
+    @property
+    def models(self):
+        """Every model prepare() may return rows for."""
+        return (self.model,)
+
     @abstractmethod
     def prepare(self, db: Session, data: List[Dict[str, Any]]) -> List[Any]:
         """
-        Prepare new data into model instances.
-        
+        Prepare new data into rows for ``model``.
+
+        Rows are plain column mappings, every one with the same keys in the
+        same order and the primary key generated client-side, so they can be
+        inserted with a single Core executemany. Model instances are still
+        accepted and converted by the bulk loaders.
+
         Args:
             db: Database session
             data: Raw data from JSON
 
         Returns:
-            List of model instances
+            List of column mappings for ``model``. Preparers writing to
+            several tables return a dict of such lists keyed by model.
+        """
+        pass
+
+    def resume(self, db: Session) -> None:
+        """
+        Hook run before the remaining chunks of a resumed table are prepared.
+
+        Preparers skipping duplicates across chunks load the rows an earlier
+        run already committed.
+
+        Args:
+            db: Database session
+        """
+        pass
+
+    def finalize(self, db: Session) -> None:
+        """
+        Hook run once every chunk of the table has been inserted.
+
+        Args:
+            db: Database session
         """
         pass
 
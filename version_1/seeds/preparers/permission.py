@@ -1,10 +1,12 @@
 """Permission data preparer."""
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Set, Tuple
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from app.models import Policy, Role, Permission
+from app.db.ids import uuid7
+from app.models import Policy, Role, Permission, WildcardPermission, WILDCARD
 from seeds.preparers.base import BasePreparer
 from seeds.utils.logger import get_logger
 
@@ -12,48 +14,153 @@ logger = get_logger(__name__)
 
 
 class PermissionPreparer(BasePreparer):
-    """Preparer for Permission model."""
+    """Preparer for Permission and WildcardPermission models.
+
+    ``policies`` may be "*" for every policy, or a list mixing policy names
+    with "CATEGORY:*" and "*:ACTION" patterns. Wildcards become a single
+    WildcardPermission row instead of one Permission row per policy.
+
+    Grants already prepared and names that did not resolve are kept across
+    the chunks of a table, so a grant repeated in a later chunk is not
+    inserted twice and missing names are reported once, by finalize().
+    """
+
+    model = Permission
+    models = (Permission, WildcardPermission)
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the grants and missing names collected for the current table."""
+        self.seen: Set[Tuple[Any, ...]] = set()
+        self.missing_roles: Set[str] = set()
+        self.missing_policies: Set[str] = set()
 
     @property
     def table_name(self) -> str:
         return "permissions"
-    
-    def prepare(self, db: Session, data: List[Dict[str, Any]]) -> List[Permission]:
+
+    def resume(self, db: Session) -> None:
+        """Count the grants committed by an earlier run as already prepared."""
+        # Soft-deleted rows hold their unique keys too
+        self.seen.update(map(tuple, db.execute(select(Permission.role_id, Permission.policy_id))))
+        self.seen.update(map(tuple, db.execute(
+            select(WildcardPermission.role_id, WildcardPermission.category, WildcardPermission.action)
+        )))
+
+    @staticmethod
+    def normalize_policies(policy_names: Any) -> List[str]:
+        """Coerce "*" or a single policy name to a list."""
+        if isinstance(policy_names, str):
+            return [policy_names]
+        return policy_names or []
+
+    @staticmethod
+    def parse_pattern(name: str) -> Optional[Tuple[str, str]]:
         """
-        Prepare Permission objects from raw data with role and policy lookups.
+        Parse a wildcard grant.
+
+        Args:
+            name: Entry from ``policies``
+
+        Returns:
+            (category, action) if the entry is a wildcard, None for a policy name
+        """
+        if name == WILDCARD:
+            return WILDCARD, WILDCARD
+        if ":" in name:
+            category, action = name.split(":", 1)
+            if WILDCARD in (category, action):
+                return category, action
+        return None
+
+    def prepare(self, db: Session, data: List[Dict[str, Any]]) -> Dict[Any, List[Dict[str, Any]]]:
+        """
+        Prepare permission rows from raw data with bulk role and policy lookups.
+
+        All referenced role names and policy names are resolved with one query
+        each. Missing names are collected and reported together by finalize()
+        once every chunk has been prepared.
 
         Args:
             db: Database session for lookups
             data: List of Permission dictionaries
 
         Returns:
-            List of Permission instances
+            Column mappings keyed by model (Permission, WildcardPermission)
         """
-        permissions_data = []
-
+        entries = []
+        policy_names = set()
         for item in data:
-            role_name = item.get("role")
-            policy_names = item.get("policies")
+            names = self.normalize_policies(item.get("policies"))
+            patterns = []
+            explicit = []
+            for name in names:
+                pattern = self.parse_pattern(name)
+                if pattern is None:
+                    explicit.append(name)
+                else:
+                    patterns.append(pattern)
+            policy_names.update(explicit)
+            entries.append((item.get("role"), explicit, patterns))
 
-            role = db.query(Role).filter(Role.role == role_name).first()
-            if not role:
-                logger.warning(f"Role '{role_name}' not found, skipping permissions")
-                continue
+        role_names = {role_name for role_name, _, _ in entries}
 
-            if policy_names == "*":
-                policies = db.query(Policy).all()
-            else:
-                policies = db.query(Policy).filter(
-                    Policy.policy_name.in_(policy_names)
-                ).all()
-            
-            if not policies:
-                logger.warning(f"No policies found for role '{role_name}'")
+        role_ids = dict(
+            db.query(Role.role, Role.id)
+            .filter(Role.role.in_(role_names), Role.deleted.is_(None))
+            .all()
+        ) if role_names else {}
+
+        policy_ids = dict(
+            db.query(Policy.policy_name, Policy.id)
+            .filter(Policy.policy_name.in_(policy_names), Policy.deleted.is_(None))
+            .all()
+        ) if policy_names else {}
+
+        seen = self.seen
+        permissions_data = []
+        wildcards_data = []
+
+        for role_name, names, patterns in entries:
+            role_id = role_ids.get(role_name)
+            if role_id is None:
+                self.missing_roles.add(role_name)
                 continue
 
-            permissions_data.extend([
-                Permission(role_id=role.id, policy_id=policy.id)
-                for policy in policies
-            ])
+            for category, action in patterns:
+                if (role_id, category, action) in seen:
+                    continue
+                seen.add((role_id, category, action))
+                wildcards_data.append(
+                    {"id": uuid7(), "role_id": role_id, "category": category, "action": action}
+                )
+
+            for name in names:
+                policy_id = policy_ids.get(name)
+                if policy_id is None:
+                    self.missing_policies.add(name)
+                    continue
+                if (role_id, policy_id) in seen:
+                    continue
+                seen.add((role_id, policy_id))
+                permissions_data.append(
+                    {"id": uuid7(), "role_id": role_id, "policy_id": policy_id}
+                )
+
+        return {Permission: permissions_data, WildcardPermission: wildcards_data}
 
-        return permissions_data
\ No newline at end of file
+    def finalize(self, db: Session) -> None:
+        """Report the role and policy names that did not resolve in any chunk."""
+        if self.missing_roles:
+            logger.warning(
+                f"Skipped permissions for {len(self.missing_roles)} unknown role(s): "
+                f"{', '.join(sorted(map(str, self.missing_roles)))}"
+            )
+        if self.missing_policies:
+            logger.warning(
+                f"Skipped {len(self.missing_policies)} unknown policy name(s): "
+                f"{', '.join(sorted(map(str, self.missing_policies)))}"
+            )
+        self.reset()
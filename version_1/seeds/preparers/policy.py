@@ -4,33 +4,36 @@ from typing import List, Dict, Any
 
 from sqlalchemy.orm import Session
 
+from app.db.ids import uuid7
 from app.models import Policy
 from seeds.preparers.base import BasePreparer
 
 class PolicyPreparer(BasePreparer):
     """Preparer for Policy model."""
 
+    model = Policy
+
     @property
     def table_name(self) -> str:
         return "policies"
 
-    def prepare(self, db: Session, data: List[Dict[str, Any]]) -> List[Policy]:
+    def prepare(self, db: Session, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
-        Prepare Policy objects from raw data.
+        Prepare policy rows from raw data.
 
         Args:
             db: Database session (not used in policies, but required by interface)
             data: List of policy dictionaries
 
         Returns:
-            List of Policy instances
+            List of Policy column mappings
         """
-        
         return [
-            Policy(
-                policy_name=item.get("policy_name"),
-                category=item.get("category"),
-                action=item.get("action")
-            )
+            {
+                "id": uuid7(),
+                "policy_name": item.get("policy_name"),
+                "category": item.get("category"),
+                "action": item.get("action"),
+            }
             for item in data
         ]
\ No newline at end of file
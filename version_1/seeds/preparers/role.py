@@ -4,29 +4,31 @@ from typing import List, Dict, Any
 
 from sqlalchemy.orm import Session
 
+from app.db.ids import uuid7
 from app.models import Role
 from seeds.preparers.base import BasePreparer
 
 class RolePreparer(BasePreparer):
     """Preparer for Role model."""
 
+    model = Role
+
     @property
     def table_name(self) -> str:
         return "roles"
 
-    def prepare(self, db: Session, data: List[Dict[str, Any]]) -> List[Role]:
+    def prepare(self, db: Session, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
-        Prepare Role objects from raw data.
+        Prepare role rows from raw data.
 
         Args:
             db: Database session (not used in roles, but required by interface)
             data: List of role dictionaries
 
         Returns:
-            List of Role instances
+            List of Role column mappings
         """
-
         return [
-            Role(role=item.get("role"))
+            {"id": uuid7(), "role": item.get("role")}
             for item in data
         ]
\ No newline at end of file
@@ -0,0 +1,104 @@
+"""Role parent data preparer."""
+
+from typing import List, Dict, Any, Set, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.db.ids import uuid7
+from app.authz.hierarchy import rebuild_closure
+from app.models import Role, RoleParent
+from seeds.preparers.base import BasePreparer
+from seeds.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class RoleParentPreparer(BasePreparer):
+    """Preparer for RoleParent model.
+
+    Each record names a role and the roles it inherits from, e.g.
+    ``{"role": "ADMIN", "parents": ["USER"]}``.
+
+    Edges already prepared and names that did not resolve are kept across
+    the chunks of a table, so an edge repeated in a later chunk is not
+    inserted twice and missing names are reported once, by finalize().
+    """
+
+    model = RoleParent
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the edges and missing names collected for the current table."""
+        self.seen: Set[Tuple[Any, Any]] = set()
+        self.missing_roles: Set[str] = set()
+
+    @property
+    def table_name(self) -> str:
+        return "role_parents"
+
+    def resume(self, db: Session) -> None:
+        """Count the edges committed by an earlier run as already prepared."""
+        # Soft-deleted rows hold their unique keys too
+        self.seen.update(map(tuple, db.execute(select(RoleParent.role_id, RoleParent.parent_id))))
+
+    def prepare(self, db: Session, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Prepare role parent rows from raw data with one bulk role lookup.
+
+        Args:
+            db: Database session for lookups
+            data: List of role parent dictionaries
+
+        Returns:
+            List of RoleParent column mappings
+        """
+        entries = []
+        role_names = set()
+        for item in data:
+            parents = item.get("parents") or []
+            if isinstance(parents, str):
+                parents = [parents]
+            entries.append((item.get("role"), parents))
+            role_names.add(item.get("role"))
+            role_names.update(parents)
+
+        role_ids = dict(
+            db.query(Role.role, Role.id)
+            .filter(Role.role.in_(role_names), Role.deleted.is_(None))
+            .all()
+        ) if role_names else {}
+
+        missing_roles = self.missing_roles
+        seen = self.seen
+        edges_data = []
+
+        for role_name, parents in entries:
+            role_id = role_ids.get(role_name)
+            if role_id is None:
+                missing_roles.add(role_name)
+                continue
+
+            for parent_name in parents:
+                parent_id = role_ids.get(parent_name)
+                if parent_id is None:
+                    missing_roles.add(parent_name)
+                    continue
+                if parent_id == role_id or (role_id, parent_id) in seen:
+                    continue
+                seen.add((role_id, parent_id))
+                edges_data.append({"id": uuid7(), "role_id": role_id, "parent_id": parent_id})
+
+        return edges_data
+
+    def finalize(self, db: Session) -> None:
+        """Report the role names that did not resolve and rebuild the role closure."""
+        if self.missing_roles:
+            logger.warning(
+                f"Skipped role parents for {len(self.missing_roles)} unknown role(s): "
+                f"{', '.join(sorted(map(str, self.missing_roles)))}"
+            )
+        self.reset()
+        rebuild_closure(db)
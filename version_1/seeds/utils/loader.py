@@ -1,22 +1,260 @@
 """Data loading utilities."""
 
+import csv
+import gzip
+import hashlib
 import json
+import re
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 
 from seeds.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+DEFAULT_CHUNK_SIZE = 5000
+
+# Supported seed file formats by suffix; each may also be gzip-compressed (.gz)
+FORMATS = {
+    ".json": "json",
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+    ".csv": "csv",
+}
+
+
+class JsonStreamReader:
+    """Incrementally decodes JSON values from a text stream.
+
+    Only the structural tokens around the top-level object and its ``data``
+    array are scanned by hand; each key and record is decoded with
+    ``json.JSONDecoder.raw_decode`` from a sliding buffer, so memory use is
+    bounded by the largest single record rather than by the file size.
+    """
+
+    WHITESPACE = " \t\r\n"
+
+    def __init__(self, stream, block_size: int = 65536):
+        """
+        Initialize the reader.
+
+        Args:
+            stream: Text stream to read from
+            block_size: Number of characters read per refill
+        """
+        self.stream = stream
+        self.block_size = block_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Read the next block, dropping consumed input. Returns False at EOF."""
+        if self.eof:
+            return False
+        block = self.stream.read(self.block_size)
+        if not block:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + block
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in self.WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        """Consume the next non-whitespace character, which must be ``char``."""
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected '{char}' but found '{found or 'EOF'}'")
+        self.pos += 1
+
+    def value(self) -> Any:
+        """Decode and consume the next JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self.fill():
+                    continue
+                raise
+            # A number at the end of the buffer may continue in the next block
+            if end == len(self.buffer) and self.fill():
+                continue
+            self.pos = end
+            return value
+
+    def iter_document(self) -> Iterator[Tuple[str, Any]]:
+        """
+        Walk a ``{"table_name": ..., "data": [...]}`` document.
+
+        Yields:
+            ("meta", (key, value)) for top-level keys other than ``data``,
+            and ("record", record) for each element of ``data``
+        """
+        self.expect("{")
+        if self.peek() == "}":
+            return
+
+        while True:
+            key = self.value()
+            self.expect(":")
+
+            if key == "data":
+                self.expect("[")
+                if self.peek() == "]":
+                    self.pos += 1
+                else:
+                    while True:
+                        yield "record", self.value()
+                        if self.peek() == ",":
+                            self.pos += 1
+                            continue
+                        self.expect("]")
+                        break
+            else:
+                yield "meta", (key, self.value())
+
+            if self.peek() == ",":
+                self.pos += 1
+                continue
+            self.expect("}")
+            return
+
+
+class SeedSource:
+    """A single seed file that can be read lazily in fixed-size chunks."""
+
+    def __init__(self, path: Path):
+        """
+        Initialize the seed source.
+
+        Args:
+            path: Path to a .json, .ndjson/.jsonl or .csv file, optionally .gz
+        """
+        self.path = path
+        suffixes = [suffix.lower() for suffix in path.suffixes]
+        self.compressed = bool(suffixes) and suffixes[-1] == ".gz"
+        if self.compressed:
+            suffixes = suffixes[:-1]
+
+        suffix = suffixes[-1] if suffixes else ""
+        if suffix not in FORMATS:
+            raise ValueError(f"Unsupported seed file format: {path.name}")
+
+        self.format = FORMATS[suffix]
+        self._header: Optional[Dict[str, Any]] = None
+
+    def __repr__(self) -> str:
+        return f"SeedSource({self.path.name!r})"
+
+    @property
+    def stem(self) -> str:
+        """File name without format/compression suffixes (e.g. '1_policies')."""
+        return self.path.name.split(".", 1)[0]
+
+    def content_hash(self) -> str:
+        """Return the SHA-256 hex digest of the raw file contents."""
+        digest = hashlib.sha256()
+        with open(self.path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def open(self):
+        """Open the file as text, transparently decompressing gzip."""
+        if self.compressed:
+            return gzip.open(self.path, "rt", encoding="utf-8", newline="")
+        return open(self.path, "r", encoding="utf-8", newline="")
+
+    @property
+    def header(self) -> Dict[str, Any]:
+        """
+        Top-level metadata of the file.
+
+        For JSON this is every top-level key before ``data``, read without
+        parsing the records. For NDJSON/CSV the table name is taken from the
+        file name with any numeric ordering prefix removed.
+        """
+        if self._header is None:
+            if self.format == "json":
+                header = {}
+                with self.open() as f:
+                    for kind, payload in JsonStreamReader(f).iter_document():
+                        if kind == "record":
+                            break
+                        key, value = payload
+                        header[key] = value
+            else:
+                header = {"table_name": re.sub(r"^\d+_", "", self.stem)}
+            self._header = header
+        return self._header
+
+    @property
+    def table_name(self) -> Optional[str]:
+        return self.header.get("table_name")
+
+    @property
+    def schema(self) -> Optional[str]:
+        return self.header.get("schema")
+
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        """Yield records one at a time without loading the whole file."""
+        with self.open() as f:
+            if self.format == "json":
+                for kind, payload in JsonStreamReader(f).iter_document():
+                    if kind == "record":
+                        yield payload
+            elif self.format == "ndjson":
+                for line in f:
+                    line = line.strip()
+                    if line:
+                        yield json.loads(line)
+            else:
+                for row in csv.DictReader(f):
+                    yield {key: (value if value != "" else None) for key, value in row.items()}
+
+    def iter_chunks(self, chunk_size: int = DEFAULT_CHUNK_SIZE, start: int = 0) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield records in lists of at most ``chunk_size``.
+
+        Args:
+            chunk_size: Maximum number of records per chunk
+            start: Number of leading records to skip, e.g. when resuming
+
+        Yields:
+            Lists of records
+        """
+        chunk = []
+        for record in islice(self.iter_records(), start, None):
+            chunk.append(record)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+
 class DataLoader:
-    """Handles loading JSON data files."""
+    """Handles loading seed data files."""
 
     def __init__(self, data_folder: Path):
         """
         Initialize data loader.
 
         Args:   
-            data_folder: Path to folder containing JSON data files
+            data_folder: Path to folder containing seed data files
         """
         self.data_folder = data_folder
 
@@ -44,9 +282,44 @@ class DataLoader:
         except Exception as e:
             logger.error(f"Error loading {file_path.name}: {e}")
 
+    def find_sources(self, file_patterns: List[str]) -> List[SeedSource]:
+        """
+        Find seed files of any supported format matching patterns.
+
+        Args:
+            file_patterns: List of file stem patterns (e.g. ['1_policies', '*'])
+
+        Returns:
+            List of seed sources, sorted by file name
+        """
+        sources = []
+        seen = set()
+
+        for pattern in file_patterns:
+            matches = sorted(
+                path for path in self.data_folder.glob(f'{pattern}.*')
+                if path not in seen
+            )
+            pattern_sources = []
+
+            for path in matches:
+                try:
+                    pattern_sources.append(SeedSource(path))
+                    seen.add(path)
+                except ValueError:
+                    logger.debug(f"Ignoring unsupported file: {path.name}")
+
+            if not pattern_sources:
+                logger.warning(f"No files found matching pattern: {pattern}")
+            sources.extend(pattern_sources)
+
+        return sources
+
     def load_data(self, file_patterns: List[str]) -> List[Dict[str, Any]]:
         """
-        Load multiple JSON files matching patterns.
+        Load multiple seed files matching patterns fully into memory.
+
+        Prefer find_sources() and SeedSource.iter_chunks() for large files.
 
         Args:
             file_patterns: List of file patterns to match (e.g. , ['policies', 'roles', 'permissions'])
@@ -55,17 +328,14 @@ class DataLoader:
             List of loaded data dictionaries
         """
         all_data = []
-        
-        for pattern in file_patterns:
-            json_files = list(self.data_folder.glob(f'{pattern}.json'))
-
-            if not json_files:
-                logger.warning(f"No files found matching patterns: {patterns}.json")
-                continue
 
-            for json_file in json_files:
-                data = self.load_json_file(json_file)
+        for source in self.find_sources(file_patterns):
+            try:
+                data = dict(source.header)
+                data["data"] = list(source.iter_records())
+                logger.info(f"Loaded data from {source.path.name}")
                 all_data.append(data)
+            except (ValueError, OSError) as e:
+                logger.error(f"Error loading {source.path.name}: {e}")
 
         return all_data
-        
\ No newline at end of file
@@ -0,0 +1,52 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import app.models  # noqa: F401  registers the tables on Base.metadata
+from app.db.base import Base
+from app.models import Policy, Role
+
+
+@pytest.fixture
+def engine():
+    """In-memory SQLite database with every table created."""
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session_factory(engine):
+    """Fresh sessionmaker per test, so event listeners do not leak between tests."""
+    return sessionmaker(autoflush=False, bind=engine)
+
+
+@pytest.fixture
+def db(session_factory):
+    session = session_factory()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def make_role(db):
+    """Create and commit a role."""
+    def make(name: str) -> Role:
+        role = Role(role=name)
+        db.add(role)
+        db.commit()
+        return role
+    return make
+
+
+@pytest.fixture
+def make_policy(db):
+    """Create and commit a policy."""
+    def make(category: str, action: str) -> Policy:
+        policy = Policy(policy_name=f"{category}_{action}", category=category, action=action)
+        db.add(policy)
+        db.commit()
+        return policy
+    return make
@@ -0,0 +1,61 @@
+import pytest
+
+from app.authz.bus import CacheInvalidator, InvalidationBus, InvalidationEvent, LocalBus, install_bus_publisher
+from app.authz.cache import DecisionCache
+from app.models import Permission, RoleClosure
+
+
+@pytest.fixture
+def events(session_factory):
+    bus = LocalBus()
+    received = []
+    bus.subscribe(received.append)
+    install_bus_publisher(bus, session_factory)
+    return received
+
+
+def test_bus_is_abstract():
+    with pytest.raises(TypeError):
+        InvalidationBus()
+
+
+def test_event_round_trips_through_json():
+    event = InvalidationEvent("permissions", "insert", ("admin",), (("USER", "READ"), (None, "WRITE")))
+    assert InvalidationEvent.from_json(event.to_json()) == event
+
+
+def test_grant_event_carries_names(db, events, make_role, make_policy):
+    parent = make_role("admin")
+    child = make_role("editor")
+    policy = make_policy("USER", "READ")
+    db.add(RoleClosure(ancestor_id=parent.id, descendant_id=child.id, depth=1))
+    db.commit()
+    events.clear()
+
+    db.add(Permission(role_id=parent.id, policy_id=policy.id))
+    db.commit()
+
+    assert events == [InvalidationEvent("permissions", "insert", ("admin", "editor"), (("USER", "READ"),))]
+
+
+def test_invalidator_evicts_only_affected_entries():
+    cache = DecisionCache()
+    for key in [("admin", "USER", "READ"), ("admin", "USER", "WRITE"), ("guest", "USER", "WRITE"),
+                ("guest", "ORDER", "READ")]:
+        cache.set(key, False)
+
+    CacheInvalidator(cache)(InvalidationEvent("permissions", "insert", ("admin",), (("USER", "READ"),)))
+
+    assert cache.get(("admin", "USER", "READ")) is None
+    assert cache.get(("admin", "USER", "WRITE")) is None
+    assert cache.get(("guest", "USER", "WRITE")) is False
+    assert cache.get(("guest", "ORDER", "READ")) is False
+
+
+def test_invalidator_clears_on_global_event():
+    cache = DecisionCache()
+    cache.set(("guest", "USER", "READ"), True)
+
+    CacheInvalidator(cache)(InvalidationEvent("role_parents", "delete"))
+
+    assert len(cache) == 0
@@ -0,0 +1,125 @@
+import pytest
+from sqlalchemy import insert, update
+from sqlalchemy.sql import func
+
+from app.authz.cache import CachedPermissionChecker, DecisionCache, decision_cache, install_invalidation
+from app.db.base import Base
+from app.models import Permission, Policy, Role
+
+
+@pytest.fixture
+def checker(session_factory):
+    cache = DecisionCache()
+    install_invalidation(cache, session_factory)
+    return CachedPermissionChecker(cache)
+
+
+def orm_insert(db, role, policy):
+    db.execute(insert(Permission).values(role_id=role.id, policy_id=policy.id))
+
+
+def core_insert(db, role, policy):
+    # As the seeder's Core loaders write: the statement targets the Table
+    db.execute(Permission.__table__.insert(), [{"role_id": role.id, "policy_id": policy.id}])
+
+
+@pytest.mark.parametrize("write", [orm_insert, core_insert])
+def test_committed_insert_invalidates(db, checker, make_role, make_policy, write):
+    role = make_role("admin")
+    policy = make_policy("USER", "READ")
+    assert checker.is_allowed(db, "admin", "USER", "READ") is False
+
+    write(db, role, policy)
+    db.commit()
+
+    assert checker.is_allowed(db, "admin", "USER", "READ") is True
+
+
+def test_core_update_invalidates(db, checker, make_role, make_policy):
+    role = make_role("admin")
+    policy = make_policy("USER", "READ")
+    core_insert(db, role, policy)
+    db.commit()
+    assert checker.is_allowed(db, "admin", "USER", "READ") is True
+
+    db.execute(update(Permission.__table__).values(deleted=func.now()))
+    db.commit()
+
+    assert checker.is_allowed(db, "admin", "USER", "READ") is False
+
+
+def test_rolled_back_insert_keeps_cache(db, checker, make_role, make_policy):
+    role = make_role("admin")
+    policy = make_policy("USER", "READ")
+    assert checker.is_allowed(db, "admin", "USER", "READ") is False
+    invalidations = checker.cache.invalidations
+
+    core_insert(db, role, policy)
+    db.rollback()
+
+    assert checker.cache.invalidations == invalidations
+    assert checker.is_allowed(db, "admin", "USER", "READ") is False
+
+
+@pytest.fixture
+def app_session_factory(tmp_path, monkeypatch):
+    """The application's own SessionLocal, bound to a fresh SQLite file."""
+    from app.core.config import get_settings
+    from app.db import session
+
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'app.db'}")
+    monkeypatch.setenv("DB_POOL_METRICS", "False")
+    caches = (get_settings, session.get_engine, session.get_schema_engine, session.get_session_factory)
+    for cached in caches:
+        cached.cache_clear()
+    Base.metadata.create_all(session.get_engine())
+    yield session.SessionLocal
+    session.get_engine().dispose()
+    for cached in caches:
+        cached.cache_clear()
+
+
+def test_session_local_invalidates_shared_cache(app_session_factory):
+    checker = CachedPermissionChecker(decision_cache)
+    with app_session_factory() as db:
+        role = Role(role="admin")
+        policy = Policy(policy_name="USER_READ", category="USER", action="READ")
+        db.add_all([role, policy])
+        db.commit()
+        assert checker.is_allowed(db, "admin", "USER", "READ") is False
+
+        db.add(Permission(role_id=role.id, policy_id=policy.id))
+        db.commit()
+
+        assert checker.is_allowed(db, "admin", "USER", "READ") is True
+
+
+def test_decision_loaded_before_invalidation_is_not_stored():
+    cache = DecisionCache()
+
+    def stale_load():
+        # Another session commits while this decision is being computed
+        cache.invalidate()
+        return False
+
+    assert cache.get_or_load(("admin", "USER", "READ"), stale_load) is False
+    assert cache.get(("admin", "USER", "READ")) is None
+
+
+def test_batch_loaded_before_invalidation_is_not_stored(db, make_role, make_policy, monkeypatch):
+    from app.authz import cache as cache_module
+
+    make_role("admin")
+    make_policy("USER", "READ")
+    checker = CachedPermissionChecker(DecisionCache())
+    check_many = cache_module.check_many
+
+    def racing_check_many(db, checks):
+        decisions = check_many(db, checks)
+        checker.cache.invalidate()
+        return decisions
+
+    monkeypatch.setattr(cache_module, "check_many", racing_check_many)
+
+    assert checker.is_allowed_many(db, [("admin", "USER", "READ")]) == {("admin", "USER", "READ"): False}
+    assert len(checker.cache) == 0
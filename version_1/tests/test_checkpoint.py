@@ -0,0 +1,86 @@
+import json
+
+from sqlalchemy import select
+from sqlalchemy.sql import func
+
+from app.models import Permission, Role, SeedCheckpoint
+from seeds.core.checkpoint import CheckpointTracker
+from seeds.core.seeder import Seeder
+from seeds.utils.loader import SeedSource
+
+
+def seed_file(tmp_path, name, roles):
+    path = tmp_path / name
+    path.write_text(json.dumps({"table_name": "roles", "data": [{"role": role} for role in roles]}))
+    return SeedSource(path)
+
+
+def test_chunks_capped_at_commit_every(db, tmp_path):
+    source = seed_file(tmp_path, "2_roles.json", ["A", "B", "C", "D", "E"])
+    tracker = CheckpointTracker(db, "roles", commit_every=2)
+
+    assert [len(chunk) for chunk in tracker.chunks([source], chunk_size=1000)] == [2, 2, 1]
+
+
+def test_commits_land_on_commit_every_boundaries(db, tmp_path, monkeypatch):
+    sources = [
+        seed_file(tmp_path, "2_roles.json", [f"A{i}" for i in range(8)]),
+        seed_file(tmp_path, "3_roles.json", [f"B{i}" for i in range(6)]),
+    ]
+    tracker = CheckpointTracker(db, "roles", commit_every=5)
+    applied = []
+    commits = []
+    monkeypatch.setattr(db, "commit", lambda: commits.append(sum(applied)))
+
+    sizes = []
+    for chunk in tracker.chunks(sources, chunk_size=3):
+        sizes.append(len(chunk))
+        applied.append(len(chunk))
+        tracker.chunk_done(len(chunk), len(chunk))
+
+    assert sizes == [3, 2, 3, 2, 3, 1]
+    assert commits == [5, 10]
+
+
+def test_empty_file_marked_completed(db, tmp_path):
+    sources = [seed_file(tmp_path, "2_roles.json", ["A", "B"]), seed_file(tmp_path, "3_roles.json", [])]
+    seeder = Seeder(commit_every=1)
+
+    assert seeder.seed_sources(db, "roles", sources, seeder.make_bulk_loader(db))
+
+    completed = dict(db.execute(select(SeedCheckpoint.source, SeedCheckpoint.completed_at)).all())
+    assert set(completed) == {"2_roles.json", "3_roles.json"}
+    assert all(completed.values())
+    assert db.scalar(select(Role.role).where(Role.role == "B")) == "B"
+
+
+def test_table_of_empty_files_marked_completed(db, tmp_path):
+    seeder = Seeder(commit_every=10)
+
+    assert seeder.seed_sources(db, "roles", [seed_file(tmp_path, "2_roles.json", [])], seeder.make_bulk_loader(db))
+
+    assert db.scalar(select(SeedCheckpoint.completed_at).where(SeedCheckpoint.source == "2_roles.json"))
+
+
+def test_resume_skips_grants_committed_by_earlier_run(db, tmp_path, make_role, make_policy):
+    role = make_role("admin")
+    policy = make_policy("USER", "READ")
+    path = tmp_path / "3_permissions.json"
+    path.write_text(json.dumps({"table_name": "permissions", "data": [
+        {"role": "admin", "policies": ["USER_READ"]},
+        {"role": "admin", "policies": ["USER_READ"]},
+    ]}))
+    source = SeedSource(path)
+    # An earlier run committed the first record, then stopped
+    db.add(Permission(role_id=role.id, policy_id=policy.id))
+    db.add(SeedCheckpoint(
+        source=path.name, table_name="permissions", content_hash=source.content_hash(),
+        records_done=1, rows_written=1,
+    ))
+    db.commit()
+    seeder = Seeder(commit_every=1, resume=True)
+
+    assert seeder.seed_sources(db, "permissions", [source], seeder.make_bulk_loader(db))
+
+    assert db.scalar(select(func.count()).select_from(Permission)) == 1
+    assert db.scalar(select(SeedCheckpoint.records_done).where(SeedCheckpoint.source == path.name)) == 2
@@ -0,0 +1,70 @@
+import pytest
+from sqlalchemy import select
+from sqlalchemy.sql import func
+
+from app.authz.engine import load_matrix
+from app.authz.hierarchy import add_parent, rebuild_closure, restore_role, soft_delete_role
+from app.authz.queries import has_permission
+from app.models import Permission, RoleClosure, RoleParent
+
+
+@pytest.fixture
+def chain(db, make_role, make_policy):
+    """ADMIN inherits from MANAGER, which inherits from USER; USER holds USER:READ."""
+    admin, manager, user = make_role("ADMIN"), make_role("MANAGER"), make_role("USER")
+    policy = make_policy("USER", "READ")
+    db.add(Permission(role_id=user.id, policy_id=policy.id))
+    add_parent(db, admin.id, manager.id)
+    add_parent(db, manager.id, user.id)
+    db.commit()
+    return admin, manager, user
+
+
+def closure(db):
+    return set(db.execute(select(RoleClosure.ancestor_id, RoleClosure.descendant_id)).all())
+
+
+def test_deleted_intermediate_role_breaks_inheritance(db, chain):
+    admin, manager, user = chain
+    assert has_permission(db, "ADMIN", "USER", "READ") is True
+
+    assert soft_delete_role(db, manager.id)
+    db.commit()
+
+    assert closure(db) == set()
+    assert has_permission(db, "ADMIN", "USER", "READ") is False
+    assert load_matrix(db).is_allowed("ADMIN", "USER", "READ") is False
+
+
+def test_full_rebuild_skips_deleted_roles(db, chain):
+    admin, manager, user = chain
+    manager.deleted = func.now()
+    db.flush()
+
+    rebuild_closure(db)
+
+    assert closure(db) == set()
+
+
+def test_restored_role_inherits_again(db, chain):
+    admin, manager, user = chain
+    soft_delete_role(db, manager.id)
+    db.commit()
+
+    assert restore_role(db, manager.id)
+    db.commit()
+
+    assert closure(db) == {(manager.id, admin.id), (user.id, admin.id), (user.id, manager.id)}
+    assert has_permission(db, "ADMIN", "USER", "READ") is True
+
+
+def test_edge_to_deleted_role_waits_for_restore(db, make_role):
+    admin, manager = make_role("ADMIN"), make_role("MANAGER")
+    soft_delete_role(db, manager.id)
+
+    add_parent(db, admin.id, manager.id)
+
+    assert db.scalar(select(RoleParent.deleted).where(RoleParent.role_id == admin.id)) is None
+    assert closure(db) == set()
+    restore_role(db, manager.id)
+    assert closure(db) == {(manager.id, admin.id)}
@@ -0,0 +1,36 @@
+import logging
+
+from app.models import Permission, WildcardPermission
+from seeds.preparers.permission import PermissionPreparer
+
+
+def test_grant_repeated_across_chunks_is_prepared_once(db, make_role, make_policy):
+    make_role("admin")
+    make_policy("USER", "READ")
+    preparer = PermissionPreparer()
+
+    first = preparer.prepare(db, [{"role": "admin", "policies": ["USER_READ", "USER:*"]}])
+    second = preparer.prepare(db, [{"role": "admin", "policies": ["USER_READ", "USER:*"]}])
+
+    assert len(first[Permission]) == 1
+    assert len(first[WildcardPermission]) == 1
+    assert second == {Permission: [], WildcardPermission: []}
+
+
+def test_missing_names_reported_once_in_finalize(db, make_role, caplog):
+    make_role("admin")
+    preparer = PermissionPreparer()
+
+    with caplog.at_level(logging.WARNING):
+        preparer.prepare(db, [{"role": "ghost", "policies": ["USER_READ"]}])
+        preparer.prepare(db, [{"role": "admin", "policies": ["USER_WRITE"]}])
+        assert not caplog.records
+
+        preparer.finalize(db)
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert messages == [
+        "Skipped permissions for 1 unknown role(s): ghost",
+        "Skipped 1 unknown policy name(s): USER_WRITE",
+    ]
+    assert not (preparer.seen or preparer.missing_roles or preparer.missing_policies)
@@ -0,0 +1,41 @@
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import QueuePool
+
+from app.db.pool_metrics import PoolMetrics
+
+
+def test_metrics_survive_dispose(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'pool.db'}", poolclass=QueuePool, pool_size=1, max_overflow=0)
+    metrics = PoolMetrics()
+    metrics.install(engine)
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+    engine.dispose()
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+    snapshot = metrics.snapshot()
+    assert snapshot["checkouts"] == 2
+    assert snapshot["checkins"] == 2
+    assert snapshot["connects"] == 2
+    assert snapshot["checkout_seconds"] > 0
+    engine.dispose()
+
+
+def test_checkout_while_exhausted_counts_as_wait(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'pool.db'}", poolclass=QueuePool, pool_size=1, max_overflow=0,
+                           pool_timeout=0.01)
+    metrics = PoolMetrics()
+    metrics.install(engine)
+
+    with engine.connect():
+        assert metrics.is_exhausted()
+        try:
+            engine.connect()
+        except Exception:
+            pass
+
+    assert metrics.snapshot()["timeouts"] == 1
+    assert metrics.snapshot()["waits"] == 1
+    engine.dispose()
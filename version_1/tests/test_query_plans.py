@@ -0,0 +1,55 @@
+import pytest
+from sqlalchemy import insert
+
+from app.authz.hierarchy import rebuild_closure
+from app.db.ids import uuid7
+from app.models import Permission, Policy, Role, RoleParent, WildcardPermission
+from benchmarks.query_plans import explain, full_scans, plan_statements
+
+
+@pytest.fixture
+def seeded(db):
+    """A few hundred policies granted explicitly, by wildcard and by inheritance."""
+    roles = [{"id": uuid7(), "role": f"role_{n}"} for n in range(50)]
+    policies = [
+        {"id": uuid7(), "policy_name": f"policy_{n}", "category": f"CATEGORY_{n % 20}", "action": f"ACTION_{n // 20}"}
+        for n in range(400)
+    ]
+    db.execute(insert(Role), roles)
+    db.execute(insert(Policy), policies)
+    db.execute(insert(Permission), [
+        {"id": uuid7(), "role_id": role["id"], "policy_id": policy["id"]}
+        for n, role in enumerate(roles) for policy in policies[n::7]
+    ])
+    db.execute(insert(WildcardPermission), [
+        {"id": uuid7(), "role_id": role["id"], "category": "CATEGORY_1", "action": "*"} for role in roles[::5]
+    ])
+    db.execute(insert(RoleParent), [
+        {"id": uuid7(), "role_id": child["id"], "parent_id": parent["id"]} for parent, child in zip(roles, roles[1:])
+    ])
+    rebuild_closure(db)
+    db.commit()
+    return db
+
+
+@pytest.mark.parametrize("name", list(plan_statements("role", "category", "action")))
+def test_authz_statement_seeks_every_table(seeded, name):
+    statement = plan_statements("role_9", "CATEGORY_2", "ACTION_0")[name]
+    plan = "\n".join(explain(seeded.connection(), statement))
+
+    assert full_scans(plan) == set(), plan
+
+
+@pytest.mark.parametrize("plan, scanned", [
+    ("SCAN policies", {"policies"}),
+    ("SCAN policies USING INDEX ix_policies_live_category_action", {"policies"}),
+    ("SCAN role_closure USING COVERING INDEX ix_role_closure_descendant_ancestor", {"role_closure"}),
+    ("SCAN ancestor_role", {"roles"}),
+    ("SEARCH roles USING INDEX sqlite_autoindex_roles_2 (role=?)", set()),
+    ("SEARCH policies USING INDEX sqlite_autoindex_policies_1 (id=?)\n"
+     "SCAN policies USING INDEX ix_policies_live_category_action", set()),
+    ("SCAN CONSTANT ROW\nSCAN anon_1", set()),
+    ("Seq Scan on permissions  (cost=0.00..1.01 rows=1 width=16)", {"permissions"}),
+])
+def test_full_scans(plan, scanned):
+    assert full_scans(plan) == scanned
@@ -0,0 +1,31 @@
+import logging
+
+from seeds.preparers.role_parent import RoleParentPreparer
+
+
+def test_edge_repeated_across_chunks_is_prepared_once(db, make_role):
+    make_role("ADMIN")
+    make_role("USER")
+    preparer = RoleParentPreparer()
+
+    first = preparer.prepare(db, [{"role": "ADMIN", "parents": ["USER"]}])
+    second = preparer.prepare(db, [{"role": "ADMIN", "parents": ["USER"]}])
+
+    assert len(first) == 1
+    assert second == []
+
+
+def test_missing_names_reported_once_in_finalize(db, make_role, caplog):
+    make_role("ADMIN")
+    preparer = RoleParentPreparer()
+
+    with caplog.at_level(logging.WARNING):
+        preparer.prepare(db, [{"role": "GHOST", "parents": ["ADMIN"]}])
+        preparer.prepare(db, [{"role": "ADMIN", "parents": ["PHANTOM"]}])
+        assert not caplog.records
+
+        preparer.finalize(db)
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert messages == ["Skipped role parents for 2 unknown role(s): GHOST, PHANTOM"]
+    assert not (preparer.seen or preparer.missing_roles)
@@ -0,0 +1,36 @@
+from sqlalchemy import select
+
+from app.models import Permission, Policy, Role
+from seeds.core.bulk import UpsertLoader
+from seeds.core.seeder import Seeder
+
+
+def test_seed_table_honours_incremental(db):
+    seeder = Seeder(incremental=True)
+    assert isinstance(seeder.make_bulk_loader(db), UpsertLoader)
+
+    assert seeder.seed_table(db, {"table_name": "roles", "data": [{"role": "ADMIN"}, {"role": "USER"}]})
+    # Upserting the same roles again must not hit the unique constraint
+    assert seeder.seed_table(db, {"table_name": "roles", "data": [{"role": "ADMIN"}]})
+
+    live = db.scalars(select(Role.role).where(Role.deleted.is_(None))).all()
+    assert live == ["ADMIN"]
+
+
+def test_incremental_policy_rename_keeps_row(db, make_role):
+    seeder = Seeder(incremental=True)
+    role = make_role("ADMIN")
+    assert seeder.seed_table(db, {"table_name": "policies", "data": [
+        {"policy_name": "USER_READ", "category": "USER", "action": "READ"},
+    ]})
+    policy = db.scalar(select(Policy))
+    db.add(Permission(role_id=role.id, policy_id=policy.id))
+    db.flush()
+
+    assert seeder.seed_table(db, {"table_name": "policies", "data": [
+        {"policy_name": "USER_VIEW", "category": "USER", "action": "READ"},
+    ]})
+
+    rows = db.execute(select(Policy.id, Policy.policy_name, Policy.deleted)).all()
+    assert rows == [(policy.id, "USER_VIEW", None)]
+    assert db.scalar(select(Permission.policy_id)) == policy.id
@@ -0,0 +1,49 @@
+import subprocess
+import sys
+import uuid
+
+import pytest
+
+from app.authz.engine import CompiledMatrix
+from app.authz.shared import SharedMatrixPublisher, SharedMatrixReader
+
+
+@pytest.fixture
+def publisher():
+    publisher = SharedMatrixPublisher(f"rbac_test_{uuid.uuid4().hex[:8]}")
+    yield publisher
+    publisher.close()
+
+
+def test_reader_sees_published_matrix_with_null_keys(publisher):
+    publisher.publish(CompiledMatrix.compile(
+        roles=[(1, "admin")],
+        policies=[(10, "legacy", None, None), (11, "read_user", "USER", "READ")],
+        grants=[(1, 10), (1, 11)],
+    ))
+
+    reader = SharedMatrixReader(publisher.name)
+    try:
+        assert reader.matrix.policy_keys == ((None, None), ("USER", "READ"))
+        assert reader.matrix.is_allowed("admin", "USER", "READ")
+        assert reader.generation == publisher.generation
+    finally:
+        reader.close()
+
+
+def test_reader_exiting_leaves_segments_in_place(publisher):
+    publisher.publish(CompiledMatrix.compile([(1, "admin")], [(11, "read_user", "USER", "READ")], [(1, 11)]))
+    script = (
+        "from app.authz.shared import SharedMatrixReader\n"
+        f"reader = SharedMatrixReader({publisher.name!r})\n"
+        "assert reader.matrix.is_allowed('admin', 'USER', 'READ')\n"
+    )
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert "leaked" not in result.stderr
+
+    reader = SharedMatrixReader(publisher.name)
+    try:
+        assert reader.matrix.is_allowed("admin", "USER", "READ")
+    finally:
+        reader.close()
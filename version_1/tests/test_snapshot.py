@@ -0,0 +1,40 @@
+import time
+
+import pytest
+
+from app.authz.engine import CompiledMatrix
+from app.authz.snapshot import dump_matrix, load_snapshot, parse_snapshot, write_snapshot
+from app.core.config import Settings
+
+
+def make_matrix() -> CompiledMatrix:
+    return CompiledMatrix.compile(
+        roles=[(1, "admin"), (2, "guest")],
+        policies=[(10, "legacy", None, None), (11, "read_user", "USER", "READ"), (12, "no_action", "USER", None)],
+        grants=[(1, 10), (1, 11), (2, 12)],
+    )
+
+
+def test_round_trip_keeps_null_category_and_action():
+    data = dump_matrix(make_matrix())
+    matrix = parse_snapshot(data, len(data), "test").matrix
+
+    assert matrix.policy_keys == ((None, None), ("USER", "READ"), ("USER", None))
+    assert matrix.policy_names == ("legacy", "read_user", "no_action")
+    assert matrix.is_allowed("admin", "USER", "READ")
+    assert matrix.is_allowed("guest", "USER", None)
+    assert not matrix.is_allowed("guest", "USER", "READ")
+
+
+def test_stale_snapshot_rejected(tmp_path, monkeypatch):
+    path = str(tmp_path / "matrix.snap")
+    write_snapshot(make_matrix(), path)
+    monkeypatch.setattr(time, "time", lambda: 10**10)
+
+    with pytest.raises(ValueError, match="stale"):
+        load_snapshot(path, max_age=60)
+
+
+def test_snapshot_max_age_is_finite_by_default(monkeypatch):
+    monkeypatch.delenv("AUTHZ_SNAPSHOT_MAX_AGE", raising=False)
+    assert Settings().AUTHZ_SNAPSHOT_MAX_AGE > 0